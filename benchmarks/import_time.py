@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+Indulási idő mérése: a megoldó modulok importálásának ideje és a nehéz,
+csak ábrázoláshoz/riporthoz szükséges csomagok (matplotlib, pandas) távolmaradása.
+
+Minden modult friss értelmezőben, `python -X importtime` alatt importálunk, és
+a modul kumulatív importidejét vesszük (az ismétlések minimumát). A szkript
+nem nulla kilépési kóddal jelzi, ha egy modul túllépi az időkeretet, vagy
+betölt egy tiltott csomagot.
+
+Használat:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --budget_ms 200 --repeats 10
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+# A mért modulok: a parancssori belépési pont, a megoldó mag és a kiértékelés
+MODULES = ['main', 'genetic_algorithm', 'strategies', 'island_ga', 'point_io', 'evaluation']
+
+# Ezek a csomagok csak ábra vagy riport készítésekor töltődhetnek be
+FORBIDDEN_MODULES = ['matplotlib', 'pandas']
+
+# Alapértelmezett időkeret modulonként (ms); a NumPy importja ebben benne van
+DEFAULT_BUDGET_MS = 300
+
+
+def measure_import(module):
+    """
+    Egy modul importálása friss értelmezőben.
+
+    Returns:
+        tuple: (kumulatív importidő ms-ban, a betöltött tiltott csomagok listája)
+    """
+    check = (f"import sys, {module}; "
+             f"print(','.join(m for m in {FORBIDDEN_MODULES!r} if m in sys.modules))")
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', check], cwd=SRC_DIR,
+                            capture_output=True, text=True, check=True)
+
+    cumulative_us = None
+    for line in result.stderr.splitlines():
+        # Formátum: "import time: self [us] | cumulative | imported package"
+        if not line.startswith('import time:'):
+            continue
+        fields = [field.strip() for field in line[len('import time:'):].split('|')]
+        if fields[2] == module:
+            cumulative_us = int(fields[1])
+    if cumulative_us is None:
+        raise RuntimeError(f"A {module} modul importideje nem található a kimenetben")
+
+    loaded = [name for name in result.stdout.strip().split(',') if name]
+    return cumulative_us / 1000, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description="A modulok importidejének és függőségeinek ellenőrzése.")
+    parser.add_argument('--budget_ms', type=float, default=DEFAULT_BUDGET_MS, help="Időkeret modulonként (ms).")
+    parser.add_argument('--repeats', type=int, default=5, help="Ismétlések száma modulonként (a minimumot vesszük).")
+    parser.add_argument('--modules', nargs='+', default=MODULES, help="A mért modulok.")
+    args = parser.parse_args()
+
+    failures = []
+    print(f"{'Modul':<20} {'Importidő (ms)':>15}  Tiltott csomagok")
+    for module in args.modules:
+        measurements = [measure_import(module) for _ in range(args.repeats)]
+        best_ms = min(ms for ms, _ in measurements)
+        loaded = measurements[0][1]
+        print(f"{module:<20} {best_ms:>15.1f}  {', '.join(loaded) or '-'}")
+        if best_ms > args.budget_ms:
+            failures.append(f"{module}: {best_ms:.1f} ms > {args.budget_ms:g} ms")
+        if loaded:
+            failures.append(f"{module}: betölti a következőket: {', '.join(loaded)}")
+
+    if failures:
+        print("\nSIKERTELEN:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print(f"\nMinden modul az időkereten ({args.budget_ms:g} ms) belül, tiltott csomag nélkül indul.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+"""
+Teljesítménymérések a megoldó kritikus útvonalaira, gépenként címkézett JSON
+alapértékekkel és regresszió-ellenőrzéssel.
+
+Mért esetek:
+- fitness/*:   `population_fitness` áteresztőképessége (egyed x pont párok / s), a
+               `CircleGA` alapértelmezett memóriakeretével, ahogy a GA is hívja
+- fitness-untiled/*: ugyanez memóriakeret nélkül (egyetlen blokkban), csak kisebb méreteken
+- ga/*:        teljes `CircleGA.run` különböző (N, populáció, generációk) méreteken
+- generator/*: `generate_point_cloud` áteresztőképessége (pont / s)
+- main/*:      a `main.py` végponttól végpontig tartó futási ideje (új folyamatban)
+
+Minden eset a `benchmarking.benchmark` keretével fut: bemelegítés, több
+memóriakövetés nélküli `perf_counter` mérés, medián a kiugró értékek elhagyásával.
+
+Használat:
+    python benchmarks/run_benchmarks.py run                      # -> benchmarks/baselines/<gép>.json
+    python benchmarks/run_benchmarks.py run --output uj.json --filter ga/
+    python benchmarks/run_benchmarks.py compare benchmarks/baselines/<gép>.json uj.json --threshold 0.1
+
+A `compare` nem nulla kilépési kóddal jelzi, ha valamelyik eset mediánja a
+küszöbnél (alapértelmezésben 10%) többel lassabb az alapértéknél.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+
+import numpy as np
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(ROOT_DIR, 'src')
+BASELINE_DIR = os.path.join(ROOT_DIR, 'benchmarks', 'baselines')
+sys.path.insert(0, SRC_DIR)
+
+from benchmarking import benchmark
+from fitness import FitnessOptions, population_fitness
+from genetic_algorithm import CircleGA
+from point_generator import generate_point_cloud
+
+# A fitnesz kernel mérete: (pontok, egyedek)
+FITNESS_SIZES = [(10_000, 100), (100_000, 100), (1_000_000, 100)]
+# A memóriakeret nélküli fitnesz mérete: az átmeneti tömbök a pontszámmal nőnek,
+# 1 000 000 pontnál már kb. 1,7 GB-ot foglalnának
+UNTILED_FITNESS_SIZES = [(10_000, 100), (100_000, 100)]
+# A fitnesz mérés memóriakerete (MB): ugyanaz, amivel a CircleGA alapértelmezésben számol
+FITNESS_MEMORY_BUDGET_MB = FitnessOptions().memory_budget_mb
+# A teljes GA futás mérete: (pontok, populáció, generációk)
+GA_SIZES = [(200, 100, 100), (5_000, 100, 100), (50_000, 200, 50)]
+# A pontgenerátor mérete (pontok)
+GENERATOR_SIZES = [100_000, 1_000_000]
+# A main.py parancssori argumentumai a végponttól végpontig tartó méréshez
+MAIN_ARGS = ['--no_visualization', '--progress_interval', '0', '--points', '150', '--generations', '100']
+
+# Alapértelmezett regressziós küszöb (relatív lassulás)
+DEFAULT_THRESHOLD = 0.10
+
+
+def machine_info():
+    """A mérési környezet leírása: gép, processzor, Python és NumPy verzió."""
+    return {
+        "node": platform.node(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "system": f"{platform.system()} {platform.release()}",
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "numpy": np.__version__
+    }
+
+
+def machine_tag(info):
+    """Fájlnévként használható gépcímke (gépnév és architektúra)."""
+    return re.sub(r'[^A-Za-z0-9_.-]+', '-', f"{info['node']}-{info['machine']}").strip('-') or 'unknown'
+
+
+def _seeded(seed):
+    """Setup függvény, amely minden futás előtt visszaállítja a véletlenszám-generátort."""
+    return lambda: np.random.seed(seed)
+
+
+def _record(measurement, work=None, unit=None):
+    """Egy mérés JSON-ba írható összefoglalója, opcionális áteresztőképességgel."""
+    record = {
+        "runtime": measurement["runtime"],
+        "runtime_iqr": measurement["runtime_iqr"],
+        "times": measurement["times"],
+        "n_outliers": measurement["n_outliers"]
+    }
+    if work is not None:
+        record["throughput"] = work / measurement["runtime"]
+        record["unit"] = unit
+    return record
+
+
+def fitness_case(n_points, n_individuals, repeats, memory_budget_mb=FITNESS_MEMORY_BUDGET_MB):
+    """A fitnesz kernel áteresztőképessége (memory_budget_mb=None: egyetlen blokkban)."""
+    rng = np.random.default_rng(0)
+    points = rng.normal(0, 100, (n_points, 2))
+    population = np.column_stack([rng.normal(0, 10, (n_individuals, 2)), rng.uniform(50, 200, n_individuals)])
+    measurement = benchmark(lambda: population_fitness(population, points, memory_budget_mb), repeats=repeats,
+                            warmup=1, measure_memory=False)
+    return _record(measurement, n_points * n_individuals, "pár/s")
+
+
+def ga_case(n_points, population_size, generations, repeats):
+    """A teljes CircleGA futás."""
+    np.random.seed(0)
+    points = generate_point_cloud(num_points=n_points)
+    measurement = benchmark(lambda: CircleGA(points, population_size=population_size, generations=generations).run(),
+                            repeats=repeats, warmup=1, setup=_seeded(1), measure_memory=False)
+    return _record(measurement, generations, "generáció/s")
+
+
+def generator_case(n_points, repeats):
+    """A pontgenerátor áteresztőképessége."""
+    measurement = benchmark(lambda: generate_point_cloud(num_points=n_points), repeats=repeats, warmup=1,
+                            setup=_seeded(0), measure_memory=False)
+    return _record(measurement, n_points, "pont/s")
+
+
+def main_case(repeats):
+    """A main.py futási ideje új folyamatban (importok, generálás, GA, kiírás)."""
+    command = [sys.executable, os.path.join(SRC_DIR, 'main.py')] + MAIN_ARGS
+    measurement = benchmark(lambda: subprocess.run(command, check=True, capture_output=True),
+                            repeats=repeats, warmup=1, measure_memory=False)
+    return _record(measurement)
+
+
+def benchmark_cases():
+    """Az esetek neve és mérőfüggvénye (a függvény az ismétlések számát kapja)."""
+    cases = []
+    for n_points, n_individuals in FITNESS_SIZES:
+        cases.append((f"fitness/N={n_points},P={n_individuals}",
+                      lambda repeats, n=n_points, p=n_individuals: fitness_case(n, p, repeats)))
+    for n_points, n_individuals in UNTILED_FITNESS_SIZES:
+        cases.append((f"fitness-untiled/N={n_points},P={n_individuals}",
+                      lambda repeats, n=n_points, p=n_individuals: fitness_case(n, p, repeats, None)))
+    for n_points, population_size, generations in GA_SIZES:
+        cases.append((f"ga/N={n_points},P={population_size},G={generations}",
+                      lambda repeats, n=n_points, p=population_size, g=generations: ga_case(n, p, g, repeats)))
+    for n_points in GENERATOR_SIZES:
+        cases.append((f"generator/N={n_points}", lambda repeats, n=n_points: generator_case(n, repeats)))
+    cases.append(("main/" + " ".join(MAIN_ARGS[3:]), main_case))
+    return cases
+
+
+def run_suite(repeats, name_filter=None):
+    """Az összes (vagy a szűrőre illeszkedő) eset lefuttatása."""
+    results = {}
+    for name, case in benchmark_cases():
+        if name_filter and name_filter not in name:
+            continue
+        record = case(repeats)
+        results[name] = record
+        throughput = f", {record['throughput']:.3g} {record['unit']}" if "throughput" in record else ""
+        print(f"  {name:<40} {record['runtime'] * 1000:10.2f} ms (IQR {record['runtime_iqr'] * 1000:.2f}){throughput}")
+    return results
+
+
+def compare(baseline, current, threshold):
+    """
+    Két mérés összevetése esetenként (a medián futási idők aránya).
+
+    Returns:
+        list: A küszöbnél nagyobb lassulást mutató esetek nevei.
+    """
+    if baseline["machine"] != current["machine"]:
+        print("Figyelem: a két mérés eltérő környezetből származik, az összevetés csak tájékoztató jellegű.")
+
+    regressions = []
+    print(f"{'Eset':<40} {'Alap (ms)':>10} {'Új (ms)':>10} {'Arány':>7}")
+    for name in sorted(set(baseline["benchmarks"]) | set(current["benchmarks"])):
+        if name not in baseline["benchmarks"] or name not in current["benchmarks"]:
+            print(f"{name:<40} csak az egyik mérésben szerepel")
+            continue
+        old = baseline["benchmarks"][name]["runtime"]
+        new = current["benchmarks"][name]["runtime"]
+        ratio = new / old
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  REGRESSZIÓ"
+            regressions.append(name)
+        elif ratio < 1 - threshold:
+            flag = "  gyorsulás"
+        print(f"{name:<40} {old * 1000:10.2f} {new * 1000:10.2f} {ratio:7.2f}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Teljesítménymérések és regresszió-ellenőrzés.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help="A mérések futtatása és mentése JSON-ba.")
+    run_parser.add_argument('--repeats', type=int, default=5, help="Mért futások száma esetenként.")
+    run_parser.add_argument('--filter', type=str, default=None, help="Csak az ezt tartalmazó nevű esetek.")
+    run_parser.add_argument('--output', type=str, default=None,
+                            help="A kimeneti JSON (alapértelmezés: benchmarks/baselines/<gépcímke>.json).")
+
+    compare_parser = subparsers.add_parser('compare', help="Két mérés összevetése.")
+    compare_parser.add_argument('baseline', help="Az alapérték JSON fájl.")
+    compare_parser.add_argument('current', help="Az új mérés JSON fájlja.")
+    compare_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                                help="A regressziónak számító relatív lassulás (0.1 = 10%%).")
+
+    args = parser.parse_args()
+
+    if args.command == 'run':
+        info = machine_info()
+        print(f"Mérés: {machine_tag(info)} ({args.repeats} ismétlés esetenként)")
+        report = {
+            "machine": info,
+            "created": datetime.datetime.now().isoformat(timespec='seconds'),
+            "repeats": args.repeats,
+            "benchmarks": run_suite(args.repeats, args.filter)
+        }
+        output = args.output or os.path.join(BASELINE_DIR, machine_tag(info) + '.json')
+        os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+        with open(output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Eredmények mentve: {output}")
+    else:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        with open(args.current) as f:
+            current = json.load(f)
+        regressions = compare(baseline, current, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} eset lassult {args.threshold:.0%}-nál többel: {', '.join(regressions)}")
+            sys.exit(1)
+        print(f"\nNincs {args.threshold:.0%}-nál nagyobb lassulás.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from fitness import batch_population_fitness
+from genetic_algorithm import crossover, mutate
+
+
+def stack_point_clouds(clouds, offsets=None, counts=None):
+    """
+    Több ponthalmazt egységes, kitöltött (B, N_max, 2) alakú tömbbe rendez.
+
+    Elfogadott bemenetek:
+    - ponthalmazok listája (eltérő méretűek is lehetnek),
+    - (B, N, 2) alakú tömb; a `counts` megadja a ponthalmazonkénti valódi
+      pontszámot, ennek hiányában a NaN-t tartalmazó sorok kitöltésnek számítanak,
+    - (M, 2) alakú összefűzött tömb az `offsets` kezdőindexekkel (B vagy B+1 elem).
+
+    Returns:
+        tuple: (points, valid) ahol `points` (B, N_max, 2) alakú, `valid` pedig
+               (B, N_max) alakú bool maszk a valódi pontokról. A kitöltő sorok a
+               ponthalmaz első pontjának másolatai, így a tartományokat nem torzítják.
+    """
+    if offsets is not None:
+        flat = np.asarray(clouds, dtype=float)
+        bounds = list(offsets) + ([len(flat)] if offsets[-1] != len(flat) else [])
+        clouds = [flat[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+
+    if isinstance(clouds, np.ndarray) and clouds.ndim == 3:
+        points = np.array(clouds, dtype=float)
+        if counts is not None:
+            valid = np.arange(points.shape[1]) < np.asarray(counts)[:, None]
+        else:
+            valid = ~np.isnan(points).any(axis=-1)
+    else:
+        clouds = [np.asarray(cloud, dtype=float) for cloud in clouds]
+        max_points = max(len(cloud) for cloud in clouds)
+        points = np.zeros((len(clouds), max_points, 2))
+        valid = np.zeros((len(clouds), max_points), dtype=bool)
+        for i, cloud in enumerate(clouds):
+            points[i, :len(cloud)] = cloud
+            valid[i, :len(cloud)] = True
+
+    if not valid.any(axis=1).all():
+        raise ValueError("Minden ponthalmaznak legalább egy pontot kell tartalmaznia.")
+
+    # A kitöltő sorokat a ponthalmaz első valódi pontjával töltjük fel
+    first_valid = np.argmax(valid, axis=1)
+    filler = points[np.arange(len(points)), first_valid]
+    points = np.where(valid[..., None], points, filler[:, None, :])
+    return points, valid
+
+
+class BatchCircleGA:
+    """
+    Sok független ponthalmaz legkisebb befoglaló körének keresése egyetlen hívással.
+
+    Minden ponthalmazhoz saját populáció tartozik, ezek (B, P, 3) alakú tömbként
+    egyszerre, lépésről lépésre fejlődnek. A szelekció, keresztezés és mutáció
+    ugyanazt a logikát követi, mint a `CircleGA`, csak ponthalmazonként.
+    """
+    def __init__(self, clouds, population_size=100, mutation_rate=0.1, crossover_rate=0.8, generations=200,
+                 memory_budget_mb=1, offsets=None, counts=None):
+        self.points, self.valid = stack_point_clouds(clouds, offsets=offsets, counts=counts)
+        self.n_clouds = len(self.points)
+        self.population_size = population_size
+        self.mutation_rate = mutation_rate
+        self.crossover_rate = crossover_rate
+        self.generations = generations
+        self.memory_budget_mb = memory_budget_mb
+
+        # Ponthalmazonkénti határok (B, 1, 3) alakban, a CircleGA-val azonos módon
+        min_coords = self.points.min(axis=1)
+        max_coords = self.points.max(axis=1)
+        max_dim = (max_coords - min_coords).max(axis=1)
+        self.lower = np.column_stack((min_coords, max_dim / 10))[:, None, :]
+        self.upper = np.column_stack((max_coords, max_dim))[:, None, :]
+        self.sigmas = (self.upper - self.lower) * 0.05
+
+        self.population = self._initialize_population()
+        self.fitness_history = None
+
+    def _initialize_population(self):
+        """Ponthalmazonként véletlenszerű körökből álló kezdeti populációk."""
+        u = np.random.rand(self.n_clouds, self.population_size, 3)
+        return self.lower + u * (self.upper - self.lower)
+
+    def _calculate_fitness(self):
+        """Az összes populáció fitnesze (B, P) alakban."""
+        return batch_population_fitness(self.population, self.points, self.valid, self.memory_budget_mb)
+
+    def _select(self, fitness_scores):
+        """
+        Rulettkerekes szelekció ponthalmazonként, a `CircleGA._select`-tel azonos
+        valószínűségekkel. A sorok kumulatív eloszlásait eltolva egyetlen
+        rendezett tömbbe fűzzük, így egy keresés elég az összes populációhoz.
+        """
+        inverted_fitness = 1 / (fitness_scores + 1e-6)
+        cumulative = np.cumsum(inverted_fitness, axis=1)
+        cumulative /= cumulative[:, -1:]
+
+        rows = np.arange(self.n_clouds)[:, None]
+        draws = np.random.rand(self.n_clouds, self.population_size) + rows
+        flat_idx = np.searchsorted((cumulative + rows).ravel(), draws.ravel(), side='right')
+        selected = np.minimum(flat_idx.reshape(draws.shape) - rows * self.population_size,
+                              self.population_size - 1)
+        return np.take_along_axis(self.population, selected[..., None], axis=1)
+
+    def run(self):
+        """
+        Futtatja az összes genetikus algoritmust a megadott generációszámig.
+
+        Returns:
+            tuple: (best_circles, fitness_history), ahol `best_circles` (B, 3) alakú
+                   (cx, cy, r) tömb, `fitness_history` pedig (G, B) alakú tömb a
+                   generációnkénti legjobb fitneszekkel.
+        """
+        clouds = np.arange(self.n_clouds)
+        best_fitness = np.full(self.n_clouds, np.inf)
+        best_circles = np.zeros((self.n_clouds, 3))
+        history = []
+
+        for generation in range(self.generations):
+            fitness_scores = self._calculate_fitness()
+
+            best_idx = np.argmin(fitness_scores, axis=1)
+            generation_best = fitness_scores[clouds, best_idx]
+            improved = generation_best < best_fitness
+            best_fitness[improved] = generation_best[improved]
+            best_circles[improved] = self.population[clouds[improved], best_idx[improved]]
+            history.append(best_fitness.copy())
+
+            parents = self._select(fitness_scores)
+            offspring = crossover(parents, self.crossover_rate)
+            self.population = mutate(offspring, self.mutation_rate, self.sigmas, self.lower, self.upper)
+
+        self.fitness_history = np.array(history)
+        return best_circles, self.fitness_history
+
+
+def fit_circles(clouds, offsets=None, counts=None, **ga_params):
+    """
+    Kényelmi függvény: legkisebb befoglaló kör minden ponthalmazra.
+
+    Returns:
+        np.ndarray: (B, 3) alakú tömb, ponthalmazonként a legjobb (cx, cy, r).
+    """
+    best_circles, _ = BatchCircleGA(clouds, offsets=offsets, counts=counts, **ga_params).run()
+    return best_circles
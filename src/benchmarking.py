@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+import sys
+import time
+import tracemalloc
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # Windows alatt nincs resource modul
+    resource = None
+
+# A kiugró mérések elhagyásának küszöbe (Tukey-kerítés): [Q1 - k*IQR, Q3 + k*IQR]
+OUTLIER_WHISKER = 1.5
+
+
+def robust_summary(values, whisker=OUTLIER_WHISKER):
+    """
+    Mérési sorozat robusztus összefoglalója.
+
+    A Tukey-kerítésen ([Q1 - whisker*IQR, Q3 + whisker*IQR]) kívül eső értékeket
+    kiugrónak tekintjük és elhagyjuk, a statisztikákat a maradékon számoljuk.
+
+    Args:
+        values (array-like): A mért értékek.
+        whisker (float): A kerítés szélessége IQR egységben (None = nincs elhagyás).
+
+    Returns:
+        dict: median, q1, q3, iqr, mean, std, min, max, n (megtartott), n_outliers.
+    """
+    values = np.asarray(values, dtype=float)
+    if len(values) == 0:
+        return {"median": np.nan, "q1": np.nan, "q3": np.nan, "iqr": np.nan, "mean": np.nan,
+                "std": np.nan, "min": np.nan, "max": np.nan, "n": 0, "n_outliers": 0}
+    kept = values
+    if whisker is not None and len(values) >= 4:
+        q1, q3 = np.percentile(values, [25, 75])
+        iqr = q3 - q1
+        kept = values[(values >= q1 - whisker * iqr) & (values <= q3 + whisker * iqr)]
+    q1, median, q3 = np.percentile(kept, [25, 50, 75])
+    return {
+        "median": median,
+        "q1": q1,
+        "q3": q3,
+        "iqr": q3 - q1,
+        "mean": kept.mean(),
+        "std": kept.std(),
+        "min": kept.min(),
+        "max": kept.max(),
+        "n": len(kept),
+        "n_outliers": len(values) - len(kept)
+    }
+
+
+def peak_rss_mb():
+    """
+    A folyamat eddigi legnagyobb rezidens memóriája (MB), vagy None, ha a
+    platformon nem mérhető. Az érték a folyamat teljes élettartamára vonatkozik,
+    így egy futás csúcsát csak friss munkafolyamatban méri pontosan.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linuxon KB-ban, macOS-en bájtban
+    if sys.platform == 'darwin':
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def benchmark(fn, repeats=5, warmup=1, setup=None, measure_memory=True, whisker=OUTLIER_WHISKER):
+    """
+    Egy függvény futási idejének és memóriaigényének mérése.
+
+    A mérés menete:
+    1. `warmup` bemelegítő futás (gyorsítótárak, lapozás, lusta importok), ezeket nem mérjük;
+    2. `repeats` időmérés `time.perf_counter`-rel, memóriakövetés nélkül;
+    3. ha `measure_memory`, egy külön futás `tracemalloc`-kal a Python
+       allokációk csúcsához (ennek idejét nem használjuk, mert a követés lassít).
+    Minden futás előtt meghívjuk a `setup`-ot (például a véletlenszám-generátor
+    visszaállítására, hogy minden futás ugyanazt a munkát végezze).
+
+    Args:
+        fn (callable): A mért függvény (argumentum nélkül).
+        repeats (int): Az időmérések száma.
+        warmup (int): A bemelegítő futások száma.
+        setup (callable, optional): Minden futás előtt meghívott függvény.
+        measure_memory (bool): Legyen-e külön memóriamérés.
+        whisker (float): A kiugró idők elhagyásának küszöbe (lásd `robust_summary`).
+
+    Returns:
+        dict: times (s, listában), runtime (medián), runtime_q1, runtime_q3,
+              runtime_iqr, n_outliers, peak_memory_mb (tracemalloc; None, ha nem
+              mértük), peak_rss_mb, result (az első mért futás visszatérési értéke).
+    """
+    for _ in range(warmup):
+        if setup is not None:
+            setup()
+        fn()
+
+    times = []
+    result = None
+    for i in range(repeats):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        value = fn()
+        times.append(time.perf_counter() - start)
+        if i == 0:
+            result = value
+
+    peak_memory_mb = None
+    if measure_memory:
+        if setup is not None:
+            setup()
+        tracemalloc.start()
+        try:
+            fn()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        peak_memory_mb = peak / (1024 * 1024)
+
+    summary = robust_summary(times, whisker)
+    return {
+        "times": times,
+        "runtime": summary["median"],
+        "runtime_q1": summary["q1"],
+        "runtime_q3": summary["q3"],
+        "runtime_iqr": summary["iqr"],
+        "n_outliers": summary["n_outliers"],
+        "peak_memory_mb": peak_memory_mb,
+        "peak_rss_mb": peak_rss_mb(),
+        "result": result
+    }
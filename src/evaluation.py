@@ -1,50 +1,202 @@
 # -*- coding: utf-8 -*-
 import time
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.patches import Circle
 import argparse
-import tracemalloc
-import pandas as pd
 import os
+import zlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from point_generator import generate_point_cloud
-from genetic_algorithm import CircleGA, visualize_solution
+from genetic_algorithm import CircleGA
+from exact_solver import welzl_circle
+from selection import SELECTION_METHODS
+from local_search import LOCAL_SEARCH_METHODS
+from strategies import make_strategy
+from online import OnlineCircleFitter
+from telemetry import PHASES
+from benchmarking import benchmark, robust_summary
+from fitness import PARALLEL_MIN_PAIRS, measure_parallel_threshold, resolve_threads, population_fitness
 
 # Konfiguráció a mentéshez
 RESULTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'docs', 'documentation', 'images')
 CSV_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'docs', 'documentation', 'data')
 
-if not os.path.exists(RESULTS_DIR):
-    os.makedirs(RESULTS_DIR)
-if not os.path.exists(CSV_DIR):
-    os.makedirs(CSV_DIR)
 
-def measure_single_run(points, ga_params):
+def results_path(filename):
+    """Egy grafikon útvonala a `RESULTS_DIR` mappában; a mappát szükség esetén létrehozza."""
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    return os.path.join(RESULTS_DIR, filename)
+
+
+def csv_path(filename):
+    """Egy CSV fájl útvonala a `CSV_DIR` mappában; a mappát szükség esetén létrehozza."""
+    os.makedirs(CSV_DIR, exist_ok=True)
+    return os.path.join(CSV_DIR, filename)
+
+
+# Párhuzamos végrehajtás: a munkafolyamatok száma és az alap seed (a main() állítja be)
+WORKERS = 1
+BASE_SEED = 2025
+
+
+def measure_single_run(points, ga_params, engine='ga', seed=None, repeats=1, warmup=0, measure_memory=True):
     """
-    Egyetlen futtatás mérése: idő, memória, eredmény.
+    Egy konfiguráció mérése: idő, memória, eredmény (lásd `benchmarking.benchmark`).
+
+    Az időt `warmup` bemelegítő futás után `repeats` memóriakövetés nélküli
+    futásból mérjük (`perf_counter`, medián a kiugró értékek elhagyásával), a
+    memóriacsúcsot egy külön, `tracemalloc`-kal követett futásból. Minden futás
+    előtt a véletlenszám-generátort `seed`-re állítjuk, így a futások ugyanazt
+    a munkát végzik. Az `engine` a `strategies.STRATEGIES` egyik motorja
+    (alapértelmezésben a GA).
+
+    Returns:
+        dict: runtime (medián, s), runtime_iqr, runtimes, memory_mb (None, ha nem
+              mértük), rss_mb (a folyamat memóriacsúcsa), radius, history.
     """
-    tracemalloc.start()
-    start_time = time.time()
-    
-    ga = CircleGA(points, **ga_params)
-    best_circle, history = ga.run()
-    
-    end_time = time.time()
-    current, peak = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
-    
-    runtime = end_time - start_time
-    peak_memory_mb = peak / (1024 * 1024)
-    final_radius = best_circle[2]
-    
-    return runtime, peak_memory_mb, final_radius, history
+    def setup():
+        if seed is not None:
+            np.random.seed(seed)
+
+    def run():
+        return make_strategy(engine, points, **ga_params).run()
+
+    measurement = benchmark(run, repeats=repeats, warmup=warmup, setup=setup, measure_memory=measure_memory)
+    best_circle, history = measurement["result"]
+    return {
+        "runtime": measurement["runtime"],
+        "runtime_iqr": measurement["runtime_iqr"],
+        "runtimes": measurement["times"],
+        "memory_mb": measurement["peak_memory_mb"],
+        "rss_mb": measurement["peak_rss_mb"],
+        "radius": best_circle[2],
+        "history": history
+    }
+
+
+def cell_seed(test_name, *key):
+    """
+    Determinisztikus seed egy kísérleti cellához (teszt, konfiguráció, ismétlés).
+    A seed csak a cellától függ, így az eredmény a munkafolyamatok számától független.
+    """
+    entropy = [BASE_SEED, zlib.crc32(test_name.encode())] + [int(k) for k in key]
+    return int(np.random.SeedSequence(entropy).generate_state(1)[0])
+
+
+def make_task(ga_params, seed, points=None, point_params=None, point_seed=None, exact=False, engine='ga',
+              target_pct=None, timing_repeats=1, warmup=0, measure_memory=False):
+    """
+    Egy kísérleti cella leírása a `run_cells` számára.
+
+    Args:
+        ga_params (dict): A CircleGA paraméterei.
+        seed (int): A GA futtatás seedje.
+        points (np.ndarray, optional): Kész ponthalmaz.
+        point_params (dict, optional): A `generate_point_cloud` paraméterei, ha a
+                                       ponthalmazt a cellában kell generálni.
+        point_seed (int, optional): A ponthalmaz generálásának seedje.
+        exact (bool): Számolja-e az egzakt (Welzl) sugarat is referenciának.
+        engine (str): Az optimalizáló motor neve (lásd `strategies.STRATEGIES`).
+        target_pct (float, optional): Ha meg van adva (és `exact`), a futás leáll,
+                                      amint az optimum ennyi százalékán belülre jut.
+        timing_repeats (int): Az időmérések száma a cellán belül (lásd `measure_single_run`).
+        warmup (int): A nem mért bemelegítő futások száma.
+        measure_memory (bool): Legyen-e külön, `tracemalloc`-kal követett memóriamérés.
+    """
+    return {
+        "ga_params": ga_params,
+        "seed": seed,
+        "points": points,
+        "point_params": point_params,
+        "point_seed": point_seed,
+        "exact": exact,
+        "engine": engine,
+        "target_pct": target_pct,
+        "timing_repeats": timing_repeats,
+        "warmup": warmup,
+        "measure_memory": measure_memory
+    }
+
+
+def _run_cell(task):
+    """Egy kísérleti cella végrehajtása (a munkafolyamatokban is ez fut)."""
+    points = task["points"]
+    if points is None:
+        np.random.seed(task["point_seed"])
+        points = generate_point_cloud(**task["point_params"])
+
+    result = {}
+    ga_params = task["ga_params"]
+    if task["exact"]:
+        result["optimal_radius"] = welzl_circle(points)[2]
+        if task["target_pct"] is not None:
+            ga_params = dict(ga_params, target_fitness=result["optimal_radius"] * (1 + task["target_pct"] / 100))
+
+    measurement = measure_single_run(points, ga_params, task["engine"], seed=task["seed"],
+                                     repeats=task["timing_repeats"], warmup=task["warmup"],
+                                     measure_memory=task["measure_memory"])
+    history = measurement.pop("history")
+    result.update(measurement)
+    result.update({"history": list(history), "evaluations": list(getattr(history, 'evaluations', []))})
+    return result
+
+
+def run_cells(tasks):
+    """
+    Végrehajtja a kísérleti cellákat, `WORKERS` > 1 esetén folyamatkészletben.
+
+    Minden cella saját seedet kap, így az eredmények a munkafolyamatok számától
+    függetlenül reprodukálhatók. A munkafolyamatok száma nem haladja meg a
+    processzormagok számát, és a BLAS könyvtárak egy szálon futnak, hogy a mért
+    futási időket ne torzítsa a túlterhelés.
+    """
+    if WORKERS <= 1 or len(tasks) <= 1:
+        return [_run_cell(task) for task in tasks]
 
-def run_scalability_test(repeats=10):
+    for var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ.setdefault(var, "1")
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=min(WORKERS, len(tasks)), mp_context=context) as pool:
+        return list(pool.map(_run_cell, tasks))
+
+
+def robust_group_stats(df, key, column):
+    """
+    Csoportonkénti robusztus statisztika (medián, kvartilisek a kiugró értékek
+    elhagyásával, lásd `benchmarking.robust_summary`) a `key` oszlop értékei szerint.
+    Az `err_low`/`err_high` oszlopok aszimmetrikus hibasávként ábrázolhatók.
+    """
+    import pandas as pd
+
+    rows = []
+    for value, group in df.groupby(key):
+        summary = robust_summary(group[column])
+        rows.append({key: value, "median": summary["median"], "q1": summary["q1"], "q3": summary["q3"],
+                     "n_outliers": summary["n_outliers"]})
+    stats = pd.DataFrame(rows)
+    stats["err_low"] = stats["median"] - stats["q1"]
+    stats["err_high"] = stats["q3"] - stats["median"]
+    return stats
+
+
+def run_scalability_test(repeats=10, max_points=5000):
     """
     A. Skálázhatóság vizsgálata (Bemeneti méret hatása)
+
+    A `max_points` 5000 fölé emelésével a mérés dekádonként (10^4, 10^5, ...)
+    bővül egészen `max_points`-ig.
     """
+    import matplotlib.pyplot as plt
+    import pandas as pd
+
     print("\n--- A. Skálázhatóság vizsgálata (Futási idő és Memória) ---")
     point_counts = [50, 100, 500, 1000, 2000, 5000]
+    n = 10000
+    while n < max_points:
+        point_counts.append(n)
+        n *= 10
+    if max_points > point_counts[-1]:
+        point_counts.append(max_points)
     results = []
 
     ga_params = {
@@ -54,51 +206,82 @@ def run_scalability_test(repeats=10):
         "mutation_rate": 0.1
     }
 
-    for n in point_counts:
-        print(f"  Mérés {n} ponttal ({repeats} ismétlés)...")
-        for i in range(repeats):
-            points = generate_point_cloud(num_points=n)
-            runtime, memory, radius, _ = measure_single_run(points, ga_params)
-            results.append({
-                "n_points": n,
-                "run_id": i,
-                "runtime": runtime,
-                "memory_mb": memory,
-                "radius": radius
-            })
+    cells = [(n, i) for n in point_counts for i in range(repeats)]
+    print(f"  Mérés {len(point_counts)} ponthalmaz-mérettel, {repeats} ismétléssel ({len(cells)} futtatás)...")
+    # Cellánként egy bemelegítő és három mért futás, a memória külön futásban
+    tasks = [
+        make_task(ga_params, cell_seed('scalability', n, i),
+                  point_params={"num_points": n}, point_seed=cell_seed('scalability-points', n, i),
+                  timing_repeats=3, warmup=1, measure_memory=True)
+        for n, i in cells
+    ]
+    for (n, i), res in zip(cells, run_cells(tasks)):
+        results.append({
+            "n_points": n,
+            "run_id": i,
+            "runtime": res["runtime"],
+            "runtime_iqr": res["runtime_iqr"],
+            "memory_mb": res["memory_mb"],
+            "rss_mb": res["rss_mb"],
+            "radius": res["radius"]
+        })
 
     df = pd.DataFrame(results)
-    df.to_csv(os.path.join(CSV_DIR, 'scalability_results.csv'), index=False)
+    df.to_csv(csv_path('scalability_results.csv'), index=False)
 
     # Ábrázolás - Futási idő
     plt.figure(figsize=(10, 6))
-    stats = df.groupby('n_points')['runtime'].agg(['mean', 'std']).reset_index()
-    plt.errorbar(stats['n_points'], stats['mean'], yerr=stats['std'], fmt='-o', capsize=5, label='Átlagos futási idő')
+    stats = robust_group_stats(df, 'n_points', 'runtime')
+    plt.errorbar(stats['n_points'], stats['median'], yerr=[stats['err_low'], stats['err_high']], fmt='-o', capsize=5,
+                 label='Futási idő (medián, IQR)')
     plt.title("Futási idő a pontok számának függvényében")
+    if max_points > 5000:
+        plt.xscale('log')
     plt.xlabel("Pontok száma")
     plt.ylabel("Futási idő (s)")
     plt.grid(True)
     plt.legend()
-    plt.savefig(os.path.join(RESULTS_DIR, 'scalability_runtime.png'))
+    plt.savefig(results_path('scalability_runtime.png'))
     plt.close()
 
     # Ábrázolás - Memória
     plt.figure(figsize=(10, 6))
-    stats_mem = df.groupby('n_points')['memory_mb'].agg(['mean', 'std']).reset_index()
-    plt.errorbar(stats_mem['n_points'], stats_mem['mean'], yerr=stats_mem['std'], fmt='-s', color='orange', capsize=5, label='Átlagos memóriahasználat')
+    stats_mem = robust_group_stats(df, 'n_points', 'memory_mb')
+    plt.errorbar(stats_mem['n_points'], stats_mem['median'], yerr=[stats_mem['err_low'], stats_mem['err_high']],
+                 fmt='-s', color='orange', capsize=5, label='Memóriacsúcs (tracemalloc, medián, IQR)')
     plt.title("Memóriahasználat a pontok számának függvényében")
+    if max_points > 5000:
+        plt.xscale('log')
     plt.xlabel("Pontok száma")
     plt.ylabel("Memória (MB)")
     plt.grid(True)
     plt.legend()
-    plt.savefig(os.path.join(RESULTS_DIR, 'scalability_memory.png'))
+    plt.savefig(results_path('scalability_memory.png'))
     plt.close()
+
+    # A szálas fitnesz számítás megtérülési küszöbe (a főfolyamatban, párhuzamos cellák nélkül mérve;
+    # egymagos gépen is legalább két szállal, hogy a szálkezelés költsége látszódjon)
+    n_threads = max(2, resolve_threads(0))
+    threshold, measurements = measure_parallel_threshold(n_threads)
+    df_threads = pd.DataFrame(measurements, columns=['n_points', 'pairs', 'serial_time', 'threaded_time'])
+    df_threads['n_threads'] = n_threads
+    df_threads['measured_threshold_pairs'] = threshold
+    df_threads['configured_threshold_pairs'] = PARALLEL_MIN_PAIRS
+    df_threads.to_csv(csv_path('parallel_threshold.csv'), index=False)
+    if threshold is None:
+        print(f"  Szálas fitnesz ({n_threads} szál): egyik mért méretnél sem gyorsabb a sorosnál.")
+    else:
+        print(f"  Szálas fitnesz ({n_threads} szál): {threshold} (egyed x pont) pártól gyorsabb "
+              f"(beállított küszöb: {PARALLEL_MIN_PAIRS}).")
     print("  Kész. Eredmények mentve.")
 
 def run_mutation_test(repeats=10):
     """
     B1. Mutációs ráta hatása
     """
+    import matplotlib.pyplot as plt
+    import pandas as pd
+
     print("\n--- B. Mutációs ráta érzékenységvizsgálata ---")
     mutation_rates = [0.01, 0.05, 0.1, 0.2, 0.4, 0.6]
     results = []
@@ -109,22 +292,23 @@ def run_mutation_test(repeats=10):
         "crossover_rate": 0.8
     }
 
-    for i in range(repeats):
-        print(f"  Ismétlés {i+1}/{repeats}...")
-        points = generate_point_cloud(num_points=200) # Közepes méret
-        
-        for rate in mutation_rates:
-            params = base_params.copy()
-            params['mutation_rate'] = rate
-            runtime, memory, radius, _ = measure_single_run(points, params)
-            results.append({
-                "mutation_rate": rate,
-                "run_id": i,
-                "radius": radius
-            })
+    # Ismétlésenként egy közös ponthalmaz minden mutációs rátához
+    cells = [(i, j, rate) for i in range(repeats) for j, rate in enumerate(mutation_rates)]
+    print(f"  {repeats} ismétlés, {len(mutation_rates)} mutációs ráta ({len(cells)} futtatás)...")
+    tasks = [
+        make_task(dict(base_params, mutation_rate=rate), cell_seed('mutation', i, j),
+                  point_params={"num_points": 200}, point_seed=cell_seed('mutation-points', i)) # Közepes méret
+        for i, j, rate in cells
+    ]
+    for (i, j, rate), res in zip(cells, run_cells(tasks)):
+        results.append({
+            "mutation_rate": rate,
+            "run_id": i,
+            "radius": res["radius"]
+        })
 
     df = pd.DataFrame(results)
-    df.to_csv(os.path.join(CSV_DIR, 'mutation_results.csv'), index=False)
+    df.to_csv(csv_path('mutation_results.csv'), index=False)
 
     # Ábrázolás
     plt.figure(figsize=(10, 6))
@@ -134,7 +318,7 @@ def run_mutation_test(repeats=10):
     plt.xlabel("Mutációs ráta")
     plt.ylabel("Kör sugara (kisebb = jobb)")
     plt.grid(True, axis='y')
-    plt.savefig(os.path.join(RESULTS_DIR, 'sensitivity_mutation.png'))
+    plt.savefig(results_path('sensitivity_mutation.png'))
     plt.close()
     print("  Kész. Eredmények mentve.")
 
@@ -142,6 +326,9 @@ def run_robustness_test(repeats=10):
     """
     C. Robusztusság vizsgálata (Outlierek)
     """
+    import matplotlib.pyplot as plt
+    import pandas as pd
+
     print("\n--- C. Robusztusság vizsgálata (Outlierek hatása) ---")
     outlier_counts = [0, 5, 10, 20, 50] # 200 pont mellett ez 0%, 2.5%, 5%, 10%, 25%
     results = []
@@ -155,20 +342,24 @@ def run_robustness_test(repeats=10):
     
     n_points = 200
 
-    for n_out in outlier_counts:
-        print(f"  Mérés {n_out} outlierrel ({repeats} ismétlés)...")
-        for i in range(repeats):
-            # Fontos: az outlierek a generálásnál kerülnek bele
-            points = generate_point_cloud(num_points=n_points, num_outliers=n_out)
-            runtime, memory, radius, _ = measure_single_run(points, base_params)
-            results.append({
-                "n_outliers": n_out,
-                "run_id": i,
-                "radius": radius
-            })
+    cells = [(n_out, i) for n_out in outlier_counts for i in range(repeats)]
+    print(f"  Mérés {len(outlier_counts)} outlierszámmal, {repeats} ismétléssel ({len(cells)} futtatás)...")
+    # Fontos: az outlierek a generálásnál kerülnek bele
+    tasks = [
+        make_task(base_params, cell_seed('robustness', n_out, i),
+                  point_params={"num_points": n_points, "num_outliers": n_out},
+                  point_seed=cell_seed('robustness-points', n_out, i))
+        for n_out, i in cells
+    ]
+    for (n_out, i), res in zip(cells, run_cells(tasks)):
+        results.append({
+            "n_outliers": n_out,
+            "run_id": i,
+            "radius": res["radius"]
+        })
 
     df = pd.DataFrame(results)
-    df.to_csv(os.path.join(CSV_DIR, 'robustness_results.csv'), index=False)
+    df.to_csv(csv_path('robustness_results.csv'), index=False)
 
     # Ábrázolás
     plt.figure(figsize=(10, 6))
@@ -177,16 +368,20 @@ def run_robustness_test(repeats=10):
     plt.suptitle("") # A pandas automatikus címét töröljük
     plt.xlabel("Outlierek száma")
     plt.ylabel("Kör sugara")
-    plt.savefig(os.path.join(RESULTS_DIR, 'robustness_outliers.png'))
+    plt.savefig(results_path('robustness_outliers.png'))
     plt.close()
     print("  Kész. Eredmények mentve.")
 
-def run_convergence_test(repeats=30):
+def run_convergence_test(repeats=30, tolerance_pct=5.0):
     """
     D. Konvergencia vizsgálat
+    Véletlen és becslésekből indított (smart) kezdeti populáció összehasonlítása:
+    átlagos konvergencia görbe és az optimum `tolerance_pct` százalékán belülre
+    jutáshoz szükséges generációk száma.
     """
+    import matplotlib.pyplot as plt
+
     print("\n--- D. Konvergencia vizsgálat ---")
-    histories = []
     
     params = {
         "population_size": 100,
@@ -194,33 +389,45 @@ def run_convergence_test(repeats=30):
         "crossover_rate": 0.8,
         "mutation_rate": 0.1
     }
+    initializations = [("random", 'Véletlen inicializálás', 'blue'), ("smart", 'Becsült inicializálás', 'green')]
     
+    np.random.seed(cell_seed('convergence-points'))
     points = generate_point_cloud(num_points=200, num_outliers=10) # Egy fix nehéz eset
+    target = welzl_circle(points)[2] * (1 + tolerance_pct / 100)
     
-    print(f"  {repeats} futtatás a konvergencia átlagolásához...")
-    for i in range(repeats):
-        _, _, _, history = measure_single_run(points, params)
-        histories.append(history)
-    
-    # Átlag és szórás számítása generációnként
-    min_len = min(len(h) for h in histories)
-    histories = [h[:min_len] for h in histories] # Vágás a legrövidebbre
-    arr = np.array(histories)
-    
-    mean_history = np.mean(arr, axis=0)
-    std_history = np.std(arr, axis=0)
-    generations = np.arange(len(mean_history))
+    print(f"  {repeats} futtatás inicializálásonként a konvergencia átlagolásához...")
+    plt.figure(figsize=(10, 6))
+    for k, (initialization, label, color) in enumerate(initializations):
+        tasks = [make_task(dict(params, initialization=initialization), cell_seed('convergence', k, i), points=points)
+                 for i in range(repeats)]
+        histories = [res["history"] for res in run_cells(tasks)]
+        
+        # Átlag és szórás számítása generációnként
+        min_len = min(len(h) for h in histories)
+        histories = [h[:min_len] for h in histories] # Vágás a legrövidebbre
+        arr = np.array(histories)
+        
+        mean_history = np.mean(arr, axis=0)
+        std_history = np.std(arr, axis=0)
+        generations = np.arange(len(mean_history))
+
+        plt.plot(generations, mean_history, label=f'{label} (átlag)', color=color)
+        plt.fill_between(generations, mean_history - std_history, mean_history + std_history, color=color, alpha=0.2)
+
+        to_target = np.array([generations_to_target(h, target) for h in histories], dtype=float)
+        converged = np.isfinite(to_target)
+        mean_text = f"{np.mean(to_target[converged]):.1f}" if converged.any() else "-"
+        print(f"    {label}: {mean_text} generáció az optimum {tolerance_pct:g}%-án belülre jutásig "
+              f"({converged.mean() * 100:.0f}% konvergált)")
 
     # Ábrázolás
-    plt.figure(figsize=(10, 6))
-    plt.plot(generations, mean_history, label='Átlagos legjobb fitnesz', color='blue')
-    plt.fill_between(generations, mean_history - std_history, mean_history + std_history, color='blue', alpha=0.2, label='Szórás')
-    plt.title("Konvergencia sebesség (30 futtatás átlaga)")
+    plt.axhline(y=target, color='black', linestyle='--', linewidth=1, label=f'Optimum + {tolerance_pct:g}%')
+    plt.title(f"Konvergencia sebesség ({repeats} futtatás átlaga)")
     plt.xlabel("Generáció")
     plt.ylabel("Legjobb fitnesz (Sugár)")
     plt.legend()
     plt.grid(True)
-    plt.savefig(os.path.join(RESULTS_DIR, 'convergence_plot.png'))
+    plt.savefig(results_path('convergence_plot.png'))
     plt.close()
     print("  Kész. Eredmények mentve.")
 
@@ -288,15 +495,11 @@ def generate_ellipse_points(a, b, num_points=100, center=(0, 0)):
     return points, optimal_radius
 
 
-def run_known_optimum_test(repeats=10):
+def known_optimum_cases():
     """
-    E. Ismert optimumú tesztesetek validálása
-    Szabályos alakzatokon teszteli az algoritmust, ahol az optimális megoldás ismert.
+    Az ismert optimumú tesztesetek: (név, pontok, optimális sugár) hármasok.
     """
-    print("\n--- E. Ismert optimumú tesztesetek ---")
-    
     test_cases = []
-    results = []
     
     # 1. Szabályos háromszög
     points_tri, opt_tri = generate_regular_polygon(3, 100)
@@ -321,6 +524,22 @@ def run_known_optimum_test(repeats=10):
     # 6. Ellipszis (a=80, b=120)
     points_ell2, opt_ell2 = generate_ellipse_points(80, 120, num_points=50)
     test_cases.append(("Ellipszis (a=80, b=120)", points_ell2, opt_ell2))
+    return test_cases
+
+
+def run_known_optimum_test(repeats=10):
+    """
+    E. Ismert optimumú tesztesetek validálása
+    Szabályos alakzatokon teszteli az algoritmust, ahol az optimális megoldás ismert.
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib.patches import Circle
+    import pandas as pd
+
+    print("\n--- E. Ismert optimumú tesztesetek ---")
+    
+    test_cases = known_optimum_cases()
+    results = []
     
     ga_params = {
         "population_size": 150,
@@ -330,13 +549,16 @@ def run_known_optimum_test(repeats=10):
     }
     
     # Futtatás minden tesztesetre
-    for name, points, optimal in test_cases:
+    tasks = [
+        make_task(ga_params, cell_seed('known-optimum', idx, i), points=points)
+        for idx, (name, points, optimal) in enumerate(test_cases)
+        for i in range(repeats)
+    ]
+    all_radii = [res["radius"] for res in run_cells(tasks)]
+
+    for idx, (name, points, optimal) in enumerate(test_cases):
         print(f"  Teszt: {name}")
-        found_radii = []
-        
-        for i in range(repeats):
-            _, _, radius, _ = measure_single_run(points, ga_params)
-            found_radii.append(radius)
+        found_radii = all_radii[idx * repeats:(idx + 1) * repeats]
         
         mean_radius = np.mean(found_radii)
         std_radius = np.std(found_radii)
@@ -354,7 +576,7 @@ def run_known_optimum_test(repeats=10):
     
     # Eredmények mentése
     df = pd.DataFrame(results)
-    df.to_csv(os.path.join(CSV_DIR, 'known_optimum_results.csv'), index=False)
+    df.to_csv(csv_path('known_optimum_results.csv'), index=False)
     
     # Vizualizáció: minden teszteset ábrázolása
     fig, axes = plt.subplots(2, 3, figsize=(15, 10))
@@ -371,6 +593,7 @@ def run_known_optimum_test(repeats=10):
         ax.add_patch(opt_circle)
         
         # Futtatás és megtalált kör
+        np.random.seed(cell_seed('known-optimum-plot', idx))
         ga = CircleGA(points, **ga_params)
         best_circle, _ = ga.run()
         found_circle = Circle((best_circle[0], best_circle[1]), best_circle[2], 
@@ -389,7 +612,7 @@ def run_known_optimum_test(repeats=10):
         ax.set_ylim(all_coords[:, 1].min() - margin, all_coords[:, 1].max() + margin)
     
     plt.tight_layout()
-    plt.savefig(os.path.join(RESULTS_DIR, 'known_optimum_validation.png'), dpi=150)
+    plt.savefig(results_path('known_optimum_validation.png'), dpi=150)
     plt.close()
     
     # Összefoglaló táblázat grafikon
@@ -410,7 +633,7 @@ def run_known_optimum_test(repeats=10):
     plt.legend()
     plt.grid(True, axis='y', alpha=0.3)
     plt.tight_layout()
-    plt.savefig(os.path.join(RESULTS_DIR, 'known_optimum_errors.png'), dpi=150)
+    plt.savefig(results_path('known_optimum_errors.png'), dpi=150)
     plt.close()
     
     print("  Kész. Eredmények mentve.")
@@ -420,6 +643,9 @@ def run_iteration_runtime_test(repeats=5):
     """
     F. Futási idő és iterációszám (generációszám) kapcsolata
     """
+    import matplotlib.pyplot as plt
+    import pandas as pd
+
     print("\n--- F. Futási idő vs. Iterációszám (generációszám) ---")
     
     generation_counts = [25, 50, 100, 150, 200, 300, 500, 750, 1000]
@@ -432,38 +658,40 @@ def run_iteration_runtime_test(repeats=5):
     }
     
     # Fix ponthalmaz a konzisztens méréshez
+    np.random.seed(cell_seed('iteration-runtime-points'))
     points = generate_point_cloud(num_points=200, num_outliers=5)
     
-    for n_gen in generation_counts:
-        print(f"  Mérés {n_gen} generációval ({repeats} ismétlés)...")
-        for i in range(repeats):
-            params = base_params.copy()
-            params['generations'] = n_gen
-            
-            runtime, _, radius, _ = measure_single_run(points, params)
-            
-            results.append({
-                "generations": n_gen,
-                "run_id": i,
-                "runtime": runtime,
-                "radius": radius,
-                "time_per_iteration": runtime / n_gen
-            })
+    cells = [(n_gen, i) for n_gen in generation_counts for i in range(repeats)]
+    print(f"  Mérés {len(generation_counts)} generációszámmal, {repeats} ismétléssel ({len(cells)} futtatás)...")
+    tasks = [
+        make_task(dict(base_params, generations=n_gen), cell_seed('iteration-runtime', n_gen, i), points=points,
+                  timing_repeats=3, warmup=1)
+        for n_gen, i in cells
+    ]
+    for (n_gen, i), res in zip(cells, run_cells(tasks)):
+        results.append({
+            "generations": n_gen,
+            "run_id": i,
+            "runtime": res["runtime"],
+            "runtime_iqr": res["runtime_iqr"],
+            "radius": res["radius"],
+            "time_per_iteration": res["runtime"] / n_gen
+        })
     
     df = pd.DataFrame(results)
-    df.to_csv(os.path.join(CSV_DIR, 'iteration_runtime_results.csv'), index=False)
+    df.to_csv(csv_path('iteration_runtime_results.csv'), index=False)
     
     # Ábrázolás - Futási idő vs. generációszám
     fig, axes = plt.subplots(1, 2, figsize=(14, 5))
     
     # 1. Futási idő
     ax1 = axes[0]
-    stats = df.groupby('generations')['runtime'].agg(['mean', 'std']).reset_index()
-    ax1.errorbar(stats['generations'], stats['mean'], yerr=stats['std'], 
-                 fmt='-o', capsize=5, color='blue', label='Átlagos futási idő')
+    stats = robust_group_stats(df, 'generations', 'runtime')
+    ax1.errorbar(stats['generations'], stats['median'], yerr=[stats['err_low'], stats['err_high']],
+                 fmt='-o', capsize=5, color='blue', label='Futási idő (medián, IQR)')
     
     # Lineáris illesztés
-    coeffs = np.polyfit(stats['generations'], stats['mean'], 1)
+    coeffs = np.polyfit(stats['generations'], stats['median'], 1)
     fit_line = np.polyval(coeffs, stats['generations'])
     ax1.plot(stats['generations'], fit_line, '--', color='red', 
              label=f'Lineáris illesztés (meredekség: {coeffs[0]*1000:.3f} ms/gen)')
@@ -476,25 +704,26 @@ def run_iteration_runtime_test(repeats=5):
     
     # 2. Iterációnkénti idő (ellenőrzés, hogy konstans-e)
     ax2 = axes[1]
-    stats_per_iter = df.groupby('generations')['time_per_iteration'].agg(['mean', 'std']).reset_index()
-    ax2.errorbar(stats_per_iter['generations'], stats_per_iter['mean'] * 1000, 
-                 yerr=stats_per_iter['std'] * 1000, fmt='-s', capsize=5, color='green')
-    ax2.axhline(y=stats_per_iter['mean'].mean() * 1000, color='red', linestyle='--', 
-                label=f'Átlag: {stats_per_iter["mean"].mean()*1000:.2f} ms/generáció')
+    stats_per_iter = robust_group_stats(df, 'generations', 'time_per_iteration')
+    ax2.errorbar(stats_per_iter['generations'], stats_per_iter['median'] * 1000,
+                 yerr=[stats_per_iter['err_low'] * 1000, stats_per_iter['err_high'] * 1000],
+                 fmt='-s', capsize=5, color='green')
+    ax2.axhline(y=stats_per_iter['median'].median() * 1000, color='red', linestyle='--',
+                label=f'Medián: {stats_per_iter["median"].median()*1000:.2f} ms/generáció')
     
-    ax2.set_title("Átlagos idő generációnként")
+    ax2.set_title("Idő generációnként (medián)")
     ax2.set_xlabel("Generációk száma")
     ax2.set_ylabel("Idő/generáció (ms)")
     ax2.grid(True, alpha=0.3)
     ax2.legend()
     
     plt.tight_layout()
-    plt.savefig(os.path.join(RESULTS_DIR, 'iteration_runtime_analysis.png'), dpi=150)
+    plt.savefig(results_path('iteration_runtime_analysis.png'), dpi=150)
     plt.close()
     
     # Összefoglaló statisztikák kiírása
-    avg_time_per_iter = df['time_per_iteration'].mean() * 1000
-    print(f"\n  Átlagos idő generációnként: {avg_time_per_iter:.2f} ms")
+    median_time_per_iter = robust_summary(df['time_per_iteration'])["median"] * 1000
+    print(f"\n  Idő generációnként (medián): {median_time_per_iter:.2f} ms")
     print(f"  Lineáris kapcsolat meredeksége: {coeffs[0]*1000:.3f} ms/generáció")
     print("  Kész. Eredmények mentve.")
 
@@ -504,6 +733,10 @@ def run_parameter_variation_test():
     G. Konkrét példák különböző paraméter-beállításokkal
     Bemutatja az alakhiba, zaj és kiugró pontok hatását vizuálisan.
     """
+    import matplotlib.pyplot as plt
+    from matplotlib.patches import Circle
+    import pandas as pd
+
     print("\n--- G. Paraméter variációk vizuális bemutatása ---")
     
     ga_params = {
@@ -543,13 +776,14 @@ def run_parameter_variation_test():
         print(f"  Teszt: {name.replace(chr(10), ' ')}")
         
         # Ponthalmaz generálása
+        np.random.seed(cell_seed('parameter-variation', idx))
         points = generate_point_cloud(**pg_params)
         
         # Algoritmus futtatása
-        start_time = time.time()
+        start_time = time.perf_counter()
         ga = CircleGA(points, **ga_params)
         best_circle, history = ga.run()
-        runtime = time.time() - start_time
+        runtime = time.perf_counter() - start_time
         
         # Eredmény mentése
         results.append({
@@ -579,17 +813,683 @@ def run_parameter_variation_test():
         ax.set_ylim(points[:, 1].min() - margin, points[:, 1].max() + margin)
     
     plt.tight_layout()
-    plt.savefig(os.path.join(RESULTS_DIR, 'parameter_variations.png'), dpi=150)
+    plt.savefig(results_path('parameter_variations.png'), dpi=150)
     plt.close()
     
     # Eredmények táblázat mentése
     df = pd.DataFrame(results)
-    df.to_csv(os.path.join(CSV_DIR, 'parameter_variation_results.csv'), index=False)
+    df.to_csv(csv_path('parameter_variation_results.csv'), index=False)
     
     print("  Kész. Eredmények mentve.")
 
 
+# Véletlen ponthalmaz konfigurációk az egzakt megoldással való összevetéshez
+GROUND_TRUTH_CONFIGS = [
+    ("Ideális", {"num_points": 200, "random_noise": 2.0, "shape_error": 0.0, "num_outliers": 0}),
+    ("Közepes zaj", {"num_points": 200, "random_noise": 5.0, "shape_error": 0.1, "num_outliers": 5}),
+    ("Nagy zaj", {"num_points": 200, "random_noise": 15.0, "shape_error": 0.1, "num_outliers": 5}),
+    ("Sok outlier", {"num_points": 200, "random_noise": 5.0, "shape_error": 0.1, "num_outliers": 20}),
+    ("Nagy ponthalmaz", {"num_points": 5000, "random_noise": 5.0, "shape_error": 0.1, "num_outliers": 10}),
+]
+
+
+def run_ground_truth_test(repeats=10):
+    """
+    H. Összevetés az egzakt megoldással véletlen ponthalmazokon
+    A Welzl algoritmus adja az optimális sugarat, ehhez mérjük a GA hibáját.
+    """
+    import matplotlib.pyplot as plt
+    import pandas as pd
+
+    print("\n--- H. Összevetés az egzakt (Welzl) megoldással ---")
+
+    test_configs = GROUND_TRUTH_CONFIGS
+
+    ga_params = {
+        "population_size": 100,
+        "generations": 150,
+        "crossover_rate": 0.8,
+        "mutation_rate": 0.1
+    }
+
+    results = []
+    cells = [(idx, i) for idx in range(len(test_configs)) for i in range(repeats)]
+    print(f"  {len(test_configs)} teszteset, {repeats} ismétlés ({len(cells)} futtatás)...")
+    tasks = [
+        make_task(ga_params, cell_seed('ground-truth', idx, i), point_params=test_configs[idx][1],
+                  point_seed=cell_seed('ground-truth-points', idx, i), exact=True)
+        for idx, i in cells
+    ]
+    for (idx, i), res in zip(cells, run_cells(tasks)):
+        optimal = res["optimal_radius"]
+        results.append({
+            "config": test_configs[idx][0],
+            "run_id": i,
+            "optimal_radius": optimal,
+            "found_radius": res["radius"],
+            "error_percent": (res["radius"] - optimal) / optimal * 100,
+            "runtime": res["runtime"]
+        })
+
+    df = pd.DataFrame(results)
+    df.to_csv(csv_path('ground_truth_results.csv'), index=False)
+
+    # Ábrázolás
+    stats = df.groupby('config', sort=False)['error_percent'].agg(['mean', 'std']).reset_index()
+    plt.figure(figsize=(10, 6))
+    plt.bar(stats['config'], stats['mean'], yerr=stats['std'], capsize=5, color='steelblue', edgecolor='black')
+    plt.axhline(y=0, color='black', linestyle='-', linewidth=0.5)
+    plt.title("A GA hibája az egzakt legkisebb befoglaló körhöz képest")
+    plt.xlabel("Teszteset")
+    plt.ylabel("Hiba az optimálishoz képest (%)")
+    plt.grid(True, axis='y', alpha=0.3)
+    plt.tight_layout()
+    plt.savefig(results_path('ground_truth_errors.png'), dpi=150)
+    plt.close()
+
+    for _, row in stats.iterrows():
+        print(f"    {row['config']}: átlagos hiba {row['mean']:.2f}% ± {row['std']:.2f}%")
+    print("  Kész. Eredmények mentve.")
+
+
+def generations_to_target(history, target):
+    """Az első generáció (1-től számozva), amelyben a legjobb fitnesz elérte a célt; NaN, ha soha."""
+    reached = np.nonzero(np.asarray(history) <= target)[0]
+    return reached[0] + 1 if len(reached) else np.nan
+
+
+def run_selection_test(repeats=10, tolerance_pct=1.0):
+    """
+    I. Szelekciós eljárások összehasonlítása
+    Generációnkénti futási idő és a konvergenciához (az egzakt optimum
+    `tolerance_pct` százalékán belülre jutáshoz) szükséges generációk száma.
+    """
+    import matplotlib.pyplot as plt
+    import pandas as pd
+
+    print("\n--- I. Szelekciós eljárások összehasonlítása ---")
+
+    strategies = [(name, 0) for name in SELECTION_METHODS] + [(name, 2) for name in SELECTION_METHODS]
+    ga_params = {
+        "population_size": 100,
+        "generations": 300,
+        "crossover_rate": 0.8,
+        "mutation_rate": 0.1
+    }
+    point_params = {"num_points": 200, "num_outliers": 10}
+
+    cells = [(idx, i) for idx in range(len(strategies)) for i in range(repeats)]
+    print(f"  {len(strategies)} stratégia, {repeats} ismétlés ({len(cells)} futtatás)...")
+    tasks = [
+        make_task(dict(ga_params, selection=strategies[idx][0], elitism=strategies[idx][1]),
+                  cell_seed('selection', idx, i), point_params=point_params,
+                  point_seed=cell_seed('selection-points', i), exact=True)
+        for idx, i in cells
+    ]
+
+    results = []
+    for (idx, i), res in zip(cells, run_cells(tasks)):
+        name, elitism = strategies[idx]
+        target = res["optimal_radius"] * (1 + tolerance_pct / 100)
+        results.append({
+            "strategy": f"{name}" + (f" + elit({elitism})" if elitism else ""),
+            "run_id": i,
+            "time_per_generation_ms": res["runtime"] / len(res["history"]) * 1000,
+            "generations_to_converge": generations_to_target(res["history"], target),
+            "final_error_percent": (res["radius"] - res["optimal_radius"]) / res["optimal_radius"] * 100
+        })
+
+    df = pd.DataFrame(results)
+    df.to_csv(csv_path('selection_results.csv'), index=False)
+
+    stats = df.groupby('strategy', sort=False).agg(
+        time_mean=('time_per_generation_ms', 'mean'),
+        time_std=('time_per_generation_ms', 'std'),
+        gens_mean=('generations_to_converge', 'mean'),
+        gens_std=('generations_to_converge', 'std'),
+        converged=('generations_to_converge', lambda g: g.notna().mean() * 100)
+    ).reset_index()
+
+    # Ábrázolás
+    fig, axes = plt.subplots(1, 2, figsize=(14, 5))
+    axes[0].bar(stats['strategy'], stats['time_mean'], yerr=stats['time_std'], capsize=5, color='steelblue', edgecolor='black')
+    axes[0].set_title("Idő generációnként")
+    axes[0].set_ylabel("Idő/generáció (ms)")
+    axes[1].bar(stats['strategy'], stats['gens_mean'], yerr=stats['gens_std'], capsize=5, color='orange', edgecolor='black')
+    axes[1].set_title(f"Generációk az optimum {tolerance_pct:g}%-án belülre jutásig")
+    axes[1].set_ylabel("Generációk száma")
+    for ax in axes:
+        ax.tick_params(axis='x', rotation=45)
+        ax.grid(True, axis='y', alpha=0.3)
+    plt.tight_layout()
+    plt.savefig(results_path('selection_comparison.png'), dpi=150)
+    plt.close()
+
+    for _, row in stats.iterrows():
+        print(f"    {row['strategy']}: {row['time_mean']:.2f} ms/generáció, "
+              f"{row['gens_mean']:.0f} generáció a konvergenciáig ({row['converged']:.0f}% konvergált)")
+    print("  Kész. Eredmények mentve.")
+
+
+def run_local_search_test(repeats=10):
+    """
+    J. Memetikus lokális finomítás
+    A sima GA és a lokális kereséssel kiegészített (memetikus) GA hibája az
+    egzakt optimumhoz képest, különböző generációszámok mellett.
+    """
+    import matplotlib.pyplot as plt
+    import pandas as pd
+
+    print("\n--- J. Memetikus lokális finomítás ---")
+
+    methods = [None] + list(LOCAL_SEARCH_METHODS)
+    generation_counts = [25, 50, 100, 200]
+    ga_params = {
+        "population_size": 100,
+        "crossover_rate": 0.8,
+        "mutation_rate": 0.1
+    }
+    point_params = {"num_points": 200, "num_outliers": 10}
+
+    cells = [(m, n_gen, i) for m in range(len(methods)) for n_gen in generation_counts for i in range(repeats)]
+    print(f"  {len(methods)} eljárás, {len(generation_counts)} generációszám, {repeats} ismétlés ({len(cells)} futtatás)...")
+    tasks = [
+        make_task(dict(ga_params, generations=n_gen, local_search=methods[m]),
+                  cell_seed('local-search', m, n_gen, i), point_params=point_params,
+                  point_seed=cell_seed('local-search-points', i), exact=True)
+        for m, n_gen, i in cells
+    ]
+
+    results = []
+    for (m, n_gen, i), res in zip(cells, run_cells(tasks)):
+        results.append({
+            "method": methods[m] or "nincs (sima GA)",
+            "generations": n_gen,
+            "run_id": i,
+            "runtime": res["runtime"],
+            "error_percent": (res["radius"] - res["optimal_radius"]) / res["optimal_radius"] * 100
+        })
+
+    df = pd.DataFrame(results)
+    df.to_csv(csv_path('local_search_results.csv'), index=False)
+
+    stats = df.groupby(['method', 'generations'], sort=False).agg(
+        error_mean=('error_percent', 'mean'),
+        error_std=('error_percent', 'std'),
+        runtime_mean=('runtime', 'mean')
+    ).reset_index()
+
+    # Ábrázolás
+    fig, axes = plt.subplots(1, 2, figsize=(14, 5))
+    for method, group in stats.groupby('method', sort=False):
+        axes[0].errorbar(group['generations'], group['error_mean'], yerr=group['error_std'], marker='o', capsize=5, label=method)
+        axes[1].plot(group['generations'], group['runtime_mean'], marker='o', label=method)
+    axes[0].set_title("Hiba az optimumhoz képest")
+    axes[0].set_xlabel("Generációk száma")
+    axes[0].set_ylabel("Hiba (%)")
+    axes[0].set_yscale('symlog', linthresh=0.01)
+    axes[1].set_title("Futási idő")
+    axes[1].set_xlabel("Generációk száma")
+    axes[1].set_ylabel("Idő (s)")
+    for ax in axes:
+        ax.grid(True, alpha=0.3)
+        ax.legend()
+    plt.tight_layout()
+    plt.savefig(results_path('local_search_comparison.png'), dpi=150)
+    plt.close()
+
+    for _, row in stats.iterrows():
+        print(f"    {row['method']}, {row['generations']} generáció: {row['error_mean']:.3f}% hiba, {row['runtime_mean']:.3f} s")
+    print("  Kész. Eredmények mentve.")
+
+
+def run_strategy_test(repeats=10, tolerance_pct=1.0, max_evaluations=15000):
+    """
+    K. Optimalizáló motorok összehasonlítása
+    A GA, a CMA-ES és a differenciális evolúció azonos kiértékelési kerettel fut
+    a H. teszt ponthalmazain; mérjük, hány fitnesz kiértékelés és mennyi idő kell
+    az optimum `tolerance_pct` százalékán belülre jutáshoz.
+    """
+    import matplotlib.pyplot as plt
+    import pandas as pd
+
+    print("\n--- K. Optimalizáló motorok összehasonlítása ---")
+
+    engines = [
+        ("GA", 'ga', {"population_size": 100, "crossover_rate": 0.8, "mutation_rate": 0.1}),
+        ("CMA-ES", 'cmaes', {"population_size": 7}),
+        ("DE", 'de', {"population_size": 30}),
+    ]
+
+    cells = [(e, c, i) for e in range(len(engines)) for c in range(len(GROUND_TRUTH_CONFIGS)) for i in range(repeats)]
+    print(f"  {len(engines)} motor, {len(GROUND_TRUTH_CONFIGS)} ponthalmaz típus, {repeats} ismétlés ({len(cells)} futtatás)...")
+    tasks = []
+    for e, c, i in cells:
+        _, engine, params = engines[e]
+        params = dict(params, generations=max_evaluations // params["population_size"])
+        tasks.append(make_task(params, cell_seed('strategies', e, c, i), point_params=GROUND_TRUTH_CONFIGS[c][1],
+                               point_seed=cell_seed('ground-truth-points', c, i), exact=True, engine=engine,
+                               target_pct=tolerance_pct))
+
+    results = []
+    for (e, c, i), res in zip(cells, run_cells(tasks)):
+        target = res["optimal_radius"] * (1 + tolerance_pct / 100)
+        generation = generations_to_target(res["history"], target)
+        results.append({
+            "engine": engines[e][0],
+            "config": GROUND_TRUTH_CONFIGS[c][0],
+            "run_id": i,
+            "evaluations_to_target": res["evaluations"][int(generation) - 1] if np.isfinite(generation) else np.nan,
+            "wall_time": res["runtime"],
+            "reached_target": np.isfinite(generation),
+            "error_percent": (res["radius"] - res["optimal_radius"]) / res["optimal_radius"] * 100
+        })
+
+    df = pd.DataFrame(results)
+    df.to_csv(csv_path('strategy_results.csv'), index=False)
+
+    stats = df.groupby(['config', 'engine'], sort=False).agg(
+        evaluations_mean=('evaluations_to_target', 'mean'),
+        wall_time_mean=('wall_time', 'mean'),
+        reached=('reached_target', 'mean')
+    ).reset_index()
+
+    # Ábrázolás: csoportosított oszlopdiagram ponthalmaz típusonként
+    fig, axes = plt.subplots(1, 2, figsize=(15, 5))
+    x = np.arange(len(GROUND_TRUTH_CONFIGS))
+    width = 0.8 / len(engines)
+    for k, (name, _, _) in enumerate(engines):
+        engine_stats = stats[stats['engine'] == name]
+        axes[0].bar(x + k * width, engine_stats['evaluations_mean'], width, label=name, edgecolor='black')
+        axes[1].bar(x + k * width, engine_stats['wall_time_mean'], width, label=name, edgecolor='black')
+    axes[0].set_title(f"Fitnesz kiértékelések az optimum {tolerance_pct:g}%-án belülre jutásig")
+    axes[0].set_ylabel("Kiértékelések száma")
+    axes[0].set_yscale('log')
+    axes[1].set_title("Futási idő (a cél elérésekor leáll)")
+    axes[1].set_ylabel("Idő (s)")
+    for ax in axes:
+        ax.set_xticks(x + width * (len(engines) - 1) / 2)
+        ax.set_xticklabels([name for name, _ in GROUND_TRUTH_CONFIGS], rotation=20)
+        ax.grid(True, axis='y', alpha=0.3)
+        ax.legend()
+    plt.tight_layout()
+    plt.savefig(results_path('strategy_comparison.png'), dpi=150)
+    plt.close()
+
+    for _, row in stats.iterrows():
+        print(f"    {row['config']}, {row['engine']}: {row['evaluations_mean']:.0f} kiértékelés a célig, "
+              f"{row['wall_time_mean']:.3f} s ({row['reached'] * 100:.0f}% érte el a célt)")
+    print("  Kész. Eredmények mentve.")
+
+
+def run_multiresolution_test(repeats=5):
+    """
+    L. Többfelbontású fitnesz kiértékelés
+    A teljes ponthalmazon és a növekvő részmintán számolt fitnesszel futó GA
+    futási ideje és hibája nagy ponthalmazokon. A végeredmény mindkét esetben
+    minden pontot tartalmaz.
+    """
+    import matplotlib.pyplot as plt
+    import pandas as pd
+
+    print("\n--- L. Többfelbontású fitnesz kiértékelés ---")
+
+    point_counts = [5000, 20000, 80000]
+    ga_params = {
+        "population_size": 100,
+        "generations": 100,
+        "crossover_rate": 0.8,
+        "mutation_rate": 0.1
+    }
+    modes = [("Teljes ponthalmaz", False), ("Többfelbontású", True)]
+
+    cells = [(m, n, i) for m in range(len(modes)) for n in point_counts for i in range(repeats)]
+    print(f"  {len(modes)} mód, {len(point_counts)} pontszám, {repeats} ismétlés ({len(cells)} futtatás)...")
+    tasks = [
+        make_task(dict(ga_params, multiresolution=modes[m][1]), cell_seed('multiresolution', m, n, i),
+                  point_params={"num_points": n, "num_outliers": 10},
+                  point_seed=cell_seed('multiresolution-points', n, i), exact=True)
+        for m, n, i in cells
+    ]
+
+    results = []
+    for (m, n, i), res in zip(cells, run_cells(tasks)):
+        results.append({
+            "mode": modes[m][0],
+            "num_points": n,
+            "run_id": i,
+            "runtime": res["runtime"],
+            "error_percent": (res["radius"] - res["optimal_radius"]) / res["optimal_radius"] * 100
+        })
+
+    df = pd.DataFrame(results)
+    df.to_csv(csv_path('multiresolution_results.csv'), index=False)
+
+    stats = df.groupby(['mode', 'num_points'], sort=False).agg(
+        runtime_mean=('runtime', 'mean'),
+        runtime_std=('runtime', 'std'),
+        error_mean=('error_percent', 'mean'),
+        error_std=('error_percent', 'std')
+    ).reset_index()
+
+    # Ábrázolás
+    fig, axes = plt.subplots(1, 2, figsize=(14, 5))
+    for mode, group in stats.groupby('mode', sort=False):
+        axes[0].errorbar(group['num_points'], group['runtime_mean'], yerr=group['runtime_std'], marker='o', capsize=5, label=mode)
+        axes[1].errorbar(group['num_points'], group['error_mean'], yerr=group['error_std'], marker='o', capsize=5, label=mode)
+    axes[0].set_title("Futási idő")
+    axes[0].set_ylabel("Idő (s)")
+    axes[1].set_title("Hiba az optimumhoz képest")
+    axes[1].set_ylabel("Hiba (%)")
+    for ax in axes:
+        ax.set_xlabel("Pontok száma")
+        ax.set_xscale('log')
+        ax.grid(True, alpha=0.3)
+        ax.legend()
+    plt.tight_layout()
+    plt.savefig(results_path('multiresolution_comparison.png'), dpi=150)
+    plt.close()
+
+    for _, row in stats.iterrows():
+        print(f"    {row['mode']}, {row['num_points']} pont: {row['runtime_mean']:.2f} s, {row['error_mean']:.2f}% hiba")
+    print("  Kész. Eredmények mentve.")
+
+
+def run_precision_test(repeats=10, speed_points=1000000, speed_repeats=5):
+    """
+    M. float32 és float64 pontosság összehasonlítása
+    A GA hibája az ismert optimumú teszteseteken mindkét típussal, a fitnesz
+    eltérése az optimális körön, valamint a fitnesz számítás sebessége egy
+    nagy ponthalmazon.
+    """
+    import matplotlib.pyplot as plt
+    import pandas as pd
+
+    print("\n--- M. float32 és float64 összehasonlítás ---")
+
+    dtypes = ['float64', 'float32']
+    test_cases = known_optimum_cases()
+    ga_params = {
+        "population_size": 150,
+        "generations": 200,
+        "crossover_rate": 0.8,
+        "mutation_rate": 0.15
+    }
+
+    # 1. Pontosság az ismert optimumú eseteken
+    cells = [(d, idx, i) for d in range(len(dtypes)) for idx in range(len(test_cases)) for i in range(repeats)]
+    print(f"  {len(dtypes)} típus, {len(test_cases)} teszteset, {repeats} ismétlés ({len(cells)} futtatás)...")
+    tasks = [
+        make_task(dict(ga_params, dtype=dtypes[d]), cell_seed('known-optimum', idx, i), points=test_cases[idx][1])
+        for d, idx, i in cells
+    ]
+    results = []
+    for (d, idx, i), res in zip(cells, run_cells(tasks)):
+        name, points, optimal = test_cases[idx]
+        # A fitnesz eltérése az optimális körön a float64 számításhoz képest
+        circle = np.array([[0.0, 0.0, optimal]])
+        reference = population_fitness(circle, points)[0]
+        value = population_fitness(circle.astype(dtypes[d]), points.astype(dtypes[d]))[0]
+        results.append({
+            "dtype": dtypes[d],
+            "test_case": name,
+            "run_id": i,
+            "error_percent": (res["radius"] - optimal) / optimal * 100,
+            "fitness_deviation": abs(value - reference) / reference,
+            "runtime": res["runtime"]
+        })
+    df = pd.DataFrame(results)
+    df.to_csv(csv_path('precision_results.csv'), index=False)
+
+    # 2. A fitnesz számítás sebessége nagy ponthalmazon
+    np.random.seed(cell_seed('precision-speed'))
+    points = generate_point_cloud(num_points=speed_points)
+    population = np.column_stack((np.random.uniform(-10, 10, (100, 2)), np.random.uniform(90, 130, 100)))
+    speed = []
+    for dtype in dtypes:
+        pts, pop = points.astype(dtype), population.astype(dtype)
+        population_fitness(pop, pts, 8) # bemelegítés
+        start = time.perf_counter()
+        for _ in range(speed_repeats):
+            population_fitness(pop, pts, 8)
+        speed.append({"dtype": dtype, "n_points": speed_points,
+                      "time_per_evaluation": (time.perf_counter() - start) / speed_repeats})
+    df_speed = pd.DataFrame(speed)
+    df_speed.to_csv(csv_path('precision_speed.csv'), index=False)
+
+    # Ábrázolás
+    stats = df.groupby(['test_case', 'dtype'], sort=False)['error_percent'].agg(['mean', 'std']).reset_index()
+    fig, axes = plt.subplots(1, 2, figsize=(15, 5))
+    x = np.arange(len(test_cases))
+    width = 0.4
+    for k, dtype in enumerate(dtypes):
+        dtype_stats = stats[stats['dtype'] == dtype]
+        axes[0].bar(x + k * width, dtype_stats['mean'], width, yerr=dtype_stats['std'], capsize=3, label=dtype, edgecolor='black')
+    axes[0].set_xticks(x + width / 2)
+    axes[0].set_xticklabels([name.split('(')[0].strip() for name, _, _ in test_cases], rotation=30, ha='right')
+    axes[0].set_title("Hiba az ismert optimumhoz képest")
+    axes[0].set_ylabel("Hiba (%)")
+    axes[0].legend()
+    axes[1].bar(df_speed['dtype'], df_speed['time_per_evaluation'] * 1000, color=['steelblue', 'orange'], edgecolor='black')
+    axes[1].set_title(f"Fitnesz kiértékelés ideje ({speed_points} pont, 100 egyed)")
+    axes[1].set_ylabel("Idő (ms)")
+    for ax in axes:
+        ax.grid(True, axis='y', alpha=0.3)
+    plt.tight_layout()
+    plt.savefig(results_path('precision_comparison.png'), dpi=150)
+    plt.close()
+
+    for dtype in dtypes:
+        dtype_df = df[df['dtype'] == dtype]
+        dtype_time = df_speed.loc[df_speed['dtype'] == dtype, 'time_per_evaluation'].iloc[0]
+        print(f"    {dtype}: átlagos hiba {dtype_df['error_percent'].mean():.3f}%, max. fitnesz eltérés az optimumon "
+              f"{dtype_df['fitness_deviation'].max():.1e}, kiértékelés {dtype_time * 1000:.1f} ms")
+    print("  Kész. Eredmények mentve.")
+
+
+def run_online_test(batch_sizes=(100, 1000, 10000), n_points=200000):
+    """
+    N. Online illesztés kötegenként érkező pontokra
+    Az `OnlineCircleFitter` és a teljes, addig összegyűlt ponthalmaz minden köteg
+    utáni újraoldásának (Welzl) összevetése: teljes futási idő, köteg utáni
+    átlagos késleltetés, és a végső kör eltérése.
+    """
+    import matplotlib.pyplot as plt
+    import pandas as pd
+
+    print("\n--- N. Online illesztés kötegenként érkező pontokra ---")
+
+    np.random.seed(cell_seed('online-points'))
+    points = generate_point_cloud(num_points=n_points, num_outliers=20)
+
+    results = []
+    for batch_size in batch_sizes:
+        chunks = [points[start:start + batch_size] for start in range(0, n_points, batch_size)]
+
+        fitter = OnlineCircleFitter()
+        start = time.perf_counter()
+        for chunk in chunks:
+            online_circle = fitter.update(chunk)
+        online_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for k in range(len(chunks)):
+            rebuild_circle = welzl_circle(points[:(k + 1) * batch_size])
+        rebuild_time = time.perf_counter() - start
+
+        results.append({
+            "batch_size": batch_size,
+            "n_batches": len(chunks),
+            "online_time": online_time,
+            "rebuild_time": rebuild_time,
+            "online_latency_ms": online_time / len(chunks) * 1000,
+            "rebuild_latency_ms": rebuild_time / len(chunks) * 1000,
+            "n_resolves": fitter.n_resolves,
+            "stored_points": len(fitter.hull),
+            "radius_difference": abs(online_circle[2] - rebuild_circle[2])
+        })
+
+    df = pd.DataFrame(results)
+    df.to_csv(csv_path('online_results.csv'), index=False)
+
+    # Ábrázolás
+    plt.figure(figsize=(10, 6))
+    plt.plot(df['batch_size'], df['online_latency_ms'], '-o', label='Online illesztés')
+    plt.plot(df['batch_size'], df['rebuild_latency_ms'], '-s', label='Újraoldás a teljes ponthalmazon')
+    plt.xscale('log')
+    plt.yscale('log')
+    plt.title(f"Köteg utáni frissítés ideje ({n_points} pont)")
+    plt.xlabel("Kötegméret")
+    plt.ylabel("Átlagos idő kötegenként (ms)")
+    plt.grid(True, alpha=0.3)
+    plt.legend()
+    plt.savefig(results_path('online_latency.png'), dpi=150)
+    plt.close()
+
+    for row in results:
+        print(f"    Köteg {row['batch_size']}: online {row['online_latency_ms']:.3f} ms, újraoldás "
+              f"{row['rebuild_latency_ms']:.3f} ms kötegenként; {row['n_resolves']} újraoldás, "
+              f"{row['stored_points']} tárolt pont, sugár eltérés {row['radius_difference']:.1e}")
+    print("  Kész. Eredmények mentve.")
+
+
+def run_warm_start_test(n_frames=10, drift=0.5, noise=0.2, tolerance_pct=1.0):
+    """
+    O. Meleg indítás lassan változó ponthalmazok sorozatán
+    Egy elmozduló, zajos képkocka-sorozat minden képkockáján a hideg (véletlen
+    populációs) és a meleg (az előző kör és populáció körül induló, lásd
+    `CircleGA` és `tracking.py`) GA összevetése: az optimum `tolerance_pct`
+    százalékán belülre jutáshoz szükséges generációk és kiértékelések száma.
+    """
+    import matplotlib.pyplot as plt
+    import pandas as pd
+
+    print("\n--- O. Meleg indítás képkocka-sorozaton ---")
+
+    params = {
+        "population_size": 100,
+        "generations": 300,
+        "crossover_rate": 0.8,
+        "mutation_rate": 0.1,
+        "use_hull": True
+    }
+
+    np.random.seed(cell_seed('warm-start-points'))
+    base = generate_point_cloud(num_points=5000, num_outliers=10)
+    frames = [base + drift * k + np.random.normal(0, noise, base.shape) for k in range(n_frames)]
+
+    results = []
+    previous_circle = None
+    previous_population = None
+    for k, points in enumerate(frames):
+        optimum = welzl_circle(points)[2]
+        target = optimum * (1 + tolerance_pct / 100)
+        for m, mode in enumerate(("cold", "warm")):
+            np.random.seed(cell_seed('warm-start', k, m))
+            warm = mode == "warm" and previous_circle is not None
+            ga = CircleGA(points, target_fitness=target,
+                          initial_circle=previous_circle if warm else None,
+                          initial_population=previous_population if warm else None, **params)
+            circle, history = ga.run()
+            if mode == "warm":
+                previous_circle, previous_population = circle, ga.population
+            results.append({
+                "frame": k,
+                "mode": mode,
+                "generations": generations_to_target(history, target),
+                "evaluations": history.evaluations[-1],
+                "radius_error_pct": (history[-1] / optimum - 1) * 100
+            })
+
+    df = pd.DataFrame(results)
+    df.to_csv(csv_path('warm_start_results.csv'), index=False)
+
+    # Ábrázolás
+    plt.figure(figsize=(10, 6))
+    for mode, label, marker in [("cold", 'Hideg indítás', 'o'), ("warm", 'Meleg indítás', 's')]:
+        subset = df[df['mode'] == mode]
+        plt.plot(subset['frame'], subset['generations'], '-' + marker, label=label)
+    plt.title(f"Generációk az optimum {tolerance_pct:g}%-án belülre jutásig képkockánként")
+    plt.xlabel("Képkocka")
+    plt.ylabel("Generációk száma")
+    plt.grid(True, alpha=0.3)
+    plt.legend()
+    plt.savefig(results_path('warm_start_generations.png'), dpi=150)
+    plt.close()
+
+    # Az első képkocka mindkét módban hidegen indul, ezért kimarad az összesítésből
+    later = df[df['frame'] > 0]
+    for mode, label in [("cold", 'Hideg indítás'), ("warm", 'Meleg indítás')]:
+        subset = later[later['mode'] == mode]
+        converged = subset['generations'].notna()
+        mean_text = f"{subset['generations'][converged].mean():.1f}" if converged.any() else "-"
+        print(f"    {label}: {mean_text} generáció, {subset['evaluations'].mean():.0f} kiértékelés "
+              f"képkockánként ({converged.mean() * 100:.0f}% konvergált)")
+    print("  Kész. Eredmények mentve.")
+
+
+def run_profile_test(point_counts=(200, 2000, 20000, 200000), generations=50):
+    """
+    P. A GA futási idejének fázisonkénti megoszlása
+    Profilozott futások (`CircleGA(profile=True)`) különböző ponthalmaz-méreteken:
+    mennyi idő jut a fitnesz számításra, a szelekcióra, a keresztezésre, a
+    mutációra és a könyvelésre (lásd `telemetry.RunStats`).
+    """
+    import matplotlib.pyplot as plt
+    import pandas as pd
+
+    print("\n--- P. Fázisonkénti futási idő ---")
+
+    params = {
+        "population_size": 100,
+        "generations": generations,
+        "crossover_rate": 0.8,
+        "mutation_rate": 0.1,
+        "profile": True
+    }
+
+    results = []
+    for n_points in point_counts:
+        np.random.seed(cell_seed('profile-points', n_points))
+        points = generate_point_cloud(num_points=n_points, num_outliers=10)
+        np.random.seed(cell_seed('profile', n_points))
+        ga = CircleGA(points, **params)
+        ga.run()
+        row = {"n_points": n_points, "total_ms": ga.stats.total_ns / 1e6, "evaluations": ga.stats.evaluations}
+        for phase in PHASES:
+            row[f"{phase}_ms"] = ga.stats.phase_ns.get(phase, 0) / 1e6
+        results.append(row)
+
+    df = pd.DataFrame(results)
+    df.to_csv(csv_path('profile_results.csv'), index=False)
+
+    # Ábrázolás: a fázisok részesedése ponthalmaz-méretenként
+    plt.figure(figsize=(10, 6))
+    positions = np.arange(len(df))
+    bottom = np.zeros(len(df))
+    for phase in PHASES:
+        share = df[f"{phase}_ms"].to_numpy() / df['total_ms'].to_numpy() * 100
+        if share.any():
+            plt.bar(positions, share, bottom=bottom, label=phase)
+            bottom += share
+    plt.xticks(positions, [str(n) for n in df['n_points']])
+    plt.title(f"A futási idő megoszlása fázisonként ({generations} generáció)")
+    plt.xlabel("Pontok száma")
+    plt.ylabel("Részesedés a futási időből (%)")
+    plt.legend()
+    plt.grid(True, axis='y', alpha=0.3)
+    plt.savefig(results_path('profile_phases.png'), dpi=150)
+    plt.close()
+
+    for row in results:
+        shares = ", ".join(f"{phase} {row[f'{phase}_ms'] / row['total_ms']:.0%}"
+                           for phase in PHASES if row[f'{phase}_ms'] > 0)
+        print(f"    {row['n_points']} pont: {row['total_ms']:.1f} ms ({shares})")
+    print("  Kész. Eredmények mentve.")
+
+
 def main():
+    global WORKERS, BASE_SEED
     parser = argparse.ArgumentParser(description="Részletes kiértékelő szkript.")
     parser.add_argument('--all', action='store_true', help="Minden teszt futtatása")
     parser.add_argument('--scalability', action='store_true', help="Skálázhatósági teszt")
@@ -599,15 +1499,36 @@ def main():
     parser.add_argument('--known-optimum', action='store_true', help="Ismert optimumú tesztesetek")
     parser.add_argument('--iteration-runtime', action='store_true', help="Futási idő vs. iterációszám")
     parser.add_argument('--parameter-variation', action='store_true', help="Paraméter variációk bemutatása")
+    parser.add_argument('--ground-truth', action='store_true', help="Összevetés az egzakt megoldással")
+    parser.add_argument('--selection', action='store_true', help="Szelekciós eljárások összehasonlítása")
+    parser.add_argument('--local-search', action='store_true', help="Memetikus lokális finomítás összehasonlítása")
+    parser.add_argument('--strategies', action='store_true', help="Optimalizáló motorok (GA, CMA-ES, DE) összehasonlítása")
+    parser.add_argument('--multiresolution', action='store_true', help="Többfelbontású fitnesz kiértékelés mérése")
+    parser.add_argument('--precision', action='store_true', help="float32 és float64 pontosság és sebesség összehasonlítása")
+    parser.add_argument('--online', action='store_true', help="Online (kötegenkénti) illesztés és a teljes újraoldás összevetése")
+    parser.add_argument('--warm-start', action='store_true', help="Meleg indítás vizsgálata képkocka-sorozaton")
+    parser.add_argument('--profile', action='store_true', help="A GA futási idejének fázisonkénti megoszlása")
+    parser.add_argument('--workers', type=int, default=1, help="Párhuzamos munkafolyamatok száma")
+    parser.add_argument('--seed', type=int, default=BASE_SEED, help="Alap seed a reprodukálható futtatásokhoz")
+    parser.add_argument('--max-points', type=int, default=5000, help="A skálázhatósági teszt legnagyobb ponthalmaza")
     
     args = parser.parse_args()
 
+    max_points = args.max_points
+    BASE_SEED = args.seed
+    cpu_count = os.cpu_count() or 1
+    if args.workers > cpu_count:
+        print(f"Figyelem: {args.workers} munkafolyamat helyett {cpu_count} (processzormagok száma), "
+              "hogy a futási idő mérését ne torzítsa a túlterhelés.")
+    WORKERS = max(1, min(args.workers, cpu_count))
+    del args.max_points, args.workers, args.seed
+
     if not any(vars(args).values()):
         print("Kérlek válassz legalább egy tesztet (pl. --all vagy --scalability)")
         return
 
     if args.all or args.scalability:
-        run_scalability_test()
+        run_scalability_test(max_points=max_points)
     
     if args.all or args.mutation:
         run_mutation_test()
@@ -626,6 +1547,33 @@ def main():
     
     if args.all or args.parameter_variation:
         run_parameter_variation_test()
+
+    if args.all or args.ground_truth:
+        run_ground_truth_test()
+
+    if args.all or args.selection:
+        run_selection_test()
+
+    if args.all or args.local_search:
+        run_local_search_test()
+
+    if args.all or args.strategies:
+        run_strategy_test()
+
+    if args.all or args.multiresolution:
+        run_multiresolution_test()
+
+    if args.all or args.precision:
+        run_precision_test()
+
+    if args.all or args.online:
+        run_online_test()
+
+    if args.all or args.warm_start:
+        run_warm_start_test()
+
+    if args.all or args.profile:
+        run_profile_test()
     
     print("\n" + "="*50)
     print("Minden kiválasztott teszt sikeresen lefutott!")
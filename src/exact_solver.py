@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from geometry import convex_hull
+
+# Relatív tűrés a "pont a körön belül van" vizsgálathoz
+CONTAIN_TOLERANCE = 1e-12
+# A körön kívüli pontok keresésének blokkméretei
+SCAN_MIN_CHUNK = 256
+SCAN_MAX_CHUNK = 65536
+
+
+def _circle_two(a, b):
+    """Az a és b pontokat átmérőként tartalmazó kör."""
+    center = (a + b) / 2
+    return center, np.hypot(*(a - center))
+
+
+def _circle_three(a, b, c):
+    """
+    Az a, b, c pontokon átmenő kör (körülírt kör).
+    Kollineáris pontoknál a legtávolabbi pontpárra illesztett kört adja vissza.
+    """
+    bx, by = b - a
+    cx, cy = c - a
+    d = 2 * (bx * cy - by * cx)
+    if abs(d) < 1e-12 * (bx * bx + by * by + cx * cx + cy * cy):
+        pairs = [(a, b), (a, c), (b, c)]
+        return max((_circle_two(p, q) for p, q in pairs), key=lambda circle: circle[1])
+    b_sq = bx * bx + by * by
+    c_sq = cx * cx + cy * cy
+    ux = (cy * b_sq - by * c_sq) / d
+    uy = (bx * c_sq - cx * b_sq) / d
+    return a + np.array([ux, uy]), np.hypot(ux, uy)
+
+
+def _first_outside(points, start, stop, center, radius):
+    """
+    Az első olyan pont indexe a `points[start:stop]` szeletben, amely a körön kívül esik.
+    Ha nincs ilyen, -1-et ad vissza. A keresés vektorizált, növekvő méretű
+    blokkokban halad, így a közeli találat olcsó marad.
+    """
+    limit = (radius * (1 + CONTAIN_TOLERANCE)) ** 2 + CONTAIN_TOLERANCE
+    chunk = SCAN_MIN_CHUNK
+    while start < stop:
+        end = min(stop, start + chunk)
+        dx = points[start:end, 0] - center[0]
+        dy = points[start:end, 1] - center[1]
+        outside = dx * dx + dy * dy > limit
+        idx = np.argmax(outside)
+        if outside[idx]:
+            return start + idx
+        start = end
+        chunk = min(2 * chunk, SCAN_MAX_CHUNK)
+    return -1
+
+
+def welzl_circle(points, shuffle=True):
+    """
+    A legkisebb befoglaló kör meghatározása Welzl randomizált algoritmusával.
+
+    Az algoritmus nem rekurzív: a klasszikus háromszintű inkrementális
+    (move-to-front nélküli) változatot valósítja meg, a körön kívüli pontok
+    keresése pedig vektorizált. Véletlen sorrendben a várható futási idő
+    lineáris, és millió pontos bemeneten sem ütközik a rekurziós korlátba.
+
+    Args:
+        points (np.ndarray): (N, 2) alakú ponthalmaz.
+        shuffle (bool): Véletlen sorrendbe rendezze-e a pontokat (a várható
+                        lineáris futási időhöz szükséges).
+
+    Returns:
+        tuple: (cx, cy, r) a legkisebb befoglaló kör paraméterei.
+    """
+    points = np.asarray(points, dtype=float)
+    if len(points) == 0:
+        raise ValueError("Üres ponthalmazra nem illeszthető kör.")
+    if shuffle:
+        points = points[np.random.permutation(len(points))]
+    if len(points) == 1:
+        return points[0, 0], points[0, 1], 0.0
+
+    n = len(points)
+    center, radius = _circle_two(points[0], points[1])
+    # Minden szinten csak az utolsó javítás utáni pontokat kell tovább vizsgálni,
+    # mert az új kör az addig feldolgozott pontokat már tartalmazza.
+    i = _first_outside(points, 2, n, center, radius)
+    while i >= 0:
+        # Az i-edik pont a körön van: kör az első i pontra, p-vel a határon
+        p = points[i]
+        center, radius = p.copy(), 0.0
+        j = _first_outside(points, 0, i, center, radius)
+        while j >= 0:
+            # A j-edik pont is a határon van
+            q = points[j]
+            center, radius = _circle_two(p, q)
+            k = _first_outside(points, 0, j, center, radius)
+            while k >= 0:
+                center, radius = _circle_three(p, q, points[k])
+                k = _first_outside(points, k + 1, j, center, radius)
+            j = _first_outside(points, j + 1, i, center, radius)
+        i = _first_outside(points, i + 1, n, center, radius)
+
+    return center[0], center[1], radius
+
+
+class ExactCircleSolver:
+    """
+    Egzakt megoldó a legkisebb befoglaló kör problémára (Welzl algoritmus).
+
+    Az interfész a `CircleGA`-t követi: a `run()` a (cx, cy, r) tömböt és egy
+    (itt egyelemű) fitnesz előzmény listát ad vissza, így a két motor
+    egymással felcserélhető.
+    """
+    def __init__(self, points, use_hull=True):
+        self.points = points
+        self.use_hull = use_hull
+        self.fitness_history = []
+
+    def run(self):
+        """Kiszámítja a legkisebb befoglaló kört."""
+        points = convex_hull(self.points) if self.use_hull else self.points
+        best_circle = np.array(welzl_circle(points))
+        self.fitness_history = [best_circle[2]]
+        return best_circle, self.fitness_history
@@ -0,0 +1,367 @@
+# -*- coding: utf-8 -*-
+import atexit
+import math
+import os
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+# A Numba opcionális: ha nincs telepítve, a NumPy megvalósítást használjuk
+try:
+    import numba
+    from numba import prange
+except ImportError:
+    numba = None
+    prange = range
+
+# A körön kívül eső pontok büntetésének súlya
+PENALTY_WEIGHT = 10.0
+
+# A választható fitnesz számítási megvalósítások
+FITNESS_BACKENDS = ('numpy', 'numba')
+
+
+# Ennyi (egyed, pont) pár alatt a szálak indítása többe kerül, mint amennyit
+# nyerünk, ezért sorosan számolunk. Az 500 000 a fejlesztői gépen végzett
+# mérésekből (`evaluation.py --scalability`, `measure_parallel_threshold`) származó
+# alapérték: ott a megtérülési pont 1e5 és 1e6 pár között volt, gépenként
+# eltérően. Pontosabb értékhez a `population_fitness` `parallel_min_pairs`
+# paramétere, vagy az adott gépen mért és megjegyzett érték
+# (`calibrate_parallel_threshold`) használható.
+PARALLEL_MIN_PAIRS = 500_000
+
+# A `parallel_min_pairs=None` esetén használt küszöb (lásd `calibrate_parallel_threshold`)
+_parallel_min_pairs = PARALLEL_MIN_PAIRS
+
+# Egy (egyed, pont) párra eső munkamemória bájtban a blokkos kiértékelésnél:
+# a négyzetes távolság/túllógás és a dy float64 tömbje, valamint a bool maszk.
+# float32 pontoknál és populációnál a két tömb fele akkora (lásd `points_per_block`).
+BYTES_PER_PAIR = 2 * 8 + 1
+
+
+def points_per_block(population_size, memory_budget_mb, itemsize=8):
+    """
+    Meghatározza, hány pont fér egy blokkba a megadott memóriakereten belül.
+
+    Args:
+        population_size (int): A populáció mérete.
+        memory_budget_mb (float): A fitnesz számítás átmeneti tömbjeire szánt memória (MB).
+        itemsize (int): Az átmeneti tömbök elemmérete bájtban (float64: 8, float32: 4).
+
+    Returns:
+        int: A blokkonként feldolgozott pontok száma (legalább 1).
+    """
+    budget_bytes = memory_budget_mb * 1024 * 1024
+    bytes_per_pair = BYTES_PER_PAIR - 2 * (8 - itemsize)
+    return max(1, int(budget_bytes // (max(1, population_size) * bytes_per_pair)))
+
+
+def _block_penalty(population, points, weights=None):
+    """
+    A körön kívül eső pontok túllógásának összege egyedenként egy ponthalmaz-blokkra.
+    A négyzetes távolságokat hasonlítjuk, gyököt csak a büntetett pontoknál vonunk.
+
+    A populáció (..., P, 3), a pontok (..., N, 2) alakúak lehetnek; a `weights`
+    (..., N) alakú súlyokkal (pl. 0/1 érvényességi maszk) szorozzuk a túllógást.
+    A távolságok a bemenet típusában (pl. float32) készülnek, az összegzés
+    viszont mindig float64 pontosságú.
+    """
+    cx = population[..., 0:1]
+    cy = population[..., 1:2]
+    r = population[..., 2:3]
+    px = points[..., None, :, 0]
+    py = points[..., None, :, 1]
+
+    # A négyzetes távolságot helyben számoljuk, hogy kevés átmeneti tömb keletkezzen
+    dist_sq = px - cx
+    dist_sq *= dist_sq
+    dy = py - cy
+    dy *= dy
+    dist_sq += dy
+    del dy
+
+    # Csak a körön kívüli pontoknál vonunk gyököt, a többi túllógása 0
+    outside = dist_sq > r * r
+    excess = dist_sq
+    excess *= outside
+    np.sqrt(excess, out=excess, where=outside)
+    excess -= r
+    # A kerekítési határesetekben se legyen negatív a túllógás
+    np.maximum(excess, 0.0, out=excess)
+    if weights is not None:
+        excess *= weights[..., None, :]
+    return excess.sum(axis=-1, dtype=np.float64)
+
+
+def _serial_penalty(population, points, block_size):
+    """A büntetések összege egyedenként, a pontokat `block_size` méretű blokkokban bejárva."""
+    if block_size >= len(points):
+        return _block_penalty(population, points)
+    penalty = np.zeros(len(population))
+    for start in range(0, len(points), block_size):
+        penalty += _block_penalty(population, points[start:start + block_size])
+    return penalty
+
+
+def _threaded_penalty(population, points, block_size, n_threads):
+    """A büntetések összege egyedenként; a pontok egyenlő szeleteit külön szálak dolgozzák fel."""
+    bounds = np.linspace(0, len(points), n_threads + 1).astype(int)
+    slices = [points[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+    return sum(_thread_pool(n_threads).map(lambda chunk: _serial_penalty(population, chunk, block_size), slices))
+
+
+# Szálkészletek a szálszám szerint (az első használatkor jönnek létre, a
+# folyamat végén a `shutdown_thread_pools` állítja le őket)
+_thread_pools = {}
+
+
+def _thread_pool(n_threads):
+    """Az adott szálszámú, újrahasznosított szálkészlet."""
+    if n_threads not in _thread_pools:
+        _thread_pools[n_threads] = ThreadPoolExecutor(max_workers=n_threads)
+    return _thread_pools[n_threads]
+
+
+def shutdown_thread_pools(wait=True):
+    """
+    Leállítja a szálas fitnesz számítás szálkészleteit. A folyamat végén
+    automatikusan lefut; hosszan futó folyamatban a szálak hamarabb is
+    felszabadíthatók vele, a következő szálas számítás újakat indít.
+    """
+    pools = list(_thread_pools.values())
+    _thread_pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=wait)
+
+
+atexit.register(shutdown_thread_pools)
+
+
+def resolve_threads(n_threads):
+    """A szálak száma: 0 vagy None esetén a processzormagok száma, egyébként legalább 1."""
+    if not n_threads:
+        return os.cpu_count() or 1
+    return max(1, int(n_threads))
+
+
+def _fused_fitness(population, points, out):
+    """
+    Egyesített fitnesz ciklus: a távolság, az összehasonlítás és a büntetés
+    összegzése egyetlen ciklusban, átmeneti tömbök nélkül. A Numba az egyedek
+    szerinti külső ciklust párhuzamosítja (`prange`).
+    """
+    for i in prange(population.shape[0]):
+        cx = population[i, 0]
+        cy = population[i, 1]
+        r = population[i, 2]
+        r_sq = r * r
+        penalty = 0.0
+        for j in range(points.shape[0]):
+            dx = points[j, 0] - cx
+            dy = points[j, 1] - cy
+            dist_sq = dx * dx + dy * dy
+            if dist_sq > r_sq:
+                excess = math.sqrt(dist_sq) - r
+                if excess > 0.0:
+                    penalty += excess
+        out[i] = r + PENALTY_WEIGHT * penalty
+
+
+# A lefordított Numba kernel (az első használatkor fordítjuk)
+_fused_fitness_jit = None
+
+
+def resolve_backend(backend):
+    """
+    Ellenőrzi a fitnesz backend nevét. Ha a 'numba' backendet kérik, de a Numba
+    nincs telepítve, figyelmeztetést ad, és a 'numpy' backendet adja vissza.
+    """
+    if backend not in FITNESS_BACKENDS:
+        raise ValueError(f"Ismeretlen fitnesz backend: {backend} (lehetséges: {', '.join(FITNESS_BACKENDS)})")
+    if backend == 'numba' and numba is None:
+        warnings.warn("A Numba nincs telepítve, a fitneszt a NumPy backend számolja.", RuntimeWarning, stacklevel=3)
+        return 'numpy'
+    return backend
+
+
+def numba_population_fitness(population, points):
+    """
+    A `population_fitness` Numba backendje: párhuzamos, egyesített ciklus,
+    amely nem hoz létre (populáció x pontok) méretű átmeneti tömböket.
+    Csak telepített Numba mellett használható.
+    """
+    global _fused_fitness_jit
+    if _fused_fitness_jit is None:
+        _fused_fitness_jit = numba.njit(parallel=True, cache=True)(_fused_fitness)
+    # A float32 bemenet float32 marad (a ciklus összegzője float64)
+    dtype = np.result_type(population, points, np.float32)
+    out = np.empty(len(population))
+    _fused_fitness_jit(np.ascontiguousarray(population, dtype=dtype), np.ascontiguousarray(points, dtype=dtype), out)
+    return out
+
+
+def population_fitness(population, points, memory_budget_mb=None, backend='numpy', n_threads=1,
+                       parallel_min_pairs=None):
+    """
+    A teljes populáció fitneszét (populáció x pontok) műveletekben számolja.
+
+    A fitnesz minden körre `r + 10 * sum(max(d - r, 0))`, ahol `d` a pontok
+    távolsága a kör középpontjától. Memóriakeret megadásakor a pontokat fix
+    méretű blokkokban dolgozzuk fel és a büntetést egyedenként összegezzük,
+    így a csúcsmemória nem nő a pontok számával.
+
+    Args:
+        population (np.ndarray): (P, 3) alakú tömb, soronként (cx, cy, r).
+        points (np.ndarray): (N, 2) alakú ponthalmaz.
+        memory_budget_mb (float, optional): Az átmeneti tömbökre szánt memória (MB).
+                                            None esetén egyetlen blokkban számolunk.
+        backend (str): 'numpy' (vektorizált, blokkos) vagy 'numba' (lefordított,
+                       párhuzamos ciklus; a memóriakeretet nem használja, mert
+                       nincsenek átmeneti tömbök). Lásd `resolve_backend`.
+        n_threads (int): A NumPy backend szálainak száma. A pontokat a szálak
+                         között egyenlő szeletekre osztjuk (a memóriakeretet is),
+                         a NumPy a nehéz műveletekben elengedi a GIL-t.
+        parallel_min_pairs (int, optional): Ennyi (egyed, pont) pár alatt szálak
+                         helyett sorosan számolunk. None esetén a
+                         `calibrate_parallel_threshold`-dal mért érték, ennek
+                         hiányában `PARALLEL_MIN_PAIRS`.
+
+    Returns:
+        np.ndarray: (P,) alakú fitnesz tömb (kisebb = jobb).
+    """
+    if backend == 'numba' and numba is not None:
+        return numba_population_fitness(population, points)
+
+    n_points = len(points)
+    n_threads = min(n_threads, n_points)
+    if parallel_min_pairs is None:
+        parallel_min_pairs = _parallel_min_pairs
+    if n_threads > 1 and len(population) * n_points < parallel_min_pairs:
+        n_threads = 1
+
+    if memory_budget_mb is None:
+        block_size = n_points
+    else:
+        itemsize = np.result_type(population, points).itemsize
+        block_size = points_per_block(len(population), memory_budget_mb / n_threads, itemsize)
+
+    if n_threads <= 1:
+        penalty = _serial_penalty(population, points, block_size)
+    else:
+        penalty = _threaded_penalty(population, points, block_size, n_threads)
+
+    return population[:, 2].astype(np.float64) + PENALTY_WEIGHT * penalty
+
+
+class FitnessOptions:
+    """
+    A motorok fitnesz számításának beállításai (lásd `population_fitness`).
+
+    Args:
+        memory_budget_mb (float): Az átmeneti tömbök memóriakerete (MB), None = korlátlan.
+        backend (str): 'numpy' vagy 'numba'; telepített Numba hiányában a 'numba'
+                       figyelmeztetéssel a NumPy backendre vált.
+        n_threads (int): A NumPy backend szálainak száma (0 = minden processzormag).
+        parallel_min_pairs (int, optional): Ennyi (egyed, pont) pár alatt sorosan
+                       számolunk (None = `calibrate_parallel_threshold` mért értéke,
+                       ennek hiányában `PARALLEL_MIN_PAIRS`).
+    """
+    # A motorok egyedi kulcsszavas paraméterei és a nekik megfelelő beállítások
+    PARAMS = {'memory_budget_mb': 'memory_budget_mb', 'backend': 'backend', 'n_threads': 'n_threads',
+              'parallel_min_pairs': 'parallel_min_pairs'}
+
+    def __init__(self, memory_budget_mb=8, backend='numpy', n_threads=1, parallel_min_pairs=None):
+        self.memory_budget_mb = memory_budget_mb
+        self.backend = resolve_backend(backend)
+        self.n_threads = resolve_threads(n_threads)
+        self.parallel_min_pairs = parallel_min_pairs
+
+    def evaluate(self, population, points):
+        """A populáció fitnesze a ponthalmazon, ezekkel a beállításokkal."""
+        return population_fitness(population, points, self.memory_budget_mb, self.backend, self.n_threads,
+                                  self.parallel_min_pairs)
+
+
+def measure_parallel_threshold(n_threads=None, population_size=100, memory_budget_mb=8, repeats=5,
+                               point_counts=(100, 300, 1000, 3000, 10000, 30000, 100000)):
+    """
+    Megméri, mekkora munkától (egyed x pont pár) gyorsabb a szálas fitnesz számítás a sorosnál.
+
+    Returns:
+        tuple: (küszöb (pár, vagy None, ha egyik méretnél sem gyorsabb), mérések listája
+               (pontszám, párok, soros idő, szálas idő) sorokkal)
+    """
+    n_threads = resolve_threads(n_threads)
+    population = np.random.rand(population_size, 3)
+    measurements = []
+    threshold = None
+    for n_points in point_counts:
+        points = np.random.rand(n_points, 2)
+        timings = []
+        # A szálas változatot a `PARALLEL_MIN_PAIRS` küszöbtől függetlenül mérjük
+        for threads in (1, n_threads):
+            block_size = points_per_block(population_size, memory_budget_mb / threads)
+            start = time.perf_counter()
+            for _ in range(repeats):
+                if threads > 1:
+                    _threaded_penalty(population, points, block_size, threads)
+                else:
+                    _serial_penalty(population, points, block_size)
+            timings.append((time.perf_counter() - start) / repeats)
+        pairs = population_size * n_points
+        measurements.append((n_points, pairs, timings[0], timings[1]))
+        if threshold is None and n_threads > 1 and timings[1] < timings[0]:
+            threshold = pairs
+    return threshold, measurements
+
+
+def calibrate_parallel_threshold(n_threads=None, **kwargs):
+    """
+    Megméri a szálas fitnesz számítás megtérülési küszöbét ezen a gépen (lásd
+    `measure_parallel_threshold`), és megjegyzi: ettől kezdve a folyamatban a
+    `population_fitness` ezt használja, ha a hívó nem ad meg saját küszöböt.
+    Ha a szálas számítás egyik mért méretnél sem gyorsabb, a szálakat nem használjuk.
+
+    Returns:
+        float: A megjegyzett küszöb (pár).
+    """
+    global _parallel_min_pairs
+    threshold, _ = measure_parallel_threshold(n_threads, **kwargs)
+    _parallel_min_pairs = math.inf if threshold is None else threshold
+    return _parallel_min_pairs
+
+
+def batch_population_fitness(populations, points, valid=None, memory_budget_mb=None):
+    """
+    Több független ponthalmaz populációinak fitneszét számolja egyszerre.
+
+    Args:
+        populations (np.ndarray): (B, P, 3) alakú tömb, ponthalmazonként egy populáció.
+        points (np.ndarray): (B, N, 2) alakú, kitöltött (padded) ponthalmazok.
+        valid (np.ndarray, optional): (B, N) alakú bool maszk a valódi pontokról;
+                                      a kitöltő pontok nem kapnak büntetést.
+        memory_budget_mb (float, optional): Az átmeneti tömbökre szánt memória (MB).
+
+    Returns:
+        np.ndarray: (B, P) alakú fitnesz tömb (kisebb = jobb).
+    """
+    n_clouds, population_size = populations.shape[:2]
+    n_points = points.shape[1]
+    if memory_budget_mb is None:
+        cloud_block, point_block = n_clouds, n_points
+    else:
+        # Először egész ponthalmazokat csoportosítunk; ha egy sem fér a keretbe,
+        # ponthalmazonként a pontokat is blokkokra bontjuk.
+        point_block = min(n_points, points_per_block(population_size, memory_budget_mb))
+        cloud_block = max(1, points_per_block(population_size * n_points, memory_budget_mb))
+
+    penalty = np.zeros((n_clouds, population_size))
+    for c_start in range(0, n_clouds, cloud_block):
+        clouds = slice(c_start, c_start + cloud_block)
+        for p_start in range(0, n_points, point_block):
+            block = slice(p_start, p_start + point_block)
+            block_valid = None if valid is None else valid[clouds, block]
+            penalty[clouds] += _block_penalty(populations[clouds], points[clouds, block], block_valid)
+
+    return populations[..., 2] + PENALTY_WEIGHT * penalty
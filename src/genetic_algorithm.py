@@ -1,21 +1,286 @@
 # -*- coding: utf-8 -*-
+import time
+from collections import OrderedDict
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.patches import Circle
 
 # A pontgenerátor importálása a másik fájlból
-from point_generator import generate_point_cloud, visualize_point_cloud
+from point_generator import generate_point_cloud
+from fitness import FitnessOptions
+from geometry import convex_hull, circle_estimates, diameter
+from selection import select_indices
+from local_search import refine_circle, LocalSearchOptions
+from telemetry import PhaseTimer, NULL_TIMER, RunStats, generation_record
+# A leállási okok (STOP_*) a korábbi importok kedvéért innen is elérhetők
+from stopping import StopCriteria, STOP_GENERATIONS, STOP_STALL, STOP_TIME_BUDGET, STOP_TARGET_FITNESS
+
+
+class FitnessHistory(list):
+    """
+    A generációnkénti legjobb fitnesz értékek listája.
+    A `stop_reason` attribútum megadja, melyik leállási feltétel teljesült, az
+    `evaluations` pedig generációnként az addig elvégzett fitnesz kiértékelések
+    összesített számát (ha a motor rögzíti).
+    """
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.stop_reason = None
+        self.evaluations = []
+
+
+def crossover(parents, crossover_rate):
+    """
+    Egypontos keresztezés az egymást követő párokon (0-1, 2-3, ...).
+
+    A döntéseket és vágási pontokat a teljes populációra egyszerre húzzuk.
+    A függvény tetszőleges vezető dimenziókkal működik, így (..., P, 3) alakú
+    tömbön több független populációt is keresztez egyszerre. Páratlan
+    populációméretnél az utolsó egyed változatlanul kerül át.
+
+    Args:
+        parents (np.ndarray): (..., P, 3) alakú szülő populáció(k).
+        crossover_rate (float): A keresztezés valószínűsége páronként.
+
+    Returns:
+        np.ndarray: Az utódok, a szülőkkel azonos alakban.
+    """
+    offspring = parents.copy()
+    n_pairs = parents.shape[-2] // 2
+    first = offspring[..., 0:2 * n_pairs:2, :]
+    second = offspring[..., 1:2 * n_pairs:2, :]
+
+    # Páronként: történik-e keresztezés, és melyik génnél van a vágási pont
+    pair_shape = parents.shape[:-2] + (n_pairs,)
+    do_crossover = np.random.rand(*pair_shape) < crossover_rate
+    crossover_point = np.random.randint(1, 3, pair_shape)
+    swap = (np.arange(3) >= crossover_point[..., None]) & do_crossover[..., None]
+
+    # A vágási pont utáni gének cseréje a két szülő között
+    swapped = np.where(swap, second, first)
+    second[...] = np.where(swap, first, second)
+    first[...] = swapped
+    return offspring
+
+
+def mutate(offspring, mutation_rate, sigmas, lower, upper):
+    """
+    Gauss-mutáció: minden egyednél `mutation_rate` valószínűséggel egy
+    véletlen gént (cx, cy vagy r) módosítunk, majd a határokra vágunk.
+
+    A véletlen számokat a teljes populációra egyszerre húzzuk. A `sigmas`,
+    `lower` és `upper` a (..., P, 3) alakra szórható (broadcast) tömbök,
+    így populációnként eltérő tartományok is megadhatók.
+
+    Args:
+        offspring (np.ndarray): (..., P, 3) alakú populáció(k), helyben módosul.
+        mutation_rate (float): A mutáció valószínűsége egyedenként.
+        sigmas (np.ndarray): A mutációs lépés szórása génenként.
+        lower (np.ndarray): A gének alsó határai.
+        upper (np.ndarray): A gének felső határai.
+
+    Returns:
+        np.ndarray: A mutált populáció(k).
+    """
+    individual_shape = offspring.shape[:-1]
+    do_mutate = np.random.rand(*individual_shape) < mutation_rate
+    genes = np.random.randint(0, 3, individual_shape)
+
+    gene_sigmas = np.take_along_axis(np.broadcast_to(sigmas, offspring.shape), genes[..., None], axis=-1)
+    steps = np.random.normal(0, 1, individual_shape + (1,)) * gene_sigmas
+    steps *= do_mutate[..., None]
+    delta = np.zeros_like(offspring)
+    np.put_along_axis(delta, genes[..., None], steps, axis=-1)
+    offspring += delta
+
+    # Biztosítjuk, hogy az értékek a tartományon belül maradjanak
+    np.clip(offspring, lower, upper, out=offspring)
+    return offspring
+
+
+class MultiresolutionOptions:
+    """
+    A `CircleGA` többfelbontású fitneszének beállításai.
+
+    A fitneszt kezdetben csak egy `sample_size` méretű részmintán számoljuk,
+    amely mindig tartalmazza a konvex burok csúcsait, így a minta legkisebb
+    befoglaló köre azonos a teljes ponthalmazéval. Ha `stall_generations`
+    generáción át nincs javulás, a minta `sample_growth`-szorosára nő; az utolsó
+    `full_resolution_fraction` résznyi generáció a teljes ponthalmazon fut.
+    """
+    # A `CircleGA` egyedi kulcsszavas paraméterei és a nekik megfelelő beállítások
+    PARAMS = {'sample_size': 'sample_size', 'sample_growth': 'sample_growth',
+              'resolution_stall_generations': 'stall_generations',
+              'full_resolution_fraction': 'full_resolution_fraction'}
+
+    def __init__(self, sample_size=1024, sample_growth=4, stall_generations=10, full_resolution_fraction=0.2):
+        self.sample_size = sample_size
+        self.sample_growth = sample_growth
+        self.stall_generations = stall_generations
+        self.full_resolution_fraction = full_resolution_fraction
+
+
+def group_options(options_class, options, params, enabled=True, **values):
+    """
+    Egy beállításcsoport a motorok konstruktorainak. A csoport objektumként
+    (`options`) vagy az egyes beállítások egyedi kulcsszavas paramétereivel is
+    megadható (lásd az osztály `PARAMS` leképezését); ez utóbbiakat kivesszük a
+    `params` szótárból.
+
+    Args:
+        options_class (type): A csoport osztálya (például `stopping.StopCriteria`).
+        options: A megadott csoport objektum, vagy None.
+        params (dict): A konstruktor további kulcsszavas paraméterei, helyben módosul.
+        enabled (bool): False esetén (kikapcsolt, elhagyható csoport) None az eredmény;
+                        az egyedi paramétereket ekkor is kivesszük.
+        **values: A csoport további beállításai (például a lokális keresés módszere).
+
+    Returns:
+        A csoport objektuma, vagy None.
+    """
+    given = [name for name in options_class.PARAMS if name in params]
+    values.update({options_class.PARAMS[name]: params.pop(name) for name in given})
+    if options is not None:
+        if given:
+            raise TypeError(f"A(z) {', '.join(given)} paraméter nem adható meg a {options_class.__name__} "
+                            f"objektum mellett")
+        return options
+    return options_class(**values) if enabled else None
+
+
+def reject_unknown_params(params):
+    """TypeError, ha a konstruktor ismeretlen kulcsszavas paramétert kapott."""
+    if params:
+        raise TypeError(f"Ismeretlen paraméter(ek): {', '.join(params)}")
+
 
 class CircleGA:
     """
     Genetikus algoritmus a legkisebb befoglaló kör megkeresésére.
+
+    A beállítások csoportjai; a csoportok objektumként, vagy az egyes
+    beállítások egyedi kulcsszavas paramétereivel is megadhatók (például
+    `stopping=StopCriteria(stall_generations=20)` vagy `stall_generations=20`):
+    - `stopping`: leállási feltételek (`stopping.StopCriteria`: `stall_generations`,
+      `tolerance`, `time_budget`, `target_fitness`),
+    - `evaluation`: fitnesz számítás (`fitness.FitnessOptions`: `memory_budget_mb`,
+      `backend`, `n_threads`, `parallel_min_pairs`),
+    - `local_search`: memetikus lokális keresés (`local_search.LocalSearchOptions`,
+      vagy a módszer neve a `local_search_interval`, `local_search_elite`,
+      `local_search_iterations` paraméterekkel; None = kikapcsolva),
+    - `multiresolution`: többfelbontású fitnesz (`MultiresolutionOptions`, vagy
+      True a `sample_size`, `sample_growth`, `resolution_stall_generations`,
+      `full_resolution_fraction` paraméterekkel; None/False = kikapcsolva).
+
+    Leállás:
+    A `generations` a generációk maximális száma; a futás korábban is leáll, ha
+    a `stopping` valamelyik feltétele teljesül. Többfelbontású módban a
+    célfitneszt és a stagnálást csak a teljes ponthalmazon vizsgáljuk.
+
+    Fitnesz:
+    A keresztezés és mutáció által nem módosított egyedek fitneszét a szülőtől
+    örököljük, így azokat nem értékeljük ki újra. `fitness_cache_size` > 0 esetén
+    egy korlátos méretű LRU gyorsítótár is tárolja a (cx, cy, r) szerinti
+    fitneszeket. Minden fitnesz számítás az `evaluation` beállításaival fut.
+    A pontok és az egyedek típusát a `dtype` adja meg (alapértelmezésben a pontok
+    lebegőpontos típusa, egyébként float64). `np.float32` esetén feleakkora a
+    fitnesz számítás memóriaforgalma; a büntetések összegzése float64 marad.
+
+    Szelekció:
+    Az eljárás a `selection` paraméterrel választható ('roulette', 'tournament',
+    'sus', 'rank'); `elitism` > 0 esetén a legjobb `elitism` egyed változatlanul
+    kerül át a következő generációba.
+
+    Lokális keresés:
+    `interval` generációnként a legjobb `elite` egyedet determinisztikus lokális
+    kereséssel finomítjuk (lásd `local_search.py`), és a finomított kör a
+    populációban az eredeti helyére kerül.
+
+    Inicializálás:
+    `initialization='smart'` esetén a populáció `seed_fraction` része olcsó
+    becslésekből indul (lásd `geometry.circle_estimates`), a többi véletlenszerű
+    marad a diverzitásért. Ilyenkor a sugár tartománya is szűkebb: alsó korlátja
+    a ponthalmaz átmérőjének fele (a konvex burkon forgó tolómérővel számolva,
+    lásd `geometry.diameter`; ez legalább `max_dim / 2`), felső korlátja a
+    befoglaló téglalap köré írt kör sugara.
+
+    Többfelbontású mód:
+    Lásd `MultiresolutionOptions`. Mintaváltáskor a populációt újraértékeljük, a
+    gyorsítótárat ürítjük, a végeredményt pedig minden ponton ellenőrizzük, és ha
+    kell, a sugarat növeljük.
+
+    Meleg indítás:
+    Lassan változó ponthalmazok sorozatán (lásd `tracking.py`) az `initial_circle`
+    egy korábbi legjobb kör, az `initial_population` egy korábbi populáció. A
+    populáció első `seed_fraction` része a korábbi kör körül indul, a korábbi
+    populáció egyedei (a határokra vágva) a populáció elejére kerülnek. A keresési
+    tartomány a korábbi kör alapján szűkül: a sugár felső korlátja a korábbi
+    középpont legtávolabbi pontjának távolsága (R), alsó korlátja `max_dim / 2`,
+    és mivel az optimális c* középpontra |c* - c|² <= R² - r*², a középpont a
+    korábbi középpont körüli sqrt(R² - (max_dim/2)²) sugarú négyzetben keresendő.
+    Kis elmozdulásnál ez a tartomány, és vele a mutációs lépésköz, a befoglaló
+    téglalapnál jóval kisebb.
+
+    Telemetria:
+    A futás telemetriáját a `stats` attribútum (`telemetry.RunStats`) tartalmazza.
+    `profile=True` esetén a `run()` fázisonként (fitnesz, lokális keresés,
+    mintaváltás, szelekció, keresztezés, mutáció, könyvelés) összesíti az időt
+    `perf_counter_ns`-sel. A `callbacks` függvényeit minden generáció végén
+    `callback(ga, record)` alakban hívjuk, ahol a `record` a generáció
+    statisztikái (lásd `telemetry.generation_record`); a haladás kiírása is ilyen
+    visszahívás (`telemetry.ProgressPrinter`). Profilozás és visszahívások nélkül
+    a mérési pontok üres hívások, generációs statisztika nem készül.
     """
-    def __init__(self, points, population_size=100, mutation_rate=0.1, crossover_rate=0.8, generations=200):
+    def __init__(self, points, population_size=100, mutation_rate=0.1, crossover_rate=0.8, generations=200,
+                 use_hull=False, fitness_cache_size=0, selection='roulette', tournament_size=2, elitism=0,
+                 initialization='random', seed_fraction=0.1, dtype=None, initial_circle=None,
+                 initial_population=None, stopping=None, evaluation=None, local_search=None,
+                 multiresolution=None, callbacks=None, profile=False, **options):
+        # Beállításcsoportok (objektumként vagy egyedi paraméterekkel)
+        self.stopping = group_options(StopCriteria, stopping, options)
+        self.evaluation = group_options(FitnessOptions, evaluation, options)
+        # A lokális keresés a módszer nevével, a többfelbontású mód True-val is bekapcsolható
+        if isinstance(local_search, LocalSearchOptions):
+            self.local_search = group_options(LocalSearchOptions, local_search, options)
+        else:
+            self.local_search = group_options(LocalSearchOptions, None, options, enabled=bool(local_search),
+                                              method=local_search)
+        if isinstance(multiresolution, MultiresolutionOptions):
+            self.multiresolution = group_options(MultiresolutionOptions, multiresolution, options)
+        else:
+            self.multiresolution = group_options(MultiresolutionOptions, None, options,
+                                                 enabled=bool(multiresolution))
+        reject_unknown_params(options)
+
+        # Konvex burok előfeldolgozás: a befoglaló kör csak a burok csúcsaitól függ,
+        # így a GA a belső pontok nélkül, jóval kevesebb ponton is futhat.
+        if dtype is None:
+            dtype = points.dtype if np.issubdtype(points.dtype, np.floating) else np.float64
+        self.dtype = np.dtype(dtype)
+        points = np.asarray(points, dtype=self.dtype)
+        self.n_input_points = len(points)
+        if use_hull:
+            points = convex_hull(points)
         self.points = points
+        self.all_points = points
+        self.reduction_ratio = self.n_input_points / max(1, len(points))
         self.population_size = population_size
         self.mutation_rate = mutation_rate
         self.crossover_rate = crossover_rate
         self.generations = generations
+
+        # Szelekció és elitizmus
+        self.selection = selection
+        self.tournament_size = tournament_size
+        self.elitism = elitism
+
+        # A lokális keresés kiértékelései; többfelbontású módban a kiértékelés a `self.points` részmintán fut
+        self.local_search_evaluations = 0
+        self._hull_points = None
+
+        # Fitnesz gyorsítótár (LRU) és a kiértékelési statisztikák
+        self.fitness_cache_size = fitness_cache_size
+        self._fitness_cache = OrderedDict()
+        self.evaluation_stats = []
+        self.evaluations_total = 0
         
         # A populáció inicializálása a ponthalmaz határain belül
         min_coords = points.min(axis=0)
@@ -25,103 +290,325 @@ class CircleGA:
         
         # A sugár lehetséges tartományának becslése
         max_dim = max(self.x_range[1] - self.x_range[0], self.y_range[1] - self.y_range[0])
-        self.r_range = (max_dim / 10, max_dim)
+        self.initialization = initialization
+        self.seed_fraction = seed_fraction
+        if initialization == 'smart':
+            # A legkisebb befoglaló kör sugara legalább az átmérő (a legtávolabbi
+            # pontpár távolsága) fele, és legfeljebb a befoglaló téglalap köré írt kör sugara
+            self.r_range = (diameter(points) / 2, np.hypot(*(max_coords - min_coords)) / 2)
+        elif initialization == 'random':
+            self.r_range = (max_dim / 10, max_dim)
+        else:
+            raise ValueError(f"Ismeretlen inicializálás: {initialization} (lehetséges: random, smart)")
+
+        # Meleg indítás: a tartományok szűkítése a korábbi kör körül
+        self.initial_circle = None if initial_circle is None else np.asarray(initial_circle, dtype=float)
+        self.initial_population = initial_population
+        if self.initial_circle is not None:
+            self._narrow_ranges(self.initial_circle[:2], max_dim)
+
+        # Telemetria: visszahívások és fázisonkénti profilozás
+        self.callbacks = list(callbacks or [])
+        self.profile = profile
+        self.stats = RunStats()
 
         self.population = self._initialize_population()
-        self.fitness_history = [] # Fitnesz előzmények tárolása
+        self.fitness_history = FitnessHistory() # Fitnesz előzmények tárolása
+        # Az utoljára kiértékelt populáció és fitnesze (a `run()` végén a populáció
+        # már a ki nem értékelt utódokat tartalmazza), lásd `island_ga.py`
+        self.evaluated_population = None
+        self.evaluated_fitness = None
+        # A populáció ismert fitnesze: (örökölt fitnesz, módosult-e), lásd `run(resume=True)`
+        self._pending_fitness = None
 
     def _initialize_population(self):
         """Létrehozza a kezdeti populációt véletlenszerű körökből."""
-        population = np.zeros((self.population_size, 3))
+        population = np.zeros((self.population_size, 3), dtype=self.dtype)
         population[:, 0] = np.random.uniform(self.x_range[0], self.x_range[1], self.population_size) # cx
         population[:, 1] = np.random.uniform(self.y_range[0], self.y_range[1], self.population_size) # cy
         population[:, 2] = np.random.uniform(self.r_range[0], self.r_range[1], self.population_size) # r
+        if self.initialization == 'smart':
+            population[:self._n_seeded()] = self._seed_individuals()
+        if self.initial_circle is not None:
+            population[:self._n_seeded()] = self._warm_start_individuals()
+        if self.initial_population is not None:
+            previous = np.asarray(self.initial_population)[:self.population_size]
+            population[:len(previous)] = np.clip(previous, self._lower_bounds(), self._upper_bounds())
         return population
 
+    def _lower_bounds(self):
+        """A gének (cx, cy, r) alsó határai."""
+        return np.array([self.x_range[0], self.y_range[0], self.r_range[0]])
+
+    def _upper_bounds(self):
+        """A gének (cx, cy, r) felső határai."""
+        return np.array([self.x_range[1], self.y_range[1], self.r_range[1]])
+
+    def _narrow_ranges(self, center, max_dim):
+        """
+        A keresési tartomány szűkítése egy korábbi középpont körül.
+        A korábbi középpont körüli legkisebb lefedő sugár (R) felső korlát az
+        optimális sugárra, az optimális középpont pedig legfeljebb
+        sqrt(R² - r_min²) távolságra van a korábbi középponttól.
+        """
+        dist_sq = np.sum((self.points - center.astype(self.dtype)) ** 2, axis=1, dtype=np.float64)
+        r_upper = np.sqrt(dist_sq.max())
+        r_lower = min(max_dim / 2, r_upper)
+        margin = np.sqrt(max(r_upper ** 2 - r_lower ** 2, 0.0))
+        self.x_range = (max(self.x_range[0], center[0] - margin), min(self.x_range[1], center[0] + margin))
+        self.y_range = (max(self.y_range[0], center[1] - margin), min(self.y_range[1], center[1] + margin))
+        self.r_range = (r_lower, r_upper)
+
+    def _warm_start_individuals(self):
+        """
+        A korábbi kör körül indított egyedek: az első a korábbi középpont a
+        (biztosan lefedő) felső sugárkorláttal, a többi ennek mutációs szórású
+        zajjal perturbált másolata.
+        """
+        seed = np.array([self.initial_circle[0], self.initial_circle[1], self.r_range[1]])
+        seeds = np.tile(seed, (self._n_seeded(), 1))
+        seeds[1:] += np.random.normal(0, 1, seeds[1:].shape) * self._mutation_sigmas()
+        return np.clip(seeds, self._lower_bounds(), self._upper_bounds())
+
+    def _n_seeded(self):
+        """A becslésekből indított egyedek száma (legalább a becslések száma)."""
+        return min(self.population_size, max(4, int(self.seed_fraction * self.population_size)))
+
+    def _seed_individuals(self):
+        """
+        A becslésekből indított egyedek: először maguk a becslések, majd ezek
+        mutációs szórású zajjal perturbált másolatai.
+        """
+        estimates = circle_estimates(self.points)
+        n_seeded = self._n_seeded()
+        seeds = estimates[np.arange(n_seeded) % len(estimates)]
+        jitter = np.random.normal(0, 1, seeds.shape) * self._mutation_sigmas()
+        jitter[:len(estimates)] = 0
+        lower = self._lower_bounds()
+        upper = self._upper_bounds()
+        return np.clip(seeds + jitter, lower, upper)
+
+    def _fitness(self, individuals):
+        """
+        Az egyedek fitnesze az aktuális kiértékelési pontokon. Minden fitnesz számítás
+        ezen megy át, így az `evaluation` beállításai mindenhol érvényesek.
+        """
+        return self.evaluation.evaluate(individuals, self.points)
+
     def _calculate_fitness(self):
         """
         Kiértékeli minden egyed (kör) fitneszét a populációban.
-        A fitnesz a sugártól és a büntetéstől függ.
+        A fitnesz a sugártól és a büntetéstől függ, a teljes populációt
+        egyszerre, vektorizáltan számoljuk (lásd `fitness.population_fitness`).
+        Nagy ponthalmazoknál a pontokat a memóriakeretnek megfelelő blokkokban dolgozzuk fel.
         """
-        fitness_scores = np.zeros(self.population_size)
-        for i, individual in enumerate(self.population):
-            cx, cy, r = individual
-            
-            # Távolságok a kör középpontjától
-            distances = np.sqrt((self.points[:, 0] - cx)**2 + (self.points[:, 1] - cy)**2)
-            
-            # Büntetés a körön kívül eső pontokért
-            outside_points = distances[distances > r]
-            penalty = np.sum(outside_points - r) * 10 # A büntetés súlyozása
-            
-            # A fitnesz a sugár és a büntetés összege. A cél a minimalizálás.
-            # Kisebb érték = jobb fitnesz.
-            fitness_scores[i] = r + penalty
-            
+        # A fitnesz a sugár és a büntetés összege. A cél a minimalizálás.
+        # Kisebb érték = jobb fitnesz.
+        return self._fitness(self.population)
+
+    def _evaluate(self, individuals):
+        """
+        Kiértékeli a megadott egyedeket, az LRU gyorsítótár használatával.
+
+        Returns:
+            tuple: (fitnesz tömb, gyorsítótár találatok száma)
+        """
+        if self.fitness_cache_size <= 0:
+            return self._fitness(individuals), 0
+
+        fitness_scores = np.empty(len(individuals))
+        keys = [individual.tobytes() for individual in individuals]
+        misses = []
+        for i, key in enumerate(keys):
+            cached = self._fitness_cache.get(key)
+            if cached is None:
+                misses.append(i)
+            else:
+                self._fitness_cache.move_to_end(key)
+                fitness_scores[i] = cached
+
+        if misses:
+            fitness_scores[misses] = self._fitness(individuals[misses])
+            for i in misses:
+                self._fitness_cache[keys[i]] = fitness_scores[i]
+            while len(self._fitness_cache) > self.fitness_cache_size:
+                self._fitness_cache.popitem(last=False)
+        return fitness_scores, len(keys) - len(misses)
+
+    def _update_fitness(self, inherited_fitness, changed):
+        """
+        Az új populáció fitnesze: a változatlan egyedek a szülő fitneszét örökölik,
+        csak a módosult egyedeket értékeljük ki. A munkát `evaluation_stats` rögzíti.
+        """
+        fitness_scores = inherited_fitness.copy()
+        changed_idx = np.nonzero(changed)[0]
+        cache_hits = 0
+        if len(changed_idx):
+            fitness_scores[changed_idx], cache_hits = self._evaluate(self.population[changed_idx])
+        self.evaluations_total += len(changed_idx) - cache_hits
+        self.evaluation_stats.append({
+            "evaluated": len(changed_idx) - cache_hits,
+            "inherited": len(fitness_scores) - len(changed_idx),
+            "cache_hits": cache_hits
+        })
         return fitness_scores
 
-    def _select(self, fitness_scores):
+    @property
+    def saved_evaluation_rate(self):
+        """A megspórolt (örökölt vagy gyorsítótárból vett) kiértékelések aránya."""
+        total = sum(s["evaluated"] + s["inherited"] + s["cache_hits"] for s in self.evaluation_stats)
+        saved = sum(s["inherited"] + s["cache_hits"] for s in self.evaluation_stats)
+        return saved / total if total else 0.0
+
+    @property
+    def cache_hit_rate(self):
+        """A gyorsítótárban keresett egyedek közül a találatok aránya."""
+        lookups = sum(s["evaluated"] + s["cache_hits"] for s in self.evaluation_stats)
+        hits = sum(s["cache_hits"] for s in self.evaluation_stats)
+        return hits / lookups if lookups else 0.0
+
+    def _select_indices(self, fitness_scores):
         """
-        Szelektálja a szülőket a következő generációhoz.
+        Szelektálja a szülők indexeit a következő generációhoz (lásd `selection.py`).
         A jobb fitneszű (kisebb értékű) egyedek nagyobb eséllyel lesznek kiválasztva.
+        Elitizmus esetén az első `elitism` hely a legjobb egyedeké.
         """
-        # A fitnesz értékeket invertáljuk, mert a kisebb a jobb, de a szelekcióhoz a nagyobbnak kell jobbnak lennie
-        inverted_fitness = 1 / (fitness_scores + 1e-6) # + 1e-6 a nullával való osztás elkerülésére
-        probabilities = inverted_fitness / np.sum(inverted_fitness)
-        
-        selected_indices = np.random.choice(
-            self.population_size, size=self.population_size, p=probabilities
-        )
-        return self.population[selected_indices]
+        kwargs = {'tournament_size': self.tournament_size} if self.selection == 'tournament' else {}
+        selected_indices = select_indices(self.selection, fitness_scores, self.population_size, **kwargs)
+        if self.elitism > 0:
+            elite = np.argpartition(fitness_scores, self.elitism - 1)[:self.elitism]
+            selected_indices[:self.elitism] = elite
+        return selected_indices
+
+    def _select(self, fitness_scores):
+        """Szelektálja a szülőket a következő generációhoz."""
+        return self.population[self._select_indices(fitness_scores)]
 
     def _crossover(self, parents):
-        """Keresztezi a szülőket, hogy utódokat hozzon létre."""
-        offspring = np.zeros_like(parents)
-        for i in range(0, self.population_size, 2):
-            parent1, parent2 = parents[i], parents[i+1]
-            if np.random.rand() < self.crossover_rate:
-                # Egypontos keresztezés
-                crossover_point = np.random.randint(1, 3)
-                offspring[i, :crossover_point] = parent1[:crossover_point]
-                offspring[i, crossover_point:] = parent2[crossover_point:]
-                offspring[i+1, :crossover_point] = parent2[:crossover_point]
-                offspring[i+1, crossover_point:] = parent1[crossover_point:]
-            else:
-                offspring[i], offspring[i+1] = parent1, parent2
-        return offspring
+        """Keresztezi a szülőket, hogy utódokat hozzon létre (lásd `crossover`)."""
+        return crossover(parents, self.crossover_rate)
+
+    def _mutation_sigmas(self):
+        """A mutációs lépések szórása génenként: a tartományok 5%-a."""
+        return np.array([
+            (self.x_range[1] - self.x_range[0]) * 0.05,
+            (self.y_range[1] - self.y_range[0]) * 0.05,
+            (self.r_range[1] - self.r_range[0]) * 0.05
+        ])
 
     def _mutate(self, offspring):
-        """Végrehajtja a mutációt az utódokon."""
-        for i in range(len(offspring)):
-            if np.random.rand() < self.mutation_rate:
-                # Véletlenszerűen kiválaszt egy gént (cx, cy, vagy r) és módosítja
-                gene_to_mutate = np.random.randint(0, 3)
-                if gene_to_mutate == 0: # cx
-                    mutation_value = np.random.normal(0, (self.x_range[1] - self.x_range[0]) * 0.05)
-                    offspring[i, 0] += mutation_value
-                elif gene_to_mutate == 1: # cy
-                    mutation_value = np.random.normal(0, (self.y_range[1] - self.y_range[0]) * 0.05)
-                    offspring[i, 1] += mutation_value
-                else: # r
-                    mutation_value = np.random.normal(0, (self.r_range[1] - self.r_range[0]) * 0.05)
-                    offspring[i, 2] += mutation_value
-        
-        # Biztosítjuk, hogy az értékek a tartományon belül maradjanak
-        np.clip(offspring[:, 0], self.x_range[0], self.x_range[1], out=offspring[:, 0])
-        np.clip(offspring[:, 1], self.y_range[0], self.y_range[1], out=offspring[:, 1])
-        np.clip(offspring[:, 2], self.r_range[0], self.r_range[1], out=offspring[:, 2])
-        
-        return offspring
+        """Végrehajtja a mutációt az utódokon (lásd `mutate`)."""
+        lower = self._lower_bounds()
+        upper = self._upper_bounds()
+        return mutate(offspring, self.mutation_rate, self._mutation_sigmas(), lower, upper)
 
-    def run(self):
-        """Futtatja a genetikus algoritmust a megadott generációszámig."""
+    def _refine_elite(self, fitness_scores):
+        """
+        A legjobb `local_search.elite` egyed lokális finomítása. A javult köröket
+        a határokra vágva visszaírjuk a populációba, a fitnesz tömb helyben frissül.
+        """
+        n_elite = min(self.local_search.elite, len(fitness_scores))
+        elite = np.argpartition(fitness_scores, n_elite - 1)[:n_elite]
+        lower = self._lower_bounds()
+        upper = self._upper_bounds()
+        # A kezdő lépésköz a mutáció szórása, hogy a keresés a GA léptékén induljon
+        initial_step = self._mutation_sigmas()
+
+        for idx in elite:
+            circle, _, evaluations = refine_circle(self.local_search.method, self.population[idx], self.points,
+                                                   initial_step, self.local_search.iterations, self._fitness)
+            circle = np.clip(circle, lower, upper)
+            value = self._fitness(circle[None, :])[0]
+            self.local_search_evaluations += evaluations + 1
+            if value < fitness_scores[idx]:
+                self.population[idx] = circle
+                fitness_scores[idx] = value
+        return fitness_scores
+
+    @property
+    def full_resolution(self):
+        """Igaz, ha a fitneszt a teljes ponthalmazon számoljuk."""
+        return len(self.points) == len(self.all_points)
+
+    def _set_sample_size(self, size):
+        """
+        A kiértékelési minta beállítása: a konvex burok csúcsai és a többi pontból
+        véletlenszerűen választott pontok, összesen legfeljebb `size` pont.
+        A gyorsítótárat ürítjük, mert a fitneszek a mintától függnek.
+        """
+        self._fitness_cache.clear()
+        if self._hull_points is None:
+            self._hull_points = convex_hull(self.all_points)
+        n_random = size - len(self._hull_points)
+        if n_random >= len(self.all_points) - len(self._hull_points):
+            self.points = self.all_points
+        else:
+            chosen = np.random.choice(len(self.all_points), max(0, n_random), replace=False)
+            self.points = np.concatenate((self._hull_points, self.all_points[chosen]))
+
+    def _enclose_all_points(self, circle):
+        """A kör sugarát szükség esetén a legtávolabbi pontig növeli (végső ellenőrzés)."""
+        circle = np.array(circle, dtype=float)
+        dist_sq = np.sum((self.all_points - circle[:2]) ** 2, axis=1)
+        circle[2] = max(circle[2], np.sqrt(dist_sq.max()))
+        return circle
+
+    def inject(self, individuals, fitness):
+        """
+        Ismert fitneszű egyedek (például sziget-migráció bevándorlói) beillesztése
+        a populációba, a legrosszabb szülőfitneszű egyedek helyére. Egy ezt követő
+        `run(resume=True)` a beillesztett egyedeket nem értékeli ki újra.
+        """
+        if self._pending_fitness is None:
+            self._pending_fitness = (np.full(len(self.population), np.inf), np.ones(len(self.population), dtype=bool))
+        inherited_fitness, changed = self._pending_fitness
+        worst = np.argsort(inherited_fitness)[len(inherited_fitness) - len(individuals):]
+        self.population[worst] = individuals
+        inherited_fitness[worst] = fitness
+        changed[worst] = False
+
+    def run(self, resume=False):
+        """
+        Futtatja a genetikus algoritmust, amíg valamelyik leállási feltétel nem teljesül.
+        A visszaadott előzmény `stop_reason` attribútuma jelzi a leállás okát.
+
+        `resume=True` esetén a futás az előző futás utolsó utódnemzedékéből
+        folytatódik, és a szülőtől örökölt vagy `inject`-tel megadott fitneszeket
+        felhasználja (többfelbontású módban a mintavétel újraindul, ezért ott
+        minden egyedet kiértékelünk).
+        """
         best_fitness_overall = np.inf
         best_individual_overall = None
-        self.fitness_history = []
+        self.fitness_history = FitnessHistory()
+        self.fitness_history.stop_reason = STOP_GENERATIONS
+
+        stopping = self.stopping
+        stopping.start()
+        self.evaluation_stats = []
+        self.local_search_evaluations = 0
+        self.evaluations_total = 0
+        pending = self._pending_fitness if resume and not self.multiresolution else None
+        if pending is None:
+            pending = (np.empty(len(self.population)), np.ones(len(self.population), dtype=bool))
+        self.stats = RunStats()
+        timer = PhaseTimer(self.stats.phase_ns) if self.profile else NULL_TIMER
+        record_generations = self.profile or self.callbacks
+        run_start_ns = time.perf_counter_ns()
+        if self.multiresolution:
+            self._set_sample_size(self.multiresolution.sample_size)
+            # Ettől a generációtól a teljes ponthalmazon értékelünk
+            full_resolution_start = int(self.generations * (1 - self.multiresolution.full_resolution_fraction))
 
+        timer.start()
         for generation in range(self.generations):
-            # 1. Fitnesz számítás
-            fitness_scores = self._calculate_fitness()
+            # 1. Fitnesz számítás (a változatlan egyedek öröklik a szülő fitneszét)
+            fitness_scores = self._update_fitness(*pending)
+            timer.lap('fitness')
+
+            # Memetikus lépés: az elit lokális finomítása
+            if self.local_search and generation % self.local_search.interval == 0:
+                fitness_scores = self._refine_elite(fitness_scores)
+                timer.lap('local_search')
             
             # 2. A legjobb egyed elmentése
             best_idx = np.argmin(fitness_scores)
@@ -129,47 +616,92 @@ class CircleGA:
                 best_fitness_overall = fitness_scores[best_idx]
                 best_individual_overall = self.population[best_idx]
             
+            self.evaluated_population, self.evaluated_fitness = self.population, fitness_scores
+            evaluations = self.evaluations_total + self.local_search_evaluations
             self.fitness_history.append(best_fitness_overall)
+            self.fitness_history.evaluations.append(evaluations)
+
+            if record_generations:
+                record = generation_record(generation, self.population, fitness_scores, best_fitness_overall,
+                                           evaluations, self._lower_bounds(), self._upper_bounds())
+                self.stats.generations.append(record)
+                for callback in self.callbacks:
+                    callback(self, record)
 
-            if (generation + 1) % 20 == 0:
-                print(f"Generáció: {generation + 1}/{self.generations}, Legjobb fitnesz: {best_fitness_overall:.2f}")
+            # Leállási feltételek ellenőrzése (a célfitnesz és a stagnálás csak teljes felbontáson)
+            stopping.update(best_fitness_overall)
+            stop_reason = stopping.stop_reason(best_fitness_overall, check_convergence=self.full_resolution)
+            if stop_reason is not None:
+                self.fitness_history.stop_reason = stop_reason
+                pending = (fitness_scores.copy(), np.zeros(len(fitness_scores), dtype=bool))
+                break
+            timer.lap('bookkeeping')
+
+            # Többfelbontású mód: a minta növelése, ha a populáció a mintán konvergált
+            target_reached = stopping.target_reached(best_fitness_overall)
+            if not self.full_resolution and (target_reached or generation + 1 >= full_resolution_start
+                                             or stopping.stall_count >= self.multiresolution.stall_generations):
+                if target_reached or generation + 1 >= full_resolution_start:
+                    self._set_sample_size(len(self.all_points))
+                else:
+                    self._set_sample_size(len(self.points) * self.multiresolution.sample_growth)
+                # Az új mintán a fitneszek nem összevethetők a régiekkel: újraértékelés
+                fitness_scores = self._update_fitness(np.empty(len(self.population)),
+                                                      np.ones(len(self.population), dtype=bool))
+                best_fitness_overall = self._fitness(best_individual_overall[None, :])[0]
+                self.evaluated_fitness = fitness_scores
+                stopping.restart_stall(best_fitness_overall)
+                timer.lap('resample')
 
             # 3. Szelekció
-            parents = self._select(fitness_scores)
+            selected_indices = self._select_indices(fitness_scores)
+            parents = self.population[selected_indices]
+            timer.lap('selection')
             
             # 4. Keresztezés
             offspring = self._crossover(parents)
+            timer.lap('crossover')
             
             # 5. Mutáció
             mutated_offspring = self._mutate(offspring)
+            if self.elitism > 0:
+                # Az elit egyedek keresztezés és mutáció nélkül kerülnek át
+                mutated_offspring[:self.elitism] = parents[:self.elitism]
             
-            # Az új populáció a mutált utódokból áll
+            # Az új populáció a mutált utódokból áll; ami nem változott, örökli a szülő fitneszét
+            changed = np.any(mutated_offspring != parents, axis=1)
+            pending = (fitness_scores[selected_indices], changed)
             self.population = mutated_offspring
-            
+            timer.lap('mutation')
+
+        self._pending_fitness = pending
+        timer.lap('bookkeeping')
+        if self.multiresolution:
+            # A végeredmény minden pontot tartalmazzon, akkor is, ha a teljes
+            # felbontás előtt állt le a futás
+            best_individual_overall = self._enclose_all_points(best_individual_overall)
+
+        self.stats.total_ns = time.perf_counter_ns() - run_start_ns
+        self.stats.evaluations = self.evaluations_total + self.local_search_evaluations
         return best_individual_overall, self.fitness_history
 
-def visualize_solution(points, circle_params, title="Megoldás"):
-    """Megjeleníti a ponthalmazt és a megtalált kört."""
-    cx, cy, r = circle_params
-    
-    fig, ax = plt.subplots(figsize=(8, 8))
-    # Pontok kirajzolása
-    ax.scatter(points[:, 0], points[:, 1], alpha=0.7, edgecolors='k', label="Adatpontok")
-    
-    # A megtalált kör kirajzolása
-    solution_circle = Circle((cx, cy), r, color='r', fill=False, linewidth=2, label="Illesztett kör")
-    ax.add_patch(solution_circle)
-    
-    ax.set_title(title)
-    ax.set_xlabel("X koordináta")
-    ax.set_ylabel("Y koordináta")
-    ax.set_aspect('equal', adjustable='box')
-    ax.grid(True)
-    ax.legend()
-    plt.show()
+
+# A korábbi `from genetic_algorithm import visualize_solution, visualize_point_cloud`
+# importok kedvéért: a függvények a `visualization` modulba kerültek, amelyet (és
+# vele a matplotlibet) csak az első hozzáféréskor töltünk be
+_VISUALIZATION_EXPORTS = ('visualize_solution', 'visualize_point_cloud')
+
+
+def __getattr__(name):
+    if name in _VISUALIZATION_EXPORTS:
+        import visualization
+        return getattr(visualization, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == '__main__':
+    from visualization import visualize_solution, plot_fitness_history
+
     # 1. Ponthalmaz generálása
     points = generate_point_cloud(
         center=(50, 50),
@@ -193,10 +725,4 @@ if __name__ == '__main__':
     visualize_solution(points, best_circle, "Genetikus Algoritmus Eredménye")
 
     # 4. Konvergencia grafikon
-    plt.figure(figsize=(10, 5))
-    plt.plot(history)
-    plt.title("Fitnesz érték alakulása a generációk során")
-    plt.xlabel("Generáció")
-    plt.ylabel("Legjobb fitnesz (minél kisebb, annál jobb)")
-    plt.grid(True)
-    plt.show()
+    plot_fitness_history(history)
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+# Az előszűréshez használt irányok száma (Akl–Toussaint heurisztika)
+FILTER_DIRECTIONS = 32
+# Az előszűrés blokkmérete, hogy a (pontok x élek) mátrix kis memóriában maradjon
+FILTER_BLOCK_SIZE = 65536
+
+
+def _interior_filter(points, n_directions=FILTER_DIRECTIONS):
+    """
+    Kiszűri azokat a pontokat, amelyek biztosan a konvex burok belsejében vannak.
+
+    Több irányban megkeresi a szélső pontokat; ezek konvex sokszöget alkotnak,
+    és a sokszög belsejébe eső pontok nem lehetnek burokcsúcsok.
+    A vizsgálat teljesen vektorizált, így nagy ponthalmazon is olcsó. A pontokat
+    blokkonként alakítjuk float64-re, így egy memóriatérképes ponthalmaz sem
+    másolódik le egészben; csak a megmaradó pontokból készül új tömb.
+    """
+    angles = np.linspace(0, 2 * np.pi, n_directions, endpoint=False)
+    directions = np.stack((np.cos(angles), np.sin(angles)), axis=1)
+
+    # A szélső pontok az irányok sorrendjében egy konvex sokszög csúcsai
+    extreme_idx = np.zeros(n_directions, dtype=np.intp)
+    extreme_val = np.full(n_directions, -np.inf)
+    for start in range(0, len(points), FILTER_BLOCK_SIZE):
+        block = np.asarray(points[start:start + FILTER_BLOCK_SIZE], dtype=np.float64)
+        projections = directions @ block.T
+        block_idx = np.argmax(projections, axis=1)
+        block_val = projections[np.arange(n_directions), block_idx]
+        better = block_val > extreme_val
+        extreme_idx[better] = block_idx[better] + start
+        extreme_val[better] = block_val[better]
+    extreme_idx = extreme_idx[np.r_[True, np.diff(extreme_idx) != 0]]
+    if len(extreme_idx) > 1 and extreme_idx[0] == extreme_idx[-1]:
+        extreme_idx = extreme_idx[:-1]
+    if len(np.unique(extreme_idx)) < 3:
+        return points
+
+    # Minden élhez kifelé mutató normálist és eltolást számolunk: a p pont
+    # akkor eshet a sokszögön kívül (vagy a határára), ha valamely élre n·p >= n·a.
+    polygon = np.asarray(points[extreme_idx], dtype=np.float64)
+    edges = np.roll(polygon, -1, axis=0) - polygon
+    normals = np.stack((edges[:, 1], -edges[:, 0]), axis=1)
+    offsets = np.einsum('ij,ij->i', normals, polygon)
+    # Kis tűrés, hogy a kerekítés miatt a határon lévő pontok se vesszenek el
+    offsets -= 1e-9 * np.abs(normals).sum(axis=1) * np.abs(polygon).max()
+
+    keep = np.empty(len(points), dtype=bool)
+    for start in range(0, len(points), FILTER_BLOCK_SIZE):
+        block = np.asarray(points[start:start + FILTER_BLOCK_SIZE], dtype=np.float64)
+        keep[start:start + FILTER_BLOCK_SIZE] = (block @ normals.T >= offsets).any(axis=1)
+    return points[keep]
+
+
+def _cross(o, a, b):
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def convex_hull(points):
+    """
+    Kiszámítja a ponthalmaz konvex burkát (Andrew-féle monotone chain algoritmus).
+
+    A belső pontokat előbb vektorizáltan kiszűrjük, a láncépítés így csak
+    a burok közelében lévő pontokon fut. Az irányítottsági vizsgálatok float64
+    pontossággal futnak, a csúcsok típusa viszont a bemenet lebegőpontos típusa
+    marad (egész bemenetnél float64).
+
+    Args:
+        points (np.ndarray): (N, 2) alakú ponthalmaz.
+
+    Returns:
+        np.ndarray: A burok csúcsai (H, 2) alakban, az óramutató járásával ellentétes sorrendben.
+    """
+    points = np.asarray(points)
+    dtype = points.dtype if np.issubdtype(points.dtype, np.floating) else np.float64
+    if len(points) > 3 * FILTER_DIRECTIONS:
+        points = _interior_filter(points)
+
+    points = np.unique(np.asarray(points, dtype=dtype), axis=0)  # lexikografikus rendezés x, majd y szerint
+    if len(points) <= 2:
+        return points
+
+    # A tolist() Python float (float64) értékeket ad, így a vektoriális
+    # szorzatok float32 bemenetnél sem veszítenek pontosságot
+    sorted_points = points.tolist()
+    lower = []
+    for p in sorted_points:
+        while len(lower) >= 2 and _cross(lower[-2], lower[-1], p) <= 0:
+            lower.pop()
+        lower.append(p)
+
+    upper = []
+    for p in reversed(sorted_points):
+        while len(upper) >= 2 and _cross(upper[-2], upper[-1], p) <= 0:
+            upper.pop()
+        upper.append(p)
+
+    return np.array(lower[:-1] + upper[:-1], dtype=dtype)
+
+
+def diameter(points):
+    """
+    A ponthalmaz átmérője (a legtávolabbi pontpár távolsága), forgó tolómérővel
+    a konvex burok antipodális csúcspárjain, O(H) lépésben.
+
+    Args:
+        points (np.ndarray): (N, 2) alakú ponthalmaz.
+
+    Returns:
+        float: Az átmérő.
+    """
+    hull = convex_hull(points).astype(np.float64).tolist()
+    n = len(hull)
+    if n < 2:
+        return 0.0
+    if n == 2:
+        return float(np.hypot(hull[1][0] - hull[0][0], hull[1][1] - hull[0][1]))
+
+    best_sq = 0.0
+    j = 1
+    for i in range(n):
+        a, b = hull[i], hull[(i + 1) % n]
+        # A j csúcsot addig léptetjük, amíg távolodik az (a, b) él egyenesétől
+        while _cross(a, b, hull[(j + 1) % n]) > _cross(a, b, hull[j]):
+            j = (j + 1) % n
+        for p in (a, b):
+            best_sq = max(best_sq, (p[0] - hull[j][0]) ** 2 + (p[1] - hull[j][1]) ** 2)
+    return float(np.sqrt(best_sq))
+
+
+def circle_estimates(points):
+    """
+    Olcsó becslések a befoglaló körre, a populáció inicializálásához.
+
+    A becsült középpontok:
+    - a pontok súlypontja,
+    - a befoglaló téglalap középpontja,
+    - a tengelyirányú szélső pontok közül a legtávolabbi pár felezőpontja,
+    - algebrai legkisebb négyzetes körillesztés (Kåsa-módszer) középpontja.
+    A sugár mindegyiknél a középponttól legtávolabbi pont távolsága, így minden
+    becslés befoglaló kör (büntetés nélküli fitnesszel).
+
+    Args:
+        points (np.ndarray): (N, 2) alakú ponthalmaz.
+
+    Returns:
+        np.ndarray: (4, 3) alakú tömb, soronként (cx, cy, r).
+    """
+    centroid = points.mean(axis=0)
+    bbox_center = (points.min(axis=0) + points.max(axis=0)) / 2
+
+    # A tengelyirányú szélső pontok közül a legtávolabbi pár
+    extremes = points[[points[:, 0].argmin(), points[:, 0].argmax(), points[:, 1].argmin(), points[:, 1].argmax()]]
+    pair_dist = np.linalg.norm(extremes[:, None, :] - extremes[None, :, :], axis=-1)
+    i, j = np.unravel_index(np.argmax(pair_dist), pair_dist.shape)
+    extreme_center = (extremes[i] + extremes[j]) / 2
+
+    # Kåsa-illesztés: x^2 + y^2 = a*x + b*y + c lineáris legkisebb négyzetes megoldása,
+    # a kondíció javítására a súlyponthoz képest
+    shifted = points - centroid
+    design = np.column_stack((shifted, np.ones(len(points))))
+    rhs = np.einsum('ij,ij->i', shifted, shifted)
+    (a, b, _), *_ = np.linalg.lstsq(design, rhs, rcond=None)
+    kasa_center = centroid + np.array([a, b]) / 2
+
+    centers = np.array([centroid, bbox_center, extreme_center, kasa_center])
+    radii = np.array([np.sqrt(np.max(np.sum((points - c) ** 2, axis=1))) for c in centers])
+    return np.column_stack((centers, radii))
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+import multiprocessing
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from genetic_algorithm import CircleGA, FitnessHistory, MultiresolutionOptions, group_options
+from stopping import StopCriteria, STOP_GENERATIONS
+
+# Támogatott migrációs topológiák
+TOPOLOGIES = ('ring', 'full')
+# A többfelbontású mód paraméterei: szakaszonként újraindulna a mintavétel, ezért a szigetek nem kapják meg
+MULTIRESOLUTION_PARAMS = ('multiresolution', *MultiresolutionOptions.PARAMS)
+
+
+def _island_worker(conn, shm_name, shape, dtype, seed, ga_params):
+    """
+    Egy sziget munkafolyamata: a közös memóriában lévő ponthalmazon futtat egy
+    `CircleGA`-t, a főfolyamat utasításai szerint generációs szakaszokban.
+
+    Üzenetek: ('evolve', generációk, (bevándorlók, fitneszük), kivándorlók száma) -> (legjobb
+    egyed, legjobb fitnesz, szakasz előzményei, szakasz kiértékelései, (kivándorlók, fitneszük));
+    ('stop',) -> kilépés.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    points = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    try:
+        np.random.seed(seed)
+        ga = CircleGA(points, **ga_params)
+
+        while True:
+            message = conn.recv()
+            if message[0] == 'stop':
+                break
+            _, generations, (immigrants, immigrant_fitness), migration_size = message
+
+            # A szakasz az előző szakasz utolsó utódnemzedékéből folytatódik. A
+            # bevándorlók a legrosszabb szülőfitneszű utódok helyére kerülnek, a
+            # fitneszüket a küldő sziget már kiszámolta, és a változatlan utódok
+            # is öröklik a szülőjükét, így a szakasz elején csak a módosult
+            # utódokat értékeljük ki, mint bármelyik generációban
+            if len(immigrants):
+                ga.inject(immigrants, immigrant_fitness)
+
+            ga.generations = generations
+            best_individual, history = ga.run(resume=True)
+
+            best = np.argsort(ga.evaluated_fitness)[:migration_size]
+            emigrants = (ga.evaluated_population[best].copy(), ga.evaluated_fitness[best].copy())
+            conn.send((np.array(best_individual), history[-1] if history else np.inf, list(history),
+                       list(history.evaluations), emigrants))
+    finally:
+        del points
+        shm.close()
+        conn.close()
+
+
+class IslandCircleGA:
+    """
+    Sziget-modellű párhuzamos genetikus algoritmus.
+
+    `n_islands` darab `CircleGA` alpopuláció fut külön munkafolyamatokban, és
+    `migration_interval` generációnként kicserélik a legjobb `migration_size`
+    egyedüket a `topology` szerint ('ring': mindenki a következő szigetnek küld,
+    'full': mindenki mindenkinek). A ponthalmaz közös memóriában van, így nem kell
+    minden folyamatnak külön átküldeni. A `run()` a `CircleGA.run()`-nal azonos
+    alakú eredményt ad.
+
+    A leállási feltételeket (`stall_generations`, `tolerance`, `time_budget`,
+    `target_fitness`) a főfolyamat a szigetek közös legjobbjára ellenőrzi, a
+    migrációs szakaszok határán; a szigetek szakaszai ezek nélkül futnak. A
+    többfelbontású mód paramétereit a szigetek nem kapják meg, a fitneszt mindig
+    a teljes ponthalmazon számolják.
+    """
+    def __init__(self, points, n_islands=4, migration_interval=20, migration_size=2, topology='ring',
+                 generations=200, seed=None, **ga_params):
+        if topology not in TOPOLOGIES:
+            raise ValueError(f"Ismeretlen topológia: {topology} (lehetséges: {', '.join(TOPOLOGIES)})")
+        # A közös memória a szigetek GA-jának típusában készül (a `CircleGA`-val azonos
+        # szabály szerint), így a szigeteknek nem kell saját, konvertált másolat
+        dtype = ga_params.get('dtype')
+        if dtype is None:
+            points = np.asarray(points)
+            dtype = points.dtype if np.issubdtype(points.dtype, np.floating) else np.float64
+        self.points = np.ascontiguousarray(points, dtype=dtype)
+        self.n_islands = n_islands
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        self.topology = topology
+        self.generations = generations
+        self.seed = seed
+        self.stopping = group_options(StopCriteria, ga_params.pop('stopping', None), ga_params)
+        for name in MULTIRESOLUTION_PARAMS:
+            ga_params.pop(name, None)
+        self.ga_params = ga_params
+        self.fitness_history = FitnessHistory()
+
+    def _sources(self, island):
+        """Azon szigetek indexei, amelyektől az adott sziget bevándorlókat kap."""
+        if self.topology == 'ring':
+            return [(island - 1) % self.n_islands] if self.n_islands > 1 else []
+        return [other for other in range(self.n_islands) if other != island]
+
+    def _immigrants(self, island, emigrants):
+        """Az adott szigetre érkező bevándorlók (K, 3) alakú tömbje és a fitneszük."""
+        sources = self._sources(island)
+        if not sources:
+            return np.empty((0, 3)), np.empty(0)
+        return (np.concatenate([emigrants[source][0] for source in sources]),
+                np.concatenate([emigrants[source][1] for source in sources]))
+
+    def run(self):
+        """
+        Futtatja a szigeteket a megadott generációszámig, vagy amíg valamelyik
+        leállási feltétel nem teljesül (a migrációs szakaszok határán).
+        """
+        stopping = self.stopping
+        stopping.start()
+        seeds = np.random.SeedSequence(self.seed).generate_state(self.n_islands)
+        shm = shared_memory.SharedMemory(create=True, size=max(1, self.points.nbytes))
+        shared_points = np.ndarray(self.points.shape, dtype=self.points.dtype, buffer=shm.buf)
+        shared_points[:] = self.points
+
+        context = multiprocessing.get_context('spawn')
+        connections, processes = [], []
+        try:
+            for island in range(self.n_islands):
+                parent_conn, child_conn = context.Pipe()
+                process = context.Process(
+                    target=_island_worker,
+                    args=(child_conn, shm.name, self.points.shape, self.points.dtype, int(seeds[island]), self.ga_params)
+                )
+                process.start()
+                child_conn.close()
+                connections.append(parent_conn)
+                processes.append(process)
+
+            best_fitness_overall = np.inf
+            best_individual_overall = None
+            history = []
+            evaluations = []
+            evaluations_total = 0
+            stop_reason = STOP_GENERATIONS
+            emigrants = [(np.empty((0, 3)), np.empty(0))] * self.n_islands
+            remaining = self.generations
+
+            while remaining > 0:
+                epoch = min(self.migration_interval, remaining)
+                for island, conn in enumerate(connections):
+                    conn.send(('evolve', epoch, self._immigrants(island, emigrants), self.migration_size))
+                replies = [conn.recv() for conn in connections]
+
+                for best_individual, best_fitness, _, _, _ in replies:
+                    if best_fitness < best_fitness_overall:
+                        best_fitness_overall = best_fitness
+                        best_individual_overall = best_individual
+
+                # A szakasz globális előzménye: generációnként a szigetek legjobbja,
+                # és a szigetek kiértékeléseinek összege
+                epoch_histories = [reply[2] for reply in replies]
+                epoch_evaluations = [reply[3] for reply in replies]
+                epoch_length = min(len(h) for h in epoch_histories)
+                epoch_best = np.min([h[:epoch_length] for h in epoch_histories], axis=0)
+                history.extend(epoch_best)
+                evaluations.extend(evaluations_total + np.sum([e[:epoch_length] for e in epoch_evaluations], axis=0))
+                evaluations_total += sum(e[-1] for e in epoch_evaluations if e)
+                emigrants = [reply[4] for reply in replies]
+                remaining -= epoch
+
+                # Leállási feltételek a közös legjobbra, generációnként követve a stagnálást
+                for best_so_far in np.minimum.accumulate(history)[-epoch_length:]:
+                    stopping.update(best_so_far)
+                reason = stopping.stop_reason(best_fitness_overall)
+                if reason is not None:
+                    stop_reason = reason
+                    break
+
+            for conn in connections:
+                conn.send(('stop',))
+        finally:
+            for process in processes:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+            del shared_points
+            shm.close()
+            shm.unlink()
+
+        self.fitness_history = FitnessHistory(np.minimum.accumulate(history).tolist())
+        self.fitness_history.evaluations = [int(e) for e in evaluations]
+        self.fitness_history.stop_reason = stop_reason
+        return best_individual_overall, self.fitness_history
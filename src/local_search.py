@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from fitness import population_fitness
+
+# Nelder–Mead együtthatók: tükrözés, nyújtás, összehúzás, zsugorítás
+NM_REFLECTION = 1.0
+NM_EXPANSION = 2.0
+NM_CONTRACTION = 0.5
+NM_SHRINK = 0.5
+
+
+def _default_fitness(points):
+    """A célfüggvény, ha a hívó nem ad meg sajátot: `population_fitness` alapbeállításokkal."""
+    return lambda population: population_fitness(population, points)
+
+
+def nelder_mead(circle, points, initial_step, max_iterations=100, tolerance=1e-9, fitness=None):
+    """
+    Nelder–Mead szimplex keresés a (cx, cy, r) térben, a GA büntetéses
+    fitneszével (lásd `fitness.population_fitness`) mint célfüggvénnyel.
+
+    Args:
+        circle (np.ndarray): A kiinduló kör (cx, cy, r).
+        points (np.ndarray): (N, 2) alakú ponthalmaz.
+        initial_step (np.ndarray): A kezdő szimplex élhossza génenként.
+        max_iterations (int): Az iterációk maximális száma.
+        tolerance (float): Leállás, ha a szimplex csúcsainak fitnesze ennél
+                           kisebb relatív mértékben tér el.
+        fitness (callable, optional): Egyedek (K, 3) tömbjéhez a fitneszüket adó
+                                      függvény (például a GA memóriakeretével és
+                                      backendjével); alapértelmezésben `population_fitness`.
+
+    Returns:
+        tuple: (a legjobb kör, a fitnesze, a kiértékelések száma)
+    """
+    fitness = fitness or _default_fitness(points)
+    simplex = np.tile(np.asarray(circle, dtype=float), (4, 1))
+    simplex[1:] += np.diag(np.broadcast_to(initial_step, (3,)))
+    values = np.array(fitness(simplex), dtype=float)
+    evaluations = 4
+
+    def evaluate(vertex):
+        nonlocal evaluations
+        evaluations += 1
+        return fitness(vertex[None, :])[0]
+
+    for _ in range(max_iterations):
+        order = np.argsort(values)
+        simplex, values = simplex[order], values[order]
+        if values[-1] - values[0] <= tolerance * abs(values[0]):
+            break
+
+        centroid = simplex[:-1].mean(axis=0)
+        reflected = centroid + NM_REFLECTION * (centroid - simplex[-1])
+        reflected_value = evaluate(reflected)
+
+        if reflected_value < values[0]:
+            expanded = centroid + NM_EXPANSION * (reflected - centroid)
+            expanded_value = evaluate(expanded)
+            if expanded_value < reflected_value:
+                simplex[-1], values[-1] = expanded, expanded_value
+            else:
+                simplex[-1], values[-1] = reflected, reflected_value
+        elif reflected_value < values[-2]:
+            simplex[-1], values[-1] = reflected, reflected_value
+        else:
+            # Összehúzás a jobbik pont (tükrözött vagy legrosszabb) felé
+            if reflected_value < values[-1]:
+                contracted = centroid + NM_CONTRACTION * (reflected - centroid)
+            else:
+                contracted = centroid + NM_CONTRACTION * (simplex[-1] - centroid)
+            contracted_value = evaluate(contracted)
+            if contracted_value < min(reflected_value, values[-1]):
+                simplex[-1], values[-1] = contracted, contracted_value
+            else:
+                # Zsugorítás a legjobb csúcs felé
+                simplex[1:] = simplex[0] + NM_SHRINK * (simplex[1:] - simplex[0])
+                values[1:] = fitness(simplex[1:])
+                evaluations += 3
+
+    best = np.argmin(values)
+    return simplex[best], values[best], evaluations
+
+
+def farthest_point_descent(circle, points, initial_step=None, max_iterations=100, fitness=None):
+    """
+    Szubgradiens lépések a legtávolabbi pont felé.
+
+    Rögzített középpont mellett a büntetéses fitnesz (10-es büntetési súllyal)
+    ott minimális, ahol a sugár épp a legtávolabbi pont távolsága, így a
+    célfüggvény a középpont függvényében `max_i |p_i - c|`. Ennek egy
+    szubgradiense a legtávolabbi pontból a középpont felé mutat, ezért a
+    középpontot csökkenő lépésközzel a legtávolabbi pont felé toljuk, és a
+    legjobb talált kört tartjuk meg.
+
+    Args:
+        circle (np.ndarray): A kiinduló kör (cx, cy, r).
+        points (np.ndarray): (N, 2) alakú ponthalmaz.
+        initial_step (float, optional): Az első lépés hossza; alapértelmezésben
+                                        a kiinduló sugár 10%-a.
+        max_iterations (int): A lépések száma.
+        fitness (callable, optional): A kiinduló kör fitneszét adó függvény (lásd `nelder_mead`).
+
+    Returns:
+        tuple: (a legjobb kör, a fitnesze, a kiértékelések száma)
+    """
+    fitness = fitness or _default_fitness(points)
+    circle = np.asarray(circle, dtype=float)
+    best = circle.copy()
+    best_value = fitness(best[None, :])[0]
+    evaluations = 1
+    step = 0.1 * abs(circle[2]) if initial_step is None else initial_step
+
+    center = circle[:2].copy()
+    for iteration in range(max_iterations):
+        # Minden lépés egy teljes távolságszámítás a pontokra (egy kiértékelés)
+        evaluations += 1
+        diff = points - center
+        dist_sq = np.einsum('ij,ij->i', diff, diff)
+        farthest = np.argmax(dist_sq)
+        radius = np.sqrt(dist_sq[farthest])
+        # A sugár a legtávolabbi pont távolsága, így a büntetés 0 és a fitnesz = r
+        if radius < best_value:
+            best_value = radius
+            best = np.array([center[0], center[1], radius])
+        if radius == 0:
+            break
+        center = center + (step / (iteration + 1)) * diff[farthest] / radius
+
+    return best, best_value, evaluations
+
+
+# A választható lokális keresések
+LOCAL_SEARCH_METHODS = {
+    'nelder-mead': nelder_mead,
+    'subgradient': farthest_point_descent,
+}
+
+
+class LocalSearchOptions:
+    """
+    A GA memetikus lokális finomításának beállításai (lásd `CircleGA`).
+
+    Args:
+        method (str): A lokális keresés neve (lásd `LOCAL_SEARCH_METHODS`).
+        interval (int): Hány generációnként fut a finomítás.
+        elite (int): A finomított legjobb egyedek száma.
+        iterations (int): Az iterációk maximális száma egyedenként.
+    """
+    # A `CircleGA` egyedi kulcsszavas paraméterei és a nekik megfelelő beállítások
+    PARAMS = {'local_search_interval': 'interval', 'local_search_elite': 'elite',
+              'local_search_iterations': 'iterations'}
+
+    def __init__(self, method='nelder-mead', interval=10, elite=1, iterations=50):
+        if method not in LOCAL_SEARCH_METHODS:
+            raise ValueError(f"Ismeretlen lokális keresés: {method} (lehetséges: {', '.join(LOCAL_SEARCH_METHODS)})")
+        self.method = method
+        self.interval = interval
+        self.elite = elite
+        self.iterations = iterations
+
+
+def refine_circle(method, circle, points, initial_step, max_iterations=100, fitness=None):
+    """
+    Egy kör finomítása a megnevezett determinisztikus lokális kereséssel.
+
+    Args:
+        method (str): A lokális keresés neve (lásd `LOCAL_SEARCH_METHODS`).
+        circle (np.ndarray): A kiinduló kör (cx, cy, r).
+        points (np.ndarray): (N, 2) alakú ponthalmaz.
+        initial_step (np.ndarray): Génenkénti kezdő lépésköz (cx, cy, r); a
+                                   szubgradiens módszer a középpont lépésközeit használja.
+        max_iterations (int): Az iterációk maximális száma.
+        fitness (callable, optional): A célfüggvény (lásd `nelder_mead`).
+
+    Returns:
+        tuple: (a legjobb kör, a fitnesze, a kiértékelések száma)
+    """
+    if method not in LOCAL_SEARCH_METHODS:
+        raise ValueError(f"Ismeretlen lokális keresés: {method} (lehetséges: {', '.join(LOCAL_SEARCH_METHODS)})")
+    if method == 'subgradient':
+        return farthest_point_descent(circle, points, np.hypot(*initial_step[:2]), max_iterations, fitness=fitness)
+    return nelder_mead(circle, points, initial_step, max_iterations, fitness=fitness)
@@ -4,7 +4,19 @@ import time
 import numpy as np
 
 from point_generator import generate_point_cloud
-from genetic_algorithm import CircleGA, visualize_solution
+from genetic_algorithm import CircleGA
+from strategies import make_strategy
+from exact_solver import ExactCircleSolver
+from online import OnlineCircleFitter
+from point_io import load_points, save_points, save_result
+from island_ga import IslandCircleGA, TOPOLOGIES
+from selection import SELECTION_METHODS
+from fitness import FITNESS_BACKENDS, calibrate_parallel_threshold
+from local_search import LOCAL_SEARCH_METHODS
+from telemetry import ProgressPrinter
+
+# A vizualizáció címében megjelenő motornevek
+ENGINE_TITLES = {'ga': "GA", 'island': "Sziget-modellű GA", 'cmaes': "CMA-ES", 'de': "DE"}
 
 def main():
     """
@@ -20,57 +32,216 @@ def main():
     pg_group.add_argument('--noise', type=float, default=5.0, help="A véletlen zaj mértéke (szórás).")
     pg_group.add_argument('--outliers', type=int, default=8, help="A kiugró pontok száma.")
     pg_group.add_argument('--shape_error', type=float, default=0.1, help="Alakhiba mértéke.")
+    pg_group.add_argument('--dtype', choices=['float64', 'float32'], default=None,
+                          help="A pontok és a GA egyedeinek lebegőpontos típusa (float32: feleakkora memória; "
+                               "alapértelmezés: generáláskor float64, beolvasáskor a fájl típusa).")
+    pg_group.add_argument('--input', type=str, default=None,
+                          help="Ponthalmaz beolvasása fájlból generálás helyett (.npy, .npz, nyers bináris .bin/.raw/.f32, "
+                               ".csv/.txt); a bináris fájlok memóriatérképként, másolás nélkül nyílnak meg.")
+    pg_group.add_argument('--raw_dtype', choices=['float32', 'float64'], default='float32',
+                          help="A nyers bináris (.bin/.raw/.f32) fájlok elemtípusa a lemezen, beolvasáskor és mentéskor.")
 
     # --- Argumentumok a genetikus algoritmushoz ---
     ga_group = parser.add_argument_group("Genetikus Algoritmus Paraméterek")
-    ga_group.add_argument('--pop_size', type=int, default=200, help="Populáció mérete.")
+    ga_group.add_argument('--engine', choices=['ga', 'island', 'cmaes', 'de', 'exact', 'online'], default='ga',
+                          help="A megoldó motor: genetikus algoritmus, sziget-modellű GA, CMA-ES, differenciális evolúció, "
+                               "egzakt (Welzl) megoldó, vagy kötegenként frissített online egzakt megoldó.")
+    ga_group.add_argument('--batch_size', type=int, default=1000, help="Az online motor kötegmérete (--engine online).")
+    ga_group.add_argument('--pop_size', type=int, default=None,
+                          help="Populáció mérete (alapértelmezés: GA 200, CMA-ES 7, DE 30).")
     ga_group.add_argument('--generations', type=int, default=300, help="Generációk száma.")
     ga_group.add_argument('--mutation_rate', type=float, default=0.2, help="Mutációs ráta.")
     ga_group.add_argument('--crossover_rate', type=float, default=0.8, help="Keresztezési ráta.")
+    ga_group.add_argument('--stall_generations', type=int, default=None, help="Leállás ennyi javulás nélküli generáció után.")
+    ga_group.add_argument('--tolerance', type=float, default=0.0, help="A javulásnak számító minimális relatív fitneszcsökkenés.")
+    ga_group.add_argument('--time_budget', type=float, default=None, help="Időkeret másodpercben.")
+    ga_group.add_argument('--target_fitness', type=float, default=None, help="Leállás a célfitnesz elérésekor.")
+    ga_group.add_argument('--fitness_cache_size', type=int, default=0, help="A fitnesz LRU gyorsítótár mérete (0 = kikapcsolva).")
+    ga_group.add_argument('--selection', choices=sorted(SELECTION_METHODS), default='roulette', help="Szelekciós eljárás.")
+    ga_group.add_argument('--tournament_size', type=int, default=2, help="A verseny szelekció mérete.")
+    ga_group.add_argument('--elitism', type=int, default=0, help="Változatlanul továbbvitt legjobb egyedek száma.")
+    ga_group.add_argument('--local_search', choices=sorted(LOCAL_SEARCH_METHODS), default=None,
+                          help="Memetikus mód: az elit egyedek lokális finomítása a megadott eljárással.")
+    ga_group.add_argument('--local_search_interval', type=int, default=10, help="Lokális finomítás ennyi generációnként.")
+    ga_group.add_argument('--local_search_elite', type=int, default=1, help="A lokálisan finomított legjobb egyedek száma.")
+    ga_group.add_argument('--initialization', choices=['random', 'smart'], default='random',
+                          help="Kezdeti populáció: véletlen, vagy részben olcsó körbecslésekből indított.")
+    ga_group.add_argument('--multiresolution', action='store_true',
+                          help="A fitnesz kezdetben részmintán (a konvex burokkal), később a teljes ponthalmazon.")
+    ga_group.add_argument('--sample_size', type=int, default=1024, help="A többfelbontású mód kezdő mintamérete.")
+    ga_group.add_argument('--use_hull', action='store_true', help="A GA csak a konvex burok csúcsain fusson.")
+    ga_group.add_argument('--backend', choices=FITNESS_BACKENDS, default='numpy',
+                          help="A fitnesz számítás megvalósítása (a 'numba' csak telepített Numba mellett).")
+    ga_group.add_argument('--threads', type=int, default=1,
+                          help="A fitnesz számítás szálainak száma (0 = minden processzormag).")
+    ga_group.add_argument('--parallel_min_pairs', type=int, default=None,
+                          help="Ennyi (egyed, pont) pár alatt a fitnesz sorosan számol "
+                               "(alapértelmezés: fitness.PARALLEL_MIN_PAIRS, 0 = mérés ezen a gépen).")
+    ga_group.add_argument('--memory_budget_mb', type=float, default=8, help="A fitnesz számítás memóriakerete (MB).")
     
+    # --- Argumentumok a sziget modellhez ---
+    island_group = parser.add_argument_group("Sziget Modell Paraméterek (--engine island)")
+    island_group.add_argument('--islands', type=int, default=4, help="Szigetek (munkafolyamatok) száma.")
+    island_group.add_argument('--migration_interval', type=int, default=20, help="Migráció ennyi generációnként.")
+    island_group.add_argument('--migration_size', type=int, default=2, help="Szigetenként kivándorló egyedek száma.")
+    island_group.add_argument('--topology', choices=TOPOLOGIES, default='ring', help="Migrációs topológia.")
+
+    # --- Argumentumok a CMA-ES és DE motorokhoz ---
+    es_group = parser.add_argument_group("CMA-ES és DE Paraméterek (--engine cmaes / de)")
+    es_group.add_argument('--sigma', type=float, default=0.3, help="CMA-ES kezdő lépésköz a tartományra normált térben.")
+    es_group.add_argument('--de_weight', type=float, default=0.8, help="DE differencia súly (F).")
+    es_group.add_argument('--de_crossover_rate', type=float, default=0.9, help="DE keresztezési valószínűség (CR).")
+
     # --- Egyéb argumentumok ---
     other_group = parser.add_argument_group("Egyéb")
     other_group.add_argument('--no_visualization', action='store_true', help="Ne jelenjen meg a vizualizációs ablak.")
-    other_group.add_argument('--save_points_to', type=str, default=None, help="Fájl útvonal, ahova a generált pontok mentésre kerülnek (CSV).")
+    other_group.add_argument('--progress_interval', type=int, default=20,
+                             help="A legjobb fitnesz kiírása ennyi generációnként (0 = nincs kiírás).")
+    other_group.add_argument('--profile', action='store_true',
+                             help="Fázisonkénti futási idő mérése és kiírása (GA, CMA-ES, DE).")
+    other_group.add_argument('--save_points_to', type=str, default=None,
+                             help="Fájl útvonal, ahova a pontok mentésre kerülnek (formátum a kiterjesztés szerint: .npy, .npz, .bin, .csv).")
+    other_group.add_argument('--output', type=str, default=None,
+                             help="Az eredmény (kör és fitnesz előzmények) mentése .npz fájlba.")
 
 
     args = parser.parse_args()
 
     print("--- Paraméterek ---")
-    print(f"Pontgenerálás: Pontok={args.points}, Sugár={args.radius}, Zaj={args.noise}, Kiugró pontok={args.outliers}")
-    print(f"Genetikus Algoritmus: Populáció={args.pop_size}, Generációk={args.generations}, Mutáció={args.mutation_rate}")
+    if args.input:
+        print(f"Bemenet: {args.input}")
+    else:
+        print(f"Pontgenerálás: Pontok={args.points}, Sugár={args.radius}, Zaj={args.noise}, Kiugró pontok={args.outliers}")
+    print(f"Genetikus Algoritmus: Populáció={args.pop_size or 'alapértelmezett'}, Generációk={args.generations}, Mutáció={args.mutation_rate}")
     print("-" * 20)
 
-    # 1. Ponthalmaz generálása
-    print("1. Ponthalmaz generálása...")
-    points = generate_point_cloud(
-        num_points=args.points,
-        radius=args.radius,
-        random_noise=args.noise,
-        num_outliers=args.outliers,
-        shape_error=args.shape_error
-    )
+    if args.parallel_min_pairs == 0 and args.threads != 1:
+        # A küszöböt ezen a gépen mérjük; a sziget-modell folyamatai paraméterként kapják meg
+        args.parallel_min_pairs = calibrate_parallel_threshold(args.threads)
+        print(f"Mért párhuzamosítási küszöb: {args.parallel_min_pairs} (egyed, pont) pár")
+
+    # 1. Ponthalmaz generálása vagy beolvasása
+    if args.input:
+        print("1. Ponthalmaz beolvasása...")
+        load_start = time.time()
+        points = load_points(args.input, dtype=args.dtype, raw_dtype=args.raw_dtype)
+        print(f"{len(points)} pont ({points.dtype}) beolvasva {time.time() - load_start:.3f} másodperc alatt.")
+    else:
+        print("1. Ponthalmaz generálása...")
+        points = generate_point_cloud(
+            num_points=args.points,
+            radius=args.radius,
+            random_noise=args.noise,
+            num_outliers=args.outliers,
+            shape_error=args.shape_error,
+            dtype=args.dtype or np.float64
+        )
     
     if args.save_points_to:
-        np.savetxt(args.save_points_to, points, delimiter=",")
+        save_points(args.save_points_to, points, raw_dtype=args.raw_dtype)
         print(f"Pontok elmentve ide: {args.save_points_to}")
 
-    # 2. Genetikus algoritmus futtatása
-    print("2. Genetikus algoritmus futtatása...")
-    start_time = time.time()
-    
-    ga = CircleGA(
-        points,
-        population_size=args.pop_size,
-        generations=args.generations,
-        mutation_rate=args.mutation_rate,
-        crossover_rate=args.crossover_rate
-    )
-    best_circle, fitness_history = ga.run()
+    # 2. Megoldó futtatása
+    callbacks = [ProgressPrinter(args.progress_interval)] if args.progress_interval > 0 else []
+    if args.engine == 'exact':
+        print("2. Egzakt (Welzl) megoldó futtatása...")
+        start_time = time.time()
+        solver = ExactCircleSolver(points)
+    elif args.engine == 'online':
+        print(f"2. Online megoldó futtatása {args.batch_size} pontos kötegekkel...")
+        start_time = time.time()
+        solver = OnlineCircleFitter()
+    elif args.engine in ('cmaes', 'de'):
+        print(f"2. {'CMA-ES' if args.engine == 'cmaes' else 'Differenciális evolúció'} futtatása...")
+        start_time = time.time()
+        engine_params = dict(sigma=args.sigma) if args.engine == 'cmaes' else \
+            dict(weight=args.de_weight, crossover_rate=args.de_crossover_rate)
+        solver = make_strategy(
+            args.engine,
+            points,
+            population_size=args.pop_size,
+            generations=args.generations,
+            memory_budget_mb=args.memory_budget_mb,
+            use_hull=args.use_hull,
+            stall_generations=args.stall_generations,
+            tolerance=args.tolerance,
+            time_budget=args.time_budget,
+            target_fitness=args.target_fitness,
+            backend=args.backend,
+            n_threads=args.threads,
+            parallel_min_pairs=args.parallel_min_pairs,
+            callbacks=callbacks,
+            profile=args.profile,
+            **engine_params
+        )
+    else:
+        ga_params = dict(
+            population_size=args.pop_size or 200,
+            mutation_rate=args.mutation_rate,
+            crossover_rate=args.crossover_rate,
+            memory_budget_mb=args.memory_budget_mb,
+            use_hull=args.use_hull,
+            stall_generations=args.stall_generations,
+            tolerance=args.tolerance,
+            time_budget=args.time_budget,
+            target_fitness=args.target_fitness,
+            fitness_cache_size=args.fitness_cache_size,
+            selection=args.selection,
+            tournament_size=args.tournament_size,
+            elitism=args.elitism,
+            local_search=args.local_search,
+            local_search_interval=args.local_search_interval,
+            local_search_elite=args.local_search_elite,
+            initialization=args.initialization,
+            multiresolution=args.multiresolution,
+            sample_size=args.sample_size,
+            backend=args.backend,
+            n_threads=args.threads,
+            parallel_min_pairs=args.parallel_min_pairs
+        )
+        if args.engine == 'island':
+            print(f"2. Sziget-modellű genetikus algoritmus futtatása ({args.islands} sziget)...")
+            start_time = time.time()
+            solver = IslandCircleGA(
+                points,
+                n_islands=args.islands,
+                migration_interval=args.migration_interval,
+                migration_size=args.migration_size,
+                topology=args.topology,
+                generations=args.generations,
+                **ga_params
+            )
+        else:
+            print("2. Genetikus algoritmus futtatása...")
+            start_time = time.time()
+            solver = CircleGA(points, generations=args.generations, callbacks=callbacks, profile=args.profile,
+                              **ga_params)
+            if args.use_hull:
+                print(f"Konvex burok: {solver.n_input_points} -> {len(solver.points)} pont (csökkentés: {solver.reduction_ratio:.1f}x)")
+    if args.engine == 'online':
+        chunks = (points[start:start + args.batch_size] for start in range(0, len(points), args.batch_size))
+        best_circle = solver.fit(chunks)
+        fitness_history = [best_circle[2]]
+        print(f"Újraoldások száma: {solver.n_resolves}, eldobott belső pontok: {solver.n_discarded}, "
+              f"tárolt burokcsúcsok: {len(solver.hull)}")
+    else:
+        best_circle, fitness_history = solver.run()
+    if args.engine == 'ga':
+        print(f"Megspórolt fitnesz kiértékelések: {solver.saved_evaluation_rate:.1%} "
+              f"(gyorsítótár találati arány: {solver.cache_hit_rate:.1%})")
+        if args.local_search:
+            print(f"Lokális keresés fitnesz kiértékelései: {solver.local_search_evaluations}")
     
     end_time = time.time()
     execution_time = end_time - start_time
     print(f"Az algoritmus futási ideje: {execution_time:.2f} másodperc.")
+    if args.engine not in ('exact', 'online'):
+        print(f"Lefutott generációk: {len(fitness_history)}, leállás oka: {fitness_history.stop_reason}")
+    if getattr(fitness_history, 'evaluations', None):
+        print(f"Fitnesz kiértékelések száma: {fitness_history.evaluations[-1]}")
+    if args.profile and hasattr(solver, 'stats'):
+        print("Fázisonkénti futási idő:")
+        print(solver.stats.summary())
 
     # 3. Eredmények kiírása
     print("\n--- Eredmény ---")
@@ -78,13 +249,19 @@ def main():
     print(f"  Középpont: ({best_circle[0]:.2f}, {best_circle[1]:.2f})")
     print(f"  Sugár: {best_circle[2]:.2f}")
 
+    if args.output:
+        save_result(args.output, best_circle, fitness_history)
+        print(f"Eredmény elmentve ide: {args.output}")
+
     # 4. Vizualizáció
     if not args.no_visualization:
         print("\n3. Eredmény megjelenítése...")
+        from visualization import visualize_solution
         visualize_solution(
             points, 
             best_circle, 
-            title=f"GA Eredménye ({args.generations} generáció)"
+            title="Egzakt megoldás" if args.engine in ('exact', 'online') else
+                  f"{ENGINE_TITLES[args.engine]} Eredménye ({len(fitness_history)} generáció)"
         )
 
 if __name__ == '__main__':
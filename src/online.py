@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from geometry import convex_hull
+from exact_solver import welzl_circle, CONTAIN_TOLERANCE
+
+
+class OnlineCircleFitter:
+    """
+    Legkisebb befoglaló kör folyamatosan (kötegekben) érkező pontokra.
+
+    A fitter csak az eddigi pontok konvex burkát és az aktuális kört tárolja,
+    mert a legkisebb befoglaló kör csak a burok csúcsaitól függ. Egy új köteg
+    feldolgozása:
+    - a burokba írt, a kör középpontja körüli korongba eső pontok sem a burkot,
+      sem a kört nem változtathatják meg, ezeket eldobjuk;
+    - a körön belüli, de a korongon kívüli pontok egy átmeneti pufferbe kerülnek,
+      amelyet `buffer_size` pont felett beolvasztunk a burokba;
+    - ha egy pont a körön kívül esik, a puffert és a kívül eső pontokat a
+      burokkal egyesítjük, és a kört csak a burok csúcsain oldjuk meg újra
+      (Welzl algoritmus).
+    Így a körön belül maradó kötegek költsége O(köteg méret), a memória pedig a
+    burok és a puffer méretével arányos.
+
+    Args:
+        buffer_size (int): A burokba még be nem olvasztott pontok pufferének mérete.
+    """
+    def __init__(self, buffer_size=1024):
+        self.buffer_size = buffer_size
+        self.hull = np.empty((0, 2))
+        self.center = None
+        self.radius = 0.0
+        self.inner_radius = 0.0
+        self._pending = []
+        self._n_pending = 0
+
+        # Statisztikák
+        self.n_seen = 0
+        self.n_discarded = 0
+        self.n_resolves = 0
+
+    @property
+    def circle(self):
+        """Az aktuális kör (cx, cy, r) tömbként, vagy None, ha még nem érkezett pont."""
+        if self.center is None:
+            return None
+        return np.array([self.center[0], self.center[1], self.radius])
+
+    def _merge_pending(self, extra=None):
+        """A puffer (és az `extra` pontok) beolvasztása a konvex burokba."""
+        parts = [self.hull] + self._pending + ([extra] if extra is not None else [])
+        self.hull = convex_hull(np.concatenate(parts))
+        self._pending = []
+        self._n_pending = 0
+        self._update_inner_radius()
+
+    def _update_inner_radius(self):
+        """
+        A kör középpontja körüli, a burokba írható legnagyobb korong sugara:
+        a középpont távolsága a burok legközelebbi élének egyenesétől.
+        Az ebbe eső pontok biztosan a burok belsejében vannak.
+        """
+        if len(self.hull) < 3 or self.center is None:
+            self.inner_radius = 0.0
+            return
+        edges = np.roll(self.hull, -1, axis=0) - self.hull
+        to_center = self.center - self.hull
+        # A csúcsok az óramutatóval ellentétes sorrendben vannak, így a belső oldalon pozitív
+        cross = edges[:, 0] * to_center[:, 1] - edges[:, 1] * to_center[:, 0]
+        distances = cross / np.hypot(edges[:, 0], edges[:, 1])
+        self.inner_radius = max(0.0, distances.min())
+
+    def _resolve(self):
+        """A kör újraszámítása a burok csúcsain."""
+        cx, cy, r = welzl_circle(self.hull)
+        self.center = np.array([cx, cy])
+        self.radius = r
+        self.n_resolves += 1
+        self._update_inner_radius()
+
+    def update(self, batch):
+        """
+        Egy új pontköteg feldolgozása.
+
+        Args:
+            batch (np.ndarray): (K, 2) alakú pontköteg.
+
+        Returns:
+            np.ndarray: Az aktuális kör (cx, cy, r).
+        """
+        batch = np.asarray(batch, dtype=float).reshape(-1, 2)
+        if len(batch) == 0:
+            return self.circle
+        self.n_seen += len(batch)
+
+        if self.center is None:
+            self._merge_pending(batch)
+            self._resolve()
+            return self.circle
+
+        dist_sq = np.sum((batch - self.center) ** 2, axis=1)
+        interior = dist_sq < self.inner_radius ** 2
+        self.n_discarded += np.count_nonzero(interior)
+        limit = (self.radius * (1 + CONTAIN_TOLERANCE)) ** 2 + CONTAIN_TOLERANCE
+        outside = dist_sq > limit
+
+        if outside.any():
+            # A kör sérül: a jelölt pontokat a burokba olvasztjuk és újraoldjuk
+            self._merge_pending(batch[~interior])
+            self._resolve()
+        else:
+            candidates = batch[~interior]
+            if len(candidates):
+                self._pending.append(candidates)
+                self._n_pending += len(candidates)
+                if self._n_pending > max(self.buffer_size, len(self.hull)):
+                    self._merge_pending()
+        return self.circle
+
+    def fit(self, chunks):
+        """
+        Egy pontköteg-iterátor (vagy generátor) teljes feldolgozása.
+
+        Returns:
+            np.ndarray: A végső kör (cx, cy, r).
+        """
+        for batch in chunks:
+            self.update(batch)
+        return self.circle
+
+    def track(self, chunks):
+        """Generátor: minden feldolgozott köteg után az aktuális kört adja vissza."""
+        for batch in chunks:
+            yield self.update(batch)
+
+
+def fit_stream(chunks, buffer_size=1024):
+    """
+    Kényelmi függvény: legkisebb befoglaló kör egy pontköteg-iterátorra.
+
+    Returns:
+        np.ndarray: A kör (cx, cy, r).
+    """
+    return OnlineCircleFitter(buffer_size=buffer_size).fit(chunks)
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 import numpy as np
-import matplotlib.pyplot as plt
 
 def generate_point_cloud(
     center=(0, 0),
@@ -9,7 +8,8 @@ def generate_point_cloud(
     shape_error=0.1,
     random_noise=5.0,
     num_outliers=5,
-    outlier_range_factor=1.5
+    outlier_range_factor=1.5,
+    dtype=np.float64
 ):
     """
     Hibákkal terhelt 2D ponthalmazt generál egy kör alapján.
@@ -24,6 +24,8 @@ def generate_point_cloud(
         num_outliers (int): A generálandó kiugró pontok száma.
         outlier_range_factor (float): Meghatározza, milyen messze lehetnek a kiugró pontok.
                                       A tartomány `radius`-tól `radius * outlier_range_factor`-ig terjed.
+        dtype (np.dtype): A visszaadott tömb típusa; `np.float32` feleannyi memóriát
+                          használ (a generálás float64 pontossággal történik).
 
     Returns:
         np.ndarray: Egy (num_points + num_outliers, 2) alakú numpy tömb, ami a pontokat tartalmazza.
@@ -65,32 +67,25 @@ def generate_point_cloud(
         
     np.random.shuffle(points) # Pontok megkeverése
     
-    return points
+    return points.astype(dtype, copy=False)
 
-def visualize_point_cloud(points, title="Generált ponthalmaz", save_path=None):
-    """
-    Megjeleníti a ponthalmazt egy pontdiagram segítségével.
 
-    Args:
-        points (np.ndarray): A megjelenítendő pontokat tartalmazó tömb.
-        title (str): A diagram címe.
-        save_path (str, optional): Ha meg van adva, a diagramot elmenti a megadott útvonalra.
-    """
-    plt.figure(figsize=(8, 8))
-    plt.scatter(points[:, 0], points[:, 1], alpha=0.7, edgecolors='k')
-    plt.title(title)
-    plt.xlabel("X koordináta")
-    plt.ylabel("Y koordináta")
-    plt.gca().set_aspect('equal', adjustable='box')
-    plt.grid(True)
-    
-    if save_path:
-        plt.savefig(save_path)
-        print(f"A diagram elmentve: {save_path}")
-        
-    plt.show()
+# A korábbi `from point_generator import visualize_point_cloud` importok kedvéért:
+# a függvény a `visualization` modulba került, amelyet (és vele a matplotlibet)
+# csak az első hozzáféréskor töltünk be
+_VISUALIZATION_EXPORTS = ('visualize_point_cloud',)
+
+
+def __getattr__(name):
+    if name in _VISUALIZATION_EXPORTS:
+        import visualization
+        return getattr(visualization, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 if __name__ == '__main__':
+    from visualization import visualize_point_cloud
+
     # --- Paraméterek a pontgeneráláshoz ---
     params = {
         "center": (50, 50),
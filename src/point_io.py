@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+import os
+import zipfile
+import numpy as np
+
+# Fájlformátumok kiterjesztés szerint; a nyers bináris fájl (x, y) párok
+# folytonos sorozata fejléc nélkül. A tárolási típust a fájl nem rögzíti, ezért
+# beolvasáskor és mentéskor ugyanazt kell megadni (alapértelmezésben float32).
+FORMATS = {
+    '.npy': 'npy',
+    '.npz': 'npz',
+    '.bin': 'raw',
+    '.raw': 'raw',
+    '.f32': 'raw',
+    '.csv': 'csv',
+    '.txt': 'csv',
+}
+RAW_DEFAULT_DTYPE = np.float32
+
+# A CSV beolvasás kötegmérete (sor)
+CSV_CHUNK_SIZE = 1_000_000
+
+
+def detect_format(path, file_format=None):
+    """A fájlformátum a megadott érték, vagy a kiterjesztésből (lásd `FORMATS`)."""
+    if file_format is not None:
+        return file_format
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in FORMATS:
+        raise ValueError(f"Ismeretlen fájlformátum: {extension} (lehetséges: {', '.join(sorted(FORMATS))})")
+    return FORMATS[extension]
+
+
+def _check_points(points, path):
+    """Ellenőrzi, hogy a beolvasott tömb (N, 2) alakú."""
+    if points.ndim != 2 or points.shape[1] != 2:
+        raise ValueError(f"{path}: (N, 2) alakú ponthalmaz kell, a fájlban {points.shape} alakú tömb van")
+    return points
+
+
+def _cast(points, dtype):
+    """Típuskonverzió csak akkor, ha szükséges (a memóriatérképes tömb így nem másolódik)."""
+    if dtype is None or points.dtype == np.dtype(dtype):
+        return points
+    return points.astype(dtype)
+
+
+def _memmap_npz_member(path, key):
+    """
+    Egy tömörítetlen .npz tag memóriatérképe másolás nélkül.
+    A tag egy .npy fájl a zip archívumban; a helyi fájlfejléc és a .npy fejléc
+    után a nyers adatot közvetlenül leképezzük. Tömörített tagnál None.
+    """
+    with zipfile.ZipFile(path) as archive:
+        info = archive.getinfo(key + '.npy')
+    if info.compress_type != zipfile.ZIP_STORED:
+        return None
+    with open(path, 'rb') as f:
+        # Helyi fájlfejléc: 30 bájt + fájlnév + extra mező
+        f.seek(info.header_offset + 26)
+        name_length, extra_length = np.frombuffer(f.read(4), dtype='<u2')
+        f.seek(info.header_offset + 30 + int(name_length) + int(extra_length))
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+        offset = f.tell()
+    if dtype.hasobject:
+        return None
+    return np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=shape,
+                     order='F' if fortran_order else 'C')
+
+
+def _npz_key(path, key):
+    """A ponthalmaz kulcsa: a megadott, a 'points', vagy az egyetlen tömb."""
+    with np.load(path) as archive:
+        keys = archive.files
+    if key is not None:
+        return key
+    if 'points' in keys:
+        return 'points'
+    if len(keys) == 1:
+        return keys[0]
+    raise ValueError(f"{path}: több tömb van a fájlban ({', '.join(keys)}), adja meg a kulcsot")
+
+
+def _csv_has_header(path, delimiter):
+    """Igaz, ha a CSV első sora nem számokból áll (fejléc)."""
+    with open(path) as f:
+        first = f.readline()
+    try:
+        [float(value) for value in first.replace(delimiter or ',', ' ').split()]
+    except ValueError:
+        return True
+    return False
+
+
+def iter_point_chunks(path, chunk_size=CSV_CHUNK_SIZE, dtype=None, file_format=None, delimiter=',',
+                      raw_dtype=RAW_DEFAULT_DTYPE):
+    """
+    Egy ponthalmaz fájl kötegenkénti beolvasása (például az online megoldóhoz).
+    A bináris formátumok kötegei a memóriatérkép szeletei, a CSV fájlt
+    `chunk_size` soronként dolgozzuk fel, így a teljes fájl sosem kerül a memóriába.
+
+    Args:
+        path (str): A fájl útvonala.
+        chunk_size (int): A kötegek mérete (pont).
+        dtype: A kötegek típusa (None = a fájl típusa; CSV esetén float64).
+        file_format (str, optional): 'npy', 'npz', 'raw' vagy 'csv'; alapértelmezésben a kiterjesztésből.
+        delimiter (str): A CSV elválasztó karaktere.
+        raw_dtype: A nyers bináris fájl tárolási típusa (lásd `load_points`).
+
+    Yields:
+        np.ndarray: (K, 2) alakú pontkötegek.
+    """
+    if detect_format(path, file_format) == 'csv':
+        import pandas as pd
+        reader = pd.read_csv(path, sep=delimiter, header=0 if _csv_has_header(path, delimiter) else None,
+                             usecols=[0, 1], dtype=dtype or np.float64, chunksize=chunk_size)
+        for frame in reader:
+            yield frame.to_numpy()
+        return
+
+    points = load_points(path, dtype=None, file_format=file_format, raw_dtype=raw_dtype)
+    for start in range(0, len(points), chunk_size):
+        yield _cast(points[start:start + chunk_size], dtype)
+
+
+def load_points(path, dtype=None, file_format=None, mmap=True, key=None, delimiter=',', raw_dtype=RAW_DEFAULT_DTYPE):
+    """
+    Ponthalmaz betöltése fájlból.
+
+    A .npy és a tömörítetlen .npz fájlokat, valamint a nyers bináris fájlokat
+    csak olvasható memóriatérképként nyitjuk meg, így a betöltés a fájl méretétől
+    függetlenül azonnali, az adatot az operációs rendszer igény szerint olvassa be.
+    A CSV fájlokat kötegenként olvassuk (lásd `iter_point_chunks`).
+
+    Args:
+        path (str): A fájl útvonala.
+        dtype: A kívánt típus; None = a fájl típusa (nyers binárisnál `raw_dtype`,
+               CSV-nél float64). Eltérő típus esetén a tömb a memóriába másolódik.
+        file_format (str, optional): 'npy', 'npz', 'raw' vagy 'csv'; alapértelmezésben a kiterjesztésből.
+        mmap (bool): Memóriatérkép használata; False esetén a teljes fájl a memóriába kerül.
+        key (str, optional): A tömb neve .npz fájlban (alapértelmezésben 'points' vagy az egyetlen tömb).
+        delimiter (str): A CSV elválasztó karaktere.
+        raw_dtype: A nyers bináris fájl elemeinek típusa a lemezen (a fájl nem
+                   tárolja, a mentéskor használttal egyeznie kell, lásd `save_points`).
+
+    Returns:
+        np.ndarray: (N, 2) alakú ponthalmaz (memóriatérképes fájlnál np.memmap).
+    """
+    file_format = detect_format(path, file_format)
+    mmap_mode = 'r' if mmap else None
+
+    if file_format == 'npy':
+        points = np.load(path, mmap_mode=mmap_mode)
+    elif file_format == 'npz':
+        key = _npz_key(path, key)
+        points = _memmap_npz_member(path, key) if mmap else None
+        if points is None:
+            # Tömörített tag: csak kicsomagolva olvasható
+            with np.load(path) as archive:
+                points = archive[key]
+    elif file_format == 'raw':
+        # A fájlt a tárolási típusával képezzük le, a kért típusra a végén konvertálunk
+        if mmap:
+            points = np.memmap(path, dtype=raw_dtype, mode='r')
+        else:
+            points = np.fromfile(path, dtype=raw_dtype)
+        if len(points) % 2:
+            raise ValueError(f"{path}: a nyers bináris fájl páratlan számú értéket tartalmaz")
+        points = points.reshape(-1, 2)
+    elif file_format == 'csv':
+        chunks = list(iter_point_chunks(path, dtype=dtype, file_format='csv', delimiter=delimiter))
+        points = np.concatenate(chunks) if chunks else np.empty((0, 2), dtype=dtype or np.float64)
+    else:
+        raise ValueError(f"Ismeretlen fájlformátum: {file_format} (lehetséges: {', '.join(sorted(set(FORMATS.values())))})")
+
+    return _cast(_check_points(points, path), dtype)
+
+
+def save_points(path, points, file_format=None, raw_dtype=RAW_DEFAULT_DTYPE):
+    """
+    Ponthalmaz mentése a kiterjesztésnek megfelelő formátumban (.npy, .npz,
+    nyers bináris vagy CSV). A bináris formátumok memóriatérképként tölthetők vissza.
+    A nyers bináris fájl `raw_dtype` típussal készül (alapértelmezésben float32,
+    mint a `load_points`-ban), mert a típus a fájlban nincs rögzítve.
+    """
+    file_format = detect_format(path, file_format)
+    if file_format == 'raw':
+        points = np.ascontiguousarray(points, dtype=raw_dtype)
+    else:
+        points = np.ascontiguousarray(points)
+    if file_format == 'npy':
+        np.save(path, points)
+    elif file_format == 'npz':
+        np.savez(path, points=points)
+    elif file_format == 'raw':
+        points.tofile(path)
+    elif file_format == 'csv':
+        np.savetxt(path, points, delimiter=",")
+    else:
+        raise ValueError(f"Ismeretlen fájlformátum: {file_format} (lehetséges: {', '.join(sorted(set(FORMATS.values())))})")
+
+
+def save_result(path, circle, fitness_history=None):
+    """
+    Az illesztés eredményének mentése .npz fájlba: a kör (cx, cy, r), és ha
+    van, a generációnkénti legjobb fitnesz és a kiértékelések száma.
+    """
+    arrays = {'circle': np.asarray(circle, dtype=np.float64)}
+    if fitness_history is not None:
+        arrays['fitness_history'] = np.asarray(fitness_history, dtype=np.float64)
+        if getattr(fitness_history, 'evaluations', None):
+            arrays['evaluations'] = np.asarray(fitness_history.evaluations)
+    np.savez(path, **arrays)
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+
+def _inverse_fitness(fitness_scores):
+    """Szelekciós súlyok: a kisebb fitnesz nagyobb súlyt kap."""
+    return 1 / (fitness_scores + 1e-6) # + 1e-6 a nullával való osztás elkerülésére
+
+
+def roulette_selection(fitness_scores, n_selected):
+    """
+    Rulettkerekes szelekció a fitnesz inverzével arányos valószínűségekkel
+    (az eredeti `CircleGA` szelekció), egyetlen kumulatív összeg és keresés.
+    """
+    cumulative = np.cumsum(_inverse_fitness(fitness_scores))
+    draws = np.random.rand(n_selected) * cumulative[-1]
+    return np.minimum(np.searchsorted(cumulative, draws, side='right'), len(fitness_scores) - 1)
+
+
+def tournament_selection(fitness_scores, n_selected, tournament_size=2):
+    """
+    Verseny szelekció: minden helyre `tournament_size` véletlen egyed közül a
+    legjobb kerül. Csak a fitneszek sorrendje számít, így a nagy büntetések
+    nem torzítják a szelekciós nyomást.
+    """
+    contestants = np.random.randint(0, len(fitness_scores), (n_selected, tournament_size))
+    winners = np.argmin(fitness_scores[contestants], axis=1)
+    return contestants[np.arange(n_selected), winners]
+
+
+def sus_selection(fitness_scores, n_selected):
+    """
+    Sztochasztikus univerzális mintavétel (SUS): egyetlen véletlen eltolással,
+    egyenletes közű mutatókkal választ a fitnesz inverzével arányosan.
+    Kisebb a szórása, mint a rulettkeréknek.
+    """
+    cumulative = np.cumsum(_inverse_fitness(fitness_scores))
+    step = cumulative[-1] / n_selected
+    pointers = (np.random.rand() + np.arange(n_selected)) * step
+    selected = np.minimum(np.searchsorted(cumulative, pointers, side='right'), len(fitness_scores) - 1)
+    # A mutatók sorrendje rendezett, ezért keverünk, hogy a párosítás véletlen legyen
+    return np.random.permutation(selected)
+
+
+def rank_selection(fitness_scores, n_selected, pressure=1.5):
+    """
+    Lineáris rang szelekció: a valószínűség csak a rangtól függ.
+    A `pressure` (1..2) a legjobb egyed várható kiválasztási száma.
+    """
+    n = len(fitness_scores)
+    ranks = np.empty(n)
+    ranks[np.argsort(-fitness_scores)] = np.arange(n) # a legrosszabb rangja 0, a legjobbé n-1
+    weights = (2 - pressure) + 2 * (pressure - 1) * ranks / max(1, n - 1)
+    cumulative = np.cumsum(weights)
+    draws = np.random.rand(n_selected) * cumulative[-1]
+    return np.minimum(np.searchsorted(cumulative, draws, side='right'), n - 1)
+
+
+# A választható szelekciós eljárások
+SELECTION_METHODS = {
+    'roulette': roulette_selection,
+    'tournament': tournament_selection,
+    'sus': sus_selection,
+    'rank': rank_selection,
+}
+
+
+def select_indices(method, fitness_scores, n_selected, **kwargs):
+    """
+    Szülők indexeinek kiválasztása a megnevezett eljárással.
+
+    Args:
+        method (str): A szelekció neve (lásd `SELECTION_METHODS`).
+        fitness_scores (np.ndarray): A populáció fitnesze (kisebb = jobb).
+        n_selected (int): A kiválasztandó szülők száma.
+        **kwargs: Az eljárás további paraméterei (pl. `tournament_size`).
+
+    Returns:
+        np.ndarray: A kiválasztott egyedek indexei.
+    """
+    if method not in SELECTION_METHODS:
+        raise ValueError(f"Ismeretlen szelekció: {method} (lehetséges: {', '.join(SELECTION_METHODS)})")
+    return SELECTION_METHODS[method](fitness_scores, n_selected, **kwargs)
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+import time
+import numpy as np
+
+# A futás leállásának lehetséges okai (FitnessHistory.stop_reason)
+STOP_GENERATIONS = 'generations'       # elérte a megadott generációszámot
+STOP_STALL = 'stall'                   # nem javult a megadott számú generáción át
+STOP_TIME_BUDGET = 'time_budget'       # elfogyott az időkeret
+STOP_TARGET_FITNESS = 'target_fitness' # elérte a célfitneszt
+
+
+class StopCriteria:
+    """
+    A motorok (`CircleGA`, `strategies.CircleStrategy`, `island_ga.IslandCircleGA`)
+    közös leállási feltételei és azok könyvelése.
+
+    A futás a generációk maximális száma előtt is leáll, ha
+    - `stall_generations` generáción át a legjobb fitnesz nem javult legalább
+      `tolerance` relatív mértékben,
+    - a futási idő elérte a `time_budget` másodpercet,
+    - a legjobb fitnesz elérte a `target_fitness` értéket.
+    (None = nincs ilyen feltétel.)
+
+    Használat: a futás elején `start()`, generációnként `update(legjobb fitnesz)`,
+    majd `stop_reason(legjobb fitnesz)`, amely a teljesült feltétel nevét adja
+    (lásd `STOP_*`), vagy None-t, ha a futás folytatódhat.
+    """
+    # A motorok egyedi kulcsszavas paraméterei és a nekik megfelelő beállítások
+    PARAMS = {'stall_generations': 'stall_generations', 'tolerance': 'tolerance',
+              'time_budget': 'time_budget', 'target_fitness': 'target_fitness'}
+
+    def __init__(self, stall_generations=None, tolerance=0.0, time_budget=None, target_fitness=None):
+        self.stall_generations = stall_generations
+        self.tolerance = tolerance
+        self.time_budget = time_budget
+        self.target_fitness = target_fitness
+        self.start()
+
+    def start(self):
+        """Az időmérés és a stagnálás számlálásának kezdete."""
+        self._start_time = time.perf_counter()
+        self.stall_reference = np.inf
+        self.stall_count = 0
+
+    def is_improvement(self, fitness, reference):
+        """Igaz, ha a fitnesz legalább `tolerance` relatív mértékben jobb a referenciánál."""
+        if not np.isfinite(reference):
+            return fitness < reference
+        return reference - fitness > self.tolerance * abs(reference)
+
+    def update(self, best_fitness):
+        """Egy generáció könyvelése: az eddigi legjobb fitnesz alapján frissíti a stagnálás számlálóját."""
+        if self.is_improvement(best_fitness, self.stall_reference):
+            self.stall_reference = best_fitness
+            self.stall_count = 0
+        else:
+            self.stall_count += 1
+
+    def restart_stall(self, reference):
+        """A stagnálás számlálása újraindul a megadott referenciától (például mintaváltás után)."""
+        self.stall_reference = reference
+        self.stall_count = 0
+
+    def target_reached(self, best_fitness):
+        """Igaz, ha a legjobb fitnesz elérte a célfitneszt."""
+        return self.target_fitness is not None and best_fitness <= self.target_fitness
+
+    def stop_reason(self, best_fitness, check_convergence=True):
+        """
+        A teljesült leállási feltétel.
+
+        Args:
+            best_fitness (float): Az eddigi legjobb fitnesz.
+            check_convergence (bool): False esetén csak az időkeretet vizsgáljuk
+                                      (a többfelbontású GA a célfitneszt és a
+                                      stagnálást csak a teljes ponthalmazon értékeli).
+
+        Returns:
+            str: A feltétel neve (lásd `STOP_*`), vagy None, ha egyik sem teljesült.
+        """
+        if check_convergence:
+            if self.target_reached(best_fitness):
+                return STOP_TARGET_FITNESS
+            if self.stall_generations is not None and self.stall_count >= self.stall_generations:
+                return STOP_STALL
+        if self.time_budget is not None and time.perf_counter() - self._start_time >= self.time_budget:
+            return STOP_TIME_BUDGET
+        return None
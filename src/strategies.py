@@ -0,0 +1,306 @@
+# -*- coding: utf-8 -*-
+import time
+import numpy as np
+
+from fitness import FitnessOptions
+from geometry import convex_hull
+from telemetry import PhaseTimer, NULL_TIMER, RunStats, generation_record
+from genetic_algorithm import CircleGA, FitnessHistory, MultiresolutionOptions, group_options, reject_unknown_params
+from local_search import LocalSearchOptions
+from stopping import StopCriteria, STOP_GENERATIONS
+
+# A CircleGA-specifikus paraméterek, amelyeket a többi motor nem támogat: a
+# folytonos mintavétel mellett a fitnesz gyorsítótár nem talál, a többi pedig a
+# GA operátoraira, populációjára vagy mintavételére vonatkozik
+GA_ONLY_PARAMS = ('mutation_rate', 'fitness_cache_size', 'selection', 'tournament_size', 'elitism',
+                  'local_search', *LocalSearchOptions.PARAMS, 'initialization', 'seed_fraction',
+                  'multiresolution', *MultiresolutionOptions.PARAMS, 'initial_circle', 'initial_population')
+
+
+class CircleStrategy:
+    """
+    Közös alap a (cx, cy, r) térben kereső optimalizáló motorokhoz.
+
+    Az interfész a `CircleGA`-t követi: a konstruktor a ponthalmazt és a közös
+    paramétereket kapja (populációméret, generációk, konvex burok, lebegőpontos
+    típus, valamint a `stopping` és `evaluation` beállításcsoport, objektumként vagy
+    egyedi paraméterekkel, lásd `CircleGA`), a `run()` pedig a legjobb (cx, cy, r)
+    kört és egy `FitnessHistory`-t ad vissza, amelynek `evaluations` listája
+    generációnként az összesített fitnesz kiértékelések számát tartalmazza. A
+    leállási feltételeket a `CircleGA`-val közös `stopping.StopCriteria` kezeli.
+    A GA-specifikus paramétereket (lásd `GA_ONLY_PARAMS`, például a fitnesz
+    gyorsítótár, a szelekció, a lokális keresés és a többfelbontású mód) a
+    `make_strategy` a többi motornál hibával elutasítja.
+
+    A leszármazottak a `_step()` metódust valósítják meg, amely egy generációnyi
+    jelölt kört értékel ki, és visszaadja a köröket a fitneszükkel együtt.
+    A keresési tartomány ugyanaz, mint a `CircleGA`-nál.
+
+    A telemetria (`stats`, `callbacks`, `profile`) is a `CircleGA`-t követi;
+    a mért fázisok: mintavétel ('sampling'), fitnesz ('fitness'), az eloszlás
+    vagy populáció frissítése ('update') és könyvelés ('bookkeeping').
+    """
+    default_population_size = 30
+
+    def __init__(self, points, population_size=None, generations=200, use_hull=False, dtype=None, stopping=None,
+                 evaluation=None, callbacks=None, profile=False, **options):
+        # Beállításcsoportok (objektumként vagy egyedi paraméterekkel), lásd `CircleGA`
+        self.stopping = group_options(StopCriteria, stopping, options)
+        self.evaluation = group_options(FitnessOptions, evaluation, options)
+        reject_unknown_params(options)
+
+        # A pontok és a kiértékelt körök típusa, a CircleGA-val azonos módon
+        if dtype is None:
+            dtype = points.dtype if np.issubdtype(points.dtype, np.floating) else np.float64
+        self.dtype = np.dtype(dtype)
+        points = np.asarray(points, dtype=self.dtype)
+        self.n_input_points = len(points)
+        if use_hull:
+            points = convex_hull(points)
+        self.points = points
+        self.reduction_ratio = self.n_input_points / max(1, len(points))
+        self.population_size = population_size or self.default_population_size
+        self.generations = generations
+
+        # A keresési tartomány (cx, cy, r) határai, a CircleGA-val azonos módon
+        min_coords = points.min(axis=0).astype(float)
+        max_coords = points.max(axis=0).astype(float)
+        max_dim = (max_coords - min_coords).max()
+        self.lower = np.array([min_coords[0], min_coords[1], max_dim / 10])
+        self.upper = np.array([max_coords[0], max_coords[1], max_dim])
+
+        self.evaluations = 0
+        self.fitness_history = FitnessHistory()
+
+        # Telemetria: visszahívások és fázisonkénti profilozás
+        self.callbacks = list(callbacks or [])
+        self.profile = profile
+        self.stats = RunStats()
+        self._timer = NULL_TIMER
+
+    def _evaluate(self, circles):
+        """A határokra vágott körök fitnesze; a kiértékeléseket számoljuk."""
+        circles = np.clip(circles, self.lower, self.upper).astype(self.dtype, copy=False)
+        self.evaluations += len(circles)
+        self._timer.lap('sampling')
+        fitness_scores = self.evaluation.evaluate(circles, self.points)
+        self._timer.lap('fitness')
+        return circles, fitness_scores
+
+    def _step(self):
+        """Egy generáció: (körök (K, 3), fitneszek (K,)) a kiértékelt jelöltekről."""
+        raise NotImplementedError
+
+    def run(self):
+        """
+        Futtatja a keresést, amíg valamelyik leállási feltétel nem teljesül
+        (a feltételek jelentése ugyanaz, mint a `CircleGA`-nál).
+        """
+        best_fitness_overall = np.inf
+        best_individual_overall = None
+        self.evaluations = 0
+        self.fitness_history = FitnessHistory()
+        self.fitness_history.stop_reason = STOP_GENERATIONS
+        self.stats = RunStats()
+        self._timer = timer = PhaseTimer(self.stats.phase_ns) if self.profile else NULL_TIMER
+        record_generations = self.profile or self.callbacks
+        run_start_ns = time.perf_counter_ns()
+        stopping = self.stopping
+        stopping.start()
+
+        timer.start()
+        for generation in range(self.generations):
+            circles, fitness_scores = self._step()
+            timer.lap('update')
+            best_idx = np.argmin(fitness_scores)
+            if fitness_scores[best_idx] < best_fitness_overall:
+                best_fitness_overall = fitness_scores[best_idx]
+                best_individual_overall = circles[best_idx].copy()
+
+            self.fitness_history.append(best_fitness_overall)
+            self.fitness_history.evaluations.append(self.evaluations)
+
+            if record_generations:
+                record = generation_record(generation, circles, fitness_scores, best_fitness_overall,
+                                           self.evaluations, self.lower, self.upper)
+                self.stats.generations.append(record)
+                for callback in self.callbacks:
+                    callback(self, record)
+
+            # Leállási feltételek ellenőrzése
+            stopping.update(best_fitness_overall)
+            stop_reason = stopping.stop_reason(best_fitness_overall)
+            if stop_reason is not None:
+                self.fitness_history.stop_reason = stop_reason
+                break
+            timer.lap('bookkeeping')
+
+        timer.lap('bookkeeping')
+        self._timer = NULL_TIMER
+        self.stats.total_ns = time.perf_counter_ns() - run_start_ns
+        self.stats.evaluations = self.evaluations
+        return best_individual_overall, self.fitness_history
+
+
+class CMAESCircle(CircleStrategy):
+    """
+    CMA-ES (kovariancia-mátrix adaptáló evolúciós stratégia) a (cx, cy, r) térben.
+
+    A keresés a tartományra normált [0, 1]^3 koordinátákban fut, a lépésköz és a
+    kovariancia a sikeres lépésekhez alkalmazkodik, így a rögzített mutációs
+    szórású GA-nál jóval kevesebb kiértékelés elég. Az alapértelmezett
+    populációméret 4 + 3 ln(3) = 7, a paraméterek a szokásos (Hansen-féle) értékek.
+
+    Args:
+        sigma (float): A kezdő lépésköz a normált térben.
+    """
+    default_population_size = 4 + int(3 * np.log(3))
+
+    def __init__(self, points, sigma=0.3, **params):
+        super().__init__(points, **params)
+        n = 3
+        self.sigma0 = sigma
+        self.mu = self.population_size // 2
+        weights = np.log(self.mu + 0.5) - np.log(np.arange(1, self.mu + 1))
+        self.weights = weights / weights.sum()
+        self.mueff = 1 / np.sum(self.weights ** 2)
+
+        # Tanulási ráták és csillapítás
+        self.cc = (4 + self.mueff / n) / (n + 4 + 2 * self.mueff / n)
+        self.cs = (self.mueff + 2) / (n + self.mueff + 5)
+        self.c1 = 2 / ((n + 1.3) ** 2 + self.mueff)
+        self.cmu = min(1 - self.c1, 2 * (self.mueff - 2 + 1 / self.mueff) / ((n + 2) ** 2 + self.mueff))
+        self.damps = 1 + 2 * max(0, np.sqrt((self.mueff - 1) / (n + 1)) - 1) + self.cs
+        self.chi_n = np.sqrt(n) * (1 - 1 / (4 * n) + 1 / (21 * n ** 2))
+        self._reset()
+
+    def _reset(self):
+        """A keresési eloszlás kezdőállapota: a tartomány közepe, egységkovariancia."""
+        self.mean = np.full(3, 0.5)
+        self.sigma = self.sigma0
+        self.cov = np.eye(3)
+        self.path_c = np.zeros(3)
+        self.path_s = np.zeros(3)
+        self.generation = 0
+
+    def run(self):
+        self._reset()
+        return super().run()
+
+    def _step(self):
+        n = 3
+        eigenvalues, basis = np.linalg.eigh(self.cov)
+        scales = np.sqrt(np.maximum(eigenvalues, 1e-20))
+
+        # Mintavétel a normált térben, kiértékelés a valódi (cx, cy, r) térben
+        steps = np.random.standard_normal((self.population_size, n)) * scales @ basis.T
+        samples = self.mean + self.sigma * steps
+        circles, fitness_scores = self._evaluate(self.lower + samples * (self.upper - self.lower))
+
+        # A tartományon kívüli mintákat a rangsorolásnál a túllépéssel arányosan
+        # büntetjük, különben a határra vágott minták egyforma fitnesze miatt
+        # az eloszlás a tartományon kívül sodródhat
+        overshoot = np.abs(samples - np.clip(samples, 0, 1)).sum(axis=1)
+        ranking = fitness_scores + overshoot * (self.upper - self.lower).max()
+
+        # Súlyozott rekombináció a legjobb mu lépésből
+        best = np.argsort(ranking)[:self.mu]
+        step_w = self.weights @ steps[best]
+        self.mean = self.mean + self.sigma * step_w
+
+        # Evolúciós utak frissítése
+        inv_sqrt_cov = basis @ np.diag(1 / scales) @ basis.T
+        self.path_s = (1 - self.cs) * self.path_s + np.sqrt(self.cs * (2 - self.cs) * self.mueff) * inv_sqrt_cov @ step_w
+        self.generation += 1
+        norm_s = np.linalg.norm(self.path_s) / np.sqrt(1 - (1 - self.cs) ** (2 * self.generation))
+        h_sigma = norm_s / self.chi_n < 1.4 + 2 / (n + 1)
+        self.path_c = (1 - self.cc) * self.path_c + h_sigma * np.sqrt(self.cc * (2 - self.cc) * self.mueff) * step_w
+
+        # Kovariancia és lépésköz adaptáció
+        rank_mu = (self.weights[:, None] * steps[best]).T @ steps[best]
+        self.cov = ((1 - self.c1 - self.cmu) * self.cov
+                    + self.c1 * (np.outer(self.path_c, self.path_c)
+                                 + (1 - h_sigma) * self.cc * (2 - self.cc) * self.cov)
+                    + self.cmu * rank_mu)
+        self.sigma *= np.exp(self.cs / self.damps * (np.linalg.norm(self.path_s) / self.chi_n - 1))
+        return circles, fitness_scores
+
+
+class DECircle(CircleStrategy):
+    """
+    Differenciális evolúció (DE/rand/1/bin) a (cx, cy, r) térben.
+
+    Minden egyedhez három másik, véletlenül választott egyedből mutáns vektort
+    képzünk (a + F * (b - c)), ezt binomiális keresztezéssel keverjük az eredeti
+    egyeddel, és a próbavektor csak akkor lép a helyére, ha nem rosszabb.
+
+    Args:
+        weight (float): A differencia súlya (F).
+        crossover_rate (float): A binomiális keresztezés valószínűsége (CR).
+    """
+    default_population_size = 30
+
+    def __init__(self, points, weight=0.8, crossover_rate=0.9, **params):
+        super().__init__(points, **params)
+        self.weight = weight
+        self.crossover_rate = crossover_rate
+        self.population = None
+        self.population_fitness = None
+
+    def run(self):
+        self.population = None
+        return super().run()
+
+    def _step(self):
+        size = self.population_size
+        if self.population is None:
+            # Az első generáció egyenletes véletlen minta a tartományban
+            u = np.random.rand(size, 3)
+            self.population, self.population_fitness = self._evaluate(self.lower + u * (self.upper - self.lower))
+            return self.population, self.population_fitness
+
+        # Egyedenként három különböző, az egyedtől is eltérő index
+        keys = np.random.rand(size, size)
+        np.fill_diagonal(keys, np.inf)
+        a, b, c = np.argsort(keys, axis=1)[:, :3].T
+        mutants = self.population[a] + self.weight * (self.population[b] - self.population[c])
+
+        # Binomiális keresztezés; legalább egy gén a mutánsból származik
+        cross = np.random.rand(size, 3) < self.crossover_rate
+        cross[np.arange(size), np.random.randint(0, 3, size)] = True
+        trials, trial_fitness = self._evaluate(np.where(cross, mutants, self.population))
+
+        improved = trial_fitness <= self.population_fitness
+        self.population[improved] = trials[improved]
+        self.population_fitness[improved] = trial_fitness[improved]
+        return trials, trial_fitness
+
+
+# A választható optimalizáló motorok (a CircleGA ugyanazt az interfészt követi)
+STRATEGIES = {
+    'ga': CircleGA,
+    'cmaes': CMAESCircle,
+    'de': DECircle,
+}
+
+
+def make_strategy(name, points, **params):
+    """
+    Optimalizáló motor létrehozása név szerint.
+
+    Args:
+        name (str): A motor neve (lásd `STRATEGIES`).
+        points (np.ndarray): (N, 2) alakú ponthalmaz.
+        **params: A motor konstruktorának paraméterei (a GA-specifikusakat, lásd
+                  `GA_ONLY_PARAMS`, csak a 'ga' motor fogadja el).
+
+    Returns:
+        A motor példánya; `run()` -> (legjobb kör, FitnessHistory).
+    """
+    if name not in STRATEGIES:
+        raise ValueError(f"Ismeretlen motor: {name} (lehetséges: {', '.join(STRATEGIES)})")
+    if name != 'ga':
+        unsupported = [param for param in GA_ONLY_PARAMS if param in params]
+        if unsupported:
+            raise TypeError(f"A(z) {name} motor nem támogatja a következő paramétereket: {', '.join(unsupported)}")
+    return STRATEGIES[name](points, **params)
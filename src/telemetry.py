@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+import time
+import numpy as np
+
+# A CircleGA.run() mért fázisai (RunStats.phase_ns kulcsai)
+PHASES = ('fitness', 'local_search', 'bookkeeping', 'resample', 'selection', 'crossover', 'mutation')
+
+
+class PhaseTimer:
+    """
+    Fázisonkénti összesített idő mérése `perf_counter_ns`-sel.
+    A `lap(phase)` az előző `lap` (vagy `start`) óta eltelt időt a fázishoz adja.
+    """
+    def __init__(self, phase_ns):
+        self.phase_ns = phase_ns
+        self._last = time.perf_counter_ns()
+
+    def start(self):
+        """Új mérési szakasz kezdete (a közbeeső idő egyik fázishoz sem számít)."""
+        self._last = time.perf_counter_ns()
+
+    def lap(self, phase):
+        now = time.perf_counter_ns()
+        self.phase_ns[phase] = self.phase_ns.get(phase, 0) + now - self._last
+        self._last = now
+
+
+class NullTimer:
+    """Kikapcsolt profilozás: a mérési pontok nem csinálnak semmit."""
+    def start(self):
+        pass
+
+    def lap(self, phase):
+        pass
+
+
+NULL_TIMER = NullTimer()
+
+
+class RunStats:
+    """
+    Egy futás telemetriája.
+
+    Attribútumok:
+        phase_ns (dict): Fázisonként az összesített idő nanoszekundumban
+                         (csak profilozás esetén, lásd `PHASES`).
+        total_ns (int): A futás teljes ideje nanoszekundumban.
+        evaluations (int): Az elvégzett fitnesz kiértékelések száma.
+        generations (list): Generációnként egy rekord (lásd `generation_record`),
+                            ha a profilozás be van kapcsolva vagy van visszahívás.
+    """
+    def __init__(self):
+        self.phase_ns = {}
+        self.total_ns = 0
+        self.evaluations = 0
+        self.generations = []
+
+    def phase_seconds(self):
+        """A fázisonkénti idők másodpercben."""
+        return {phase: ns / 1e9 for phase, ns in self.phase_ns.items()}
+
+    def phase_fractions(self):
+        """A fázisok részesedése a teljes futási időből."""
+        if not self.total_ns:
+            return {}
+        return {phase: ns / self.total_ns for phase, ns in self.phase_ns.items()}
+
+    def summary(self):
+        """Rövid, soronkénti szöveges összefoglaló a fázisidőkről."""
+        lines = [f"Teljes idő: {self.total_ns / 1e6:.1f} ms, fitnesz kiértékelések: {self.evaluations}"]
+        for phase, ns in sorted(self.phase_ns.items(), key=lambda item: -item[1]):
+            share = ns / self.total_ns if self.total_ns else 0.0
+            lines.append(f"  {phase:<13} {ns / 1e6:10.2f} ms ({share:.1%})")
+        return "\n".join(lines)
+
+
+def generation_record(generation, population, fitness_scores, best_fitness, evaluations, lower, upper):
+    """
+    Egy generáció populációs statisztikái.
+
+    A diverzitás a gének (cx, cy, r) szórásának átlaga, a keresési tartomány
+    szélességére normálva (0 = minden egyed azonos).
+
+    Returns:
+        dict: generation, best (az eddigi legjobb), generation_best, mean, diversity, evaluations.
+    """
+    finite = np.isfinite(fitness_scores)
+    width = np.maximum(np.asarray(upper, dtype=float) - np.asarray(lower, dtype=float), np.finfo(float).tiny)
+    return {
+        "generation": generation,
+        "best": float(best_fitness),
+        "generation_best": float(np.min(fitness_scores)),
+        "mean": float(np.mean(fitness_scores[finite])) if finite.any() else np.inf,
+        "diversity": float(np.mean(np.std(population, axis=0) / width)),
+        "evaluations": int(evaluations)
+    }
+
+
+class ProgressPrinter:
+    """
+    Visszahívás, amely `interval` generációnként kiírja a legjobb fitneszt
+    (a korábbi beépített, 20 generációnkénti kiírás helyett).
+    """
+    def __init__(self, interval=20):
+        self.interval = interval
+
+    def __call__(self, engine, record):
+        generation = record["generation"] + 1
+        if generation % self.interval == 0:
+            print(f"Generáció: {generation}/{engine.generations}, Legjobb fitnesz: {record['best']:.2f}")
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+from genetic_algorithm import CircleGA
+
+
+class CircleTracker:
+    """
+    Legkisebb befoglaló kör illesztése lassan változó ponthalmazok sorozatára
+    (például ugyanannak az alkatrésznek egymást követő mérési képkockáira).
+
+    Az első képkockát a GA hidegen, véletlen populációból oldja meg, a továbbiakat
+    meleg indítással: az előző legjobb kör és az előző végső populáció indítja a
+    keresést, szűkített tartományban (lásd `CircleGA`). Alapértelmezésben a GA
+    `stall_generations` generáció javulás nélkül leáll, így az alig mozduló
+    képkockák néhány generáció alatt konvergálnak.
+
+    Args:
+        reuse_population (bool): Az előző képkocka végső populációját is átadjuk-e.
+        **ga_params: A `CircleGA` konstruktorának paraméterei (a meleg indítás
+                     paramétereit a tracker állítja be).
+    """
+    def __init__(self, reuse_population=True, **ga_params):
+        ga_params.setdefault('stall_generations', 10)
+        ga_params.setdefault('tolerance', 1e-4)
+        self.ga_params = ga_params
+        self.reuse_population = reuse_population
+        self.circle = None
+        self.population = None
+        self.histories = []
+
+    def reset(self):
+        """Elfelejti az előző képkockát: a következő illesztés hidegen indul."""
+        self.circle = None
+        self.population = None
+        self.histories = []
+
+    def update(self, points):
+        """
+        Egy új képkocka illesztése.
+
+        Args:
+            points (np.ndarray): (N, 2) alakú ponthalmaz.
+
+        Returns:
+            np.ndarray: A képkocka legjobb köre (cx, cy, r).
+        """
+        ga = CircleGA(points, initial_circle=self.circle,
+                      initial_population=self.population if self.reuse_population else None,
+                      **self.ga_params)
+        self.circle, history = ga.run()
+        self.population = ga.population
+        self.histories.append(history)
+        return self.circle
+
+    def track(self, frames):
+        """Generátor: minden képkocka után a legjobb kört adja vissza."""
+        for points in frames:
+            yield self.update(points)
+
+
+def track_circles(frames, **params):
+    """
+    Kényelmi függvény: a képkockák sorozatának köreit listában adja vissza.
+
+    Args:
+        frames: (N, 2) alakú ponthalmazok iterálható sorozata.
+        **params: A `CircleTracker` paraméterei.
+
+    Returns:
+        list: Képkockánként a legjobb kör (cx, cy, r).
+    """
+    return list(CircleTracker(**params).track(frames))
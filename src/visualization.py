@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Ábrázoló függvények. A megoldó modulok nem importálják a matplotlibet, így a
+parancssori futások és a munkafolyamatok indulása vizualizáció nélkül gyors;
+ezt a modult csak akkor töltjük be, ha ténylegesen ábra készül.
+"""
+import matplotlib.pyplot as plt
+from matplotlib.patches import Circle
+
+
+def visualize_point_cloud(points, title="Generált ponthalmaz", save_path=None):
+    """
+    Megjeleníti a ponthalmazt egy pontdiagram segítségével.
+
+    Args:
+        points (np.ndarray): A megjelenítendő pontokat tartalmazó tömb.
+        title (str): A diagram címe.
+        save_path (str, optional): Ha meg van adva, a diagramot elmenti a megadott útvonalra.
+    """
+    plt.figure(figsize=(8, 8))
+    plt.scatter(points[:, 0], points[:, 1], alpha=0.7, edgecolors='k')
+    plt.title(title)
+    plt.xlabel("X koordináta")
+    plt.ylabel("Y koordináta")
+    plt.gca().set_aspect('equal', adjustable='box')
+    plt.grid(True)
+
+    if save_path:
+        plt.savefig(save_path)
+        print(f"A diagram elmentve: {save_path}")
+
+    plt.show()
+
+
+def visualize_solution(points, circle_params, title="Megoldás"):
+    """Megjeleníti a ponthalmazt és a megtalált kört."""
+    cx, cy, r = circle_params
+
+    fig, ax = plt.subplots(figsize=(8, 8))
+    # Pontok kirajzolása
+    ax.scatter(points[:, 0], points[:, 1], alpha=0.7, edgecolors='k', label="Adatpontok")
+
+    # A megtalált kör kirajzolása
+    solution_circle = Circle((cx, cy), r, color='r', fill=False, linewidth=2, label="Illesztett kör")
+    ax.add_patch(solution_circle)
+
+    ax.set_title(title)
+    ax.set_xlabel("X koordináta")
+    ax.set_ylabel("Y koordináta")
+    ax.set_aspect('equal', adjustable='box')
+    ax.grid(True)
+    ax.legend()
+    plt.show()
+
+
+def plot_fitness_history(history):
+    """Megjeleníti a generációnkénti legjobb fitnesz alakulását."""
+    plt.figure(figsize=(10, 5))
+    plt.plot(history)
+    plt.title("Fitnesz érték alakulása a generációk során")
+    plt.xlabel("Generáció")
+    plt.ylabel("Legjobb fitnesz (minél kisebb, annál jobb)")
+    plt.grid(True)
+    plt.show()